@@ -5,18 +5,35 @@ author: yidinghan
 author_url: https://github.com/yidinghan
 version: 1.0.0
 license: MIT
-requirements: requests, pydantic
+requirements: requests, pydantic, orjson
 """
 
 import os
 import json
+import asyncio
 import time
+import random
 import logging
+import functools
+import threading
 from typing import List, Dict, Any, Optional, Union, Generator, Iterator
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from pydantic import BaseModel, Field
 
+# orjson 为可选依赖：解析速度更快且直接接受 bytes，未安装时回退到标准库 json
+try:
+    import orjson
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+except ImportError:
+    _json_loads = json.loads
+
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj, ensure_ascii=False).encode("utf-8")
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
@@ -48,12 +65,24 @@ class Pipeline:
         )
         REQUEST_TIMEOUT: int = Field(
             default=300,
-            description="请求超时（秒），视频生成建议设置更长"
+            description="读取超时（秒），视频生成建议设置更长；最坏耗时约为该值乘以 MAX_RETRIES"
+        )
+        CONNECT_TIMEOUT: int = Field(
+            default=5,
+            description="连接超时（秒），服务不可达时快速失败"
         )
         MAX_RETRIES: int = Field(
             default=3,
             description="最大重试次数"
         )
+        MODELS_CACHE_TTL: int = Field(
+            default=3600,
+            description="模型列表缓存时间（秒），0 表示不缓存"
+        )
+        STREAM_BATCH_SIZE: int = Field(
+            default=4,
+            description="流式输出时同一次网络读取内最多合并多少个 token 片段后再输出，1 表示不合并"
+        )
         DEBUG_MODE: bool = Field(
             default=False,
             description="调试模式"
@@ -67,12 +96,43 @@ class Pipeline:
         )
 
     # OpenAI 标准参数（不放入 extra_body）
-    STANDARD_PARAMS = {
+    STANDARD_PARAMS = frozenset({
         "model", "messages", "stream", "temperature", "max_tokens",
         "top_p", "frequency_penalty", "presence_penalty", "stop",
         "n", "logprobs", "echo", "best_of", "logit_bias", "user"
+    })
+    # 不参与非标准参数透传的字段
+    RESERVED_PARAMS = STANDARD_PARAMS | {"extra_body"}
+    # 需要透传的标准可选参数
+    OPTIONAL_PARAMS = (
+        "temperature", "max_tokens", "top_p",
+        "frequency_penalty", "presence_penalty", "stop"
+    )
+    
+    # 多媒体模型（建议禁用流式）
+    MEDIA_MODELS = frozenset({"Sora-2", "Runway-Gen-4-Turbo", "DALL-E-3", "Imagen"})
+    
+    # HTTP 状态码对应的错误提示
+    STATUS_MESSAGES = {
+        400: "请求参数错误",
+        401: "API Key 无效",
+        403: "无权访问此模型",
+        404: "模型不存在",
+        429: "请求频率超限",
+        500: "服务器错误",
     }
     
+    # 需要重试的 HTTP 状态码
+    RETRY_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+    # 退避参数（秒）：decorrelated jitter 的下限与上限
+    RETRY_BACKOFF_BASE = 0.5
+    RETRY_BACKOFF_CAP = 30.0
+    # 429 未携带 Retry-After 时的默认冷却时间（秒）
+    RATE_LIMIT_COOLDOWN = 2.0
+    
+    # 流式响应每次读取的字节数，较大的块可减少 recv 与解压调用次数
+    SSE_CHUNK_SIZE = 16384
+
     # 备用模型列表（API 不可用时使用）
     FALLBACK_MODELS = [
         # OpenAI
@@ -94,6 +154,14 @@ class Pipeline:
         {"id": "Minimax-M2.1", "name": "Minimax-M2.1"},
     ]
 
+    # 模型列表缓存: (base_url, api_key) -> (获取时间, 模型列表)
+    # 进程内共享，避免配置更新或重启 Pipeline 时重复请求 /models
+    _models_cache: Dict[tuple, tuple] = {}
+    
+    # 限流冷却截止时间: (url, Authorization) -> monotonic 时间戳
+    # 冷却期内的请求注定返回 429，先等待冷却结束再发送
+    _cooldown_until: Dict[tuple, float] = {}
+
     def __init__(self):
         self.type = "manifold"
         self.id = "poeapipp"
@@ -102,17 +170,70 @@ class Pipeline:
             **{"POE_API_KEY": os.getenv("POE_API_KEY", "")}
         )
         self.pipelines = self.FALLBACK_MODELS  # 初始使用备用列表
+        self._session = self._create_session()
+        # 关闭时置位，让退避等待中的请求线程立即结束
+        self._shutdown_event = threading.Event()
+        # 按模型 ID 缓存解析结果: model_id -> (实际模型ID, 模型参数)
+        self._model_templates: Dict[str, tuple] = {}
+        self._update_endpoints()
+
+    def _update_endpoints(self):
+        """根据当前配置预先计算请求 URL，配置更新时重新计算"""
+        self._chat_url = f"{self.valves.POE_API_BASE_URL}/chat/completions"
+
+    @staticmethod
+    @functools.lru_cache(maxsize=64)
+    def _headers_for(api_key: str) -> Dict[str, str]:
+        """
+        按 API Key 缓存请求头（Content-Type 已作为 Session 默认头设置）
+
+        返回的字典被多次请求共享，调用方不得修改。
+        """
+        return {"Authorization": f"Bearer {api_key}"}
+
+    def _create_session(self) -> requests.Session:
+        """创建复用连接池的 HTTP Session，避免每次请求重新建立 TCP/TLS 连接"""
+        session = requests.Session()
+        # 由 urllib3 在连接池内完成底层重试：
+        # - 建连失败时重连一次（请求尚未发出，对 POST 也安全）
+        # - GET（/models）遇到 429/5xx 时按 Retry-After 或指数退避重试
+        # 对话请求的状态码重试仍由 _make_request 处理，以便维护限流冷却和可中断等待
+        retry = Retry(
+            total=2,
+            connect=1,
+            read=0,
+            backoff_factor=0.5,
+            status_forcelist=self.RETRY_STATUS_CODES,
+            allowed_methods=frozenset({"GET"}),
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=20, max_retries=retry)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        # Authorization 按请求传入，使连接池可在不同用户间共享
+        session.headers.update({
+            "Content-Type": "application/json",
+            "User-Agent": "poe-api-pipeline/1.0.0",
+            "Accept-Encoding": "gzip, deflate",
+        })
+        return session
 
     async def on_startup(self):
         """启动时获取模型列表"""
+        self._shutdown_event.clear()
         await self._refresh_models()
         logger.info(f"[{self.name}] Pipeline started with {len(self.pipelines)} models")
 
     async def on_shutdown(self):
+        self._shutdown_event.set()
+        self._session.close()
         logger.info(f"[{self.name}] Pipeline shutdown")
 
     async def on_valves_updated(self):
         """配置更新时刷新模型列表"""
+        self._update_endpoints()
+        self._model_templates.clear()
         await self._refresh_models()
         logger.info(f"[{self.name}] Valves updated, models refreshed")
 
@@ -123,25 +244,33 @@ class Pipeline:
             self.pipelines = self.FALLBACK_MODELS
             return
         
+        cache_key = (self.valves.POE_API_BASE_URL, self.valves.POE_API_KEY)
+        cached_at, cached_models = self._models_cache.get(cache_key, (0.0, None))
+        if cached_models and time.monotonic() - cached_at < self.valves.MODELS_CACHE_TTL:
+            self.pipelines = cached_models
+            logger.info(f"[{self.name}] Using {len(cached_models)} cached models")
+            return
+        
         try:
-            response = requests.get(
+            # 同步 HTTP 请求放到线程中执行，避免阻塞 Pipelines 服务的事件循环
+            response = await asyncio.to_thread(
+                self._session.get,
                 f"{self.valves.POE_API_BASE_URL}/models",
                 headers={"Authorization": f"Bearer {self.valves.POE_API_KEY}"},
-                timeout=30
+                timeout=(self.valves.CONNECT_TIMEOUT, 25)
             )
             
             if response.status_code == 200:
-                data = response.json()
-                models = []
-                for model in data.get("data", []):
-                    model_id = model.get("id", "")
-                    if model_id:
-                        models.append({
-                            "id": model_id,
-                            "name": model.get("name", model_id)
-                        })
+                # 直接解析原始 bytes，只保留 id/name 两个字段
+                data = _json_loads(response.content)
+                models = [
+                    {"id": model_id, "name": model.get("name", model_id)}
+                    for model in data.get("data", [])
+                    if (model_id := model.get("id", ""))
+                ]
                 
                 if models:
+                    self._models_cache[cache_key] = (time.monotonic(), models)
                     self.pipelines = models
                     logger.info(f"[{self.name}] Fetched {len(models)} models from API")
                     return
@@ -152,6 +281,10 @@ class Pipeline:
         
         self.pipelines = self.FALLBACK_MODELS
 
+    def _debug_enabled(self) -> bool:
+        """调试模式开启且 logger 实际会输出 DEBUG 日志时才返回 True"""
+        return self.valves.DEBUG_MODE and logger.isEnabledFor(logging.DEBUG)
+
     def _get_api_key(self) -> str:
         """获取 API Key"""
         return self.valves.POE_API_KEY
@@ -179,36 +312,46 @@ class Pipeline:
         
         # 处理 GPT-5.2 系列: GPT-5.2-{effort}
         # Poe API 文档: reasoning_effort 通过 extra_body 传递
-        if model_id.upper().startswith("GPT-5.2-"):
-            parts = model_id.rsplit("-", 1)
-            if len(parts) == 2:
-                suffix = parts[1].lower()
-                if suffix in self.GPT52_REASONING_EFFORTS:
-                    actual_model = "GPT-5.2"
-                    extra_params["reasoning_effort"] = suffix
-                    if self.valves.DEBUG_MODE:
-                        logger.debug(f"[{self.name}] Parsed GPT-5.2 reasoning_effort: {suffix}")
+        # 前缀匹配保证 ID 中至少含一个 "-"，rpartition 直接取最后一段后缀
+        model_upper = model_id.upper()
+        if model_upper.startswith("GPT-5.2-"):
+            suffix = model_id.rpartition("-")[2].lower()
+            if suffix in self.GPT52_REASONING_EFFORTS:
+                actual_model = "GPT-5.2"
+                extra_params["reasoning_effort"] = suffix
+                if self._debug_enabled():
+                    logger.debug("[%s] Parsed GPT-5.2 reasoning_effort: %s", self.name, suffix)
         
         # 处理 Gemini-3-Pro 系列: Gemini-3-Pro-{level} 或 Gemini-3-Pro-{budget}
-        elif model_id.upper().startswith("GEMINI-3-PRO-"):
-            parts = model_id.rsplit("-", 1)
-            if len(parts) == 2:
-                suffix = parts[1].lower()
-                # 检查是否是 thinking_level 枚举值
-                if suffix in self.GEMINI3_THINKING_LEVELS:
-                    actual_model = "Gemini-3-Pro"
-                    extra_params["thinking_level"] = suffix
-                    if self.valves.DEBUG_MODE:
-                        logger.debug(f"[{self.name}] Parsed Gemini-3-Pro thinking_level: {suffix}")
-                # 检查是否是数字 (thinking_budget)
-                elif suffix.isdigit():
-                    actual_model = "Gemini-3-Pro"
-                    extra_params["thinking_budget"] = int(suffix)
-                    if self.valves.DEBUG_MODE:
-                        logger.debug(f"[{self.name}] Parsed Gemini-3-Pro thinking_budget: {suffix}")
+        elif model_upper.startswith("GEMINI-3-PRO-"):
+            suffix = model_id.rpartition("-")[2].lower()
+            # 检查是否是 thinking_level 枚举值
+            if suffix in self.GEMINI3_THINKING_LEVELS:
+                actual_model = "Gemini-3-Pro"
+                extra_params["thinking_level"] = suffix
+                if self._debug_enabled():
+                    logger.debug("[%s] Parsed Gemini-3-Pro thinking_level: %s", self.name, suffix)
+            # 检查是否是数字 (thinking_budget)
+            elif suffix.isdigit():
+                actual_model = "Gemini-3-Pro"
+                extra_params["thinking_budget"] = int(suffix)
+                if self._debug_enabled():
+                    logger.debug("[%s] Parsed Gemini-3-Pro thinking_budget: %s", self.name, suffix)
         
         return actual_model, extra_params
 
+    def _get_model_template(self, model_id: str) -> tuple[str, dict]:
+        """
+        获取模型 ID 的解析结果，同一模型只解析一次
+
+        返回的参数字典会被后续请求复用，调用方只能读取或展开，不得修改。
+        """
+        template = self._model_templates.get(model_id)
+        if template is None:
+            template = self._parse_model_params(model_id)
+            self._model_templates[model_id] = template
+        return template
+
     def _build_request_body(self, model_id: str, messages: List[dict], body: dict) -> dict:
         """
         构建请求体，核心功能：识别并透传 extra_body 参数
@@ -218,42 +361,43 @@ class Pipeline:
         2. 提取标准 OpenAI 参数
         3. 其余参数作为 extra_body 透传到 Poe
         """
+        debug = self._debug_enabled()
+        
         # 解析模型 ID 中的嵌入参数
-        actual_model, model_params = self._parse_model_params(model_id)
+        actual_model, model_params = self._get_model_template(model_id)
         
-        # 基础请求体
-        request_body = {
-            "model": actual_model,
-            "messages": messages,
-            "stream": body.get("stream", True)
+        # 标准可选参数
+        optional_params = {
+            k: body[k] for k in self.OPTIONAL_PARAMS if body.get(k) is not None
         }
         
-        # 应用从模型 ID 解析出的参数
-        for key, value in model_params.items():
-            request_body[key] = value
-        
-        # 添加标准可选参数
-        for param in ["temperature", "max_tokens", "top_p", 
-                      "frequency_penalty", "presence_penalty", "stop"]:
-            if param in body and body[param] is not None:
-                request_body[param] = body[param]
-        
         # ========== 核心：处理 extra_body ==========
         # 方式1：显式的 extra_body 字段
-        if "extra_body" in body and isinstance(body["extra_body"], dict):
-            for key, value in body["extra_body"].items():
-                request_body[key] = value
-            if self.valves.DEBUG_MODE:
-                logger.debug(f"[{self.name}] extra_body params: {body['extra_body']}")
+        extra_body = body.get("extra_body")
+        if not isinstance(extra_body, dict):
+            extra_body = {}
+        elif debug:
+            logger.debug("[%s] extra_body params: %s", self.name, extra_body)
+        
+        # 合并顺序决定优先级：模型 ID 参数 < 标准可选参数 < extra_body
+        request_body = {
+            "model": actual_model,
+            "messages": messages,
+            "stream": body.get("stream", True),
+            **model_params,
+            **optional_params,
+            **extra_body,
+        }
         
         # 方式2：body 中的非标准参数直接透传
         # 这允许 Open WebUI 或其他客户端直接在 body 中传递自定义参数
-        for key, value in body.items():
-            if key not in self.STANDARD_PARAMS and key != "extra_body":
-                if key not in request_body:  # 避免覆盖已设置的参数
-                    request_body[key] = value
-                    if self.valves.DEBUG_MODE:
-                        logger.debug(f"[{self.name}] Passthrough param: {key}={value}")
+        # 大多数请求只含标准参数，用集合差集一次算出非标准参数，为空时直接跳过
+        extra_keys = body.keys() - self.RESERVED_PARAMS
+        for key in extra_keys:
+            if key not in request_body:  # 避免覆盖已设置的参数
+                request_body[key] = body[key]
+                if debug:
+                    logger.debug("[%s] Passthrough param: %s=%r", self.name, key, body[key])
         
         return request_body
 
@@ -261,60 +405,155 @@ class Pipeline:
         self,
         url: str,
         headers: dict,
-        body: dict,
+        payload: bytes,
         stream: bool = False
     ) -> requests.Response:
-        """带重试的请求"""
+        """
+        带重试的请求
+
+        对 429 和 5xx 响应及网络异常重试；优先遵循服务端的 Retry-After，
+        否则使用 decorrelated jitter 退避，避免多个客户端同步重试。
+        payload 为预先序列化好的 JSON 请求体，重试时无需重复序列化。
+        """
         last_error = None
+        backoff = self.RETRY_BACKOFF_BASE
+        cooldown_key = (url, headers.get("Authorization", ""))
         
         for attempt in range(self.valves.MAX_RETRIES):
+            retry_after = None
+            
+            # 同一 Key 仍处于限流冷却期时，先等待而不是发出必然失败的请求
+            wait = self._cooldown_until.get(cooldown_key, 0.0) - time.monotonic()
+            if wait > 0:
+                logger.info(f"[{self.name}] Rate limited, waiting {wait:.1f}s before request")
+                if self._shutdown_event.wait(min(wait, self.valves.REQUEST_TIMEOUT)):
+                    raise Exception("Request cancelled: pipeline is shutting down")
+            
             try:
-                response = requests.post(
+                response = self._session.post(
                     url,
                     headers=headers,
-                    json=body,
+                    data=payload,
                     stream=stream,
-                    timeout=self.valves.REQUEST_TIMEOUT
+                    timeout=(self.valves.CONNECT_TIMEOUT, self.valves.REQUEST_TIMEOUT)
                 )
                 
-                if response.status_code < 500:
+                if response.status_code < 400:
+                    self._cooldown_until.pop(cooldown_key, None)
+                
+                if response.status_code not in self.RETRY_STATUS_CODES:
                     return response
                     
                 last_error = f"HTTP {response.status_code}"
                 logger.warning(f"[{self.name}] Retry {attempt+1}/{self.valves.MAX_RETRIES}: {last_error}")
+                retry_after = self._get_retry_after(response)
+                if response.status_code == 429:
+                    cooldown = self.RATE_LIMIT_COOLDOWN if retry_after is None else retry_after
+                    self._cooldown_until[cooldown_key] = time.monotonic() + cooldown
+                
+                if attempt == self.valves.MAX_RETRIES - 1:
+                    # 最后一次仍失败时返回原响应，由调用方格式化错误信息
+                    return response
+                response.close()
                 
             except requests.exceptions.RequestException as e:
                 last_error = str(e)
                 logger.warning(f"[{self.name}] Retry {attempt+1}/{self.valves.MAX_RETRIES}: {last_error}")
             
             if attempt < self.valves.MAX_RETRIES - 1:
-                time.sleep(2 ** attempt)  # 指数退避
+                if retry_after is not None:
+                    delay = min(retry_after, self.RETRY_BACKOFF_CAP)
+                else:
+                    backoff = min(
+                        self.RETRY_BACKOFF_CAP,
+                        random.uniform(self.RETRY_BACKOFF_BASE, backoff * 3)
+                    )
+                    delay = backoff
+                # pipe 运行在 Pipelines 服务的工作线程中，使用可中断的等待代替
+                # time.sleep，Pipeline 关闭时立即放弃重试并释放线程
+                if self._shutdown_event.wait(delay):
+                    raise Exception(f"Request cancelled: pipeline is shutting down ({last_error})")
         
         raise Exception(f"Request failed after {self.valves.MAX_RETRIES} retries: {last_error}")
 
+    @staticmethod
+    def _get_retry_after(response: requests.Response) -> Optional[float]:
+        """解析 Retry-After 响应头（仅支持秒数格式）"""
+        value = response.headers.get("Retry-After")
+        if not value:
+            return None
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            return None
+
+    def _iter_sse_data(self, response: requests.Response) -> Generator[Optional[bytes], None, None]:
+        """
+        按字节解析 SSE 流，逐个产出 data 字段的原始负载
+
+        直接在 bytearray 缓冲区上查找换行，只切出 data 负载，
+        避免 iter_lines 的逐行 bytes 分配与整行解码；跨 chunk 的
+        半行和被截断的多字节 UTF-8 字符会留在缓冲区等待补齐。
+        每处理完一次网络读取后产出 None，表示接下来的读取可能阻塞。
+        """
+        if self._debug_enabled():
+            logger.debug(
+                "[%s] Stream Content-Encoding: %s",
+                self.name, response.headers.get("Content-Encoding", "identity")
+            )
+        
+        buf = bytearray()
+        for chunk in response.iter_content(chunk_size=self.SSE_CHUNK_SIZE):
+            buf.extend(chunk)
+            start = 0
+            while (nl := buf.find(b"\n", start)) != -1:
+                # 先在缓冲区原位判断前缀，空行、": ping" 等心跳注释行不产生任何切片
+                if buf.startswith(b"data:", start, nl):
+                    yield bytes(buf[start + 5:nl]).strip()
+                start = nl + 1
+            del buf[:start]
+            yield None
+
+        # 流结束时处理没有换行结尾的最后一行
+        if buf.startswith(b"data:"):
+            yield bytes(buf[5:].strip())
+
     def _stream_response(self, response: requests.Response) -> Generator[str, None, None]:
-        """处理 SSE 流式响应"""
-        for line in response.iter_lines():
-            if not line:
-                continue
-            
-            line_str = line.decode("utf-8")
-            if not line_str.startswith("data:"):
+        """
+        处理 SSE 流式响应
+
+        只合并同一次网络读取中已到达的片段，减少生成器切换和下游
+        WebSocket 帧数；在下一次可能阻塞的读取之前总会输出已缓存片段，
+        因此不会因上游停顿而延迟显示。
+        """
+        batch_size = max(1, self.valves.STREAM_BATCH_SIZE)
+        parts: List[str] = []
+        
+        for payload in self._iter_sse_data(response):
+            if payload is None:
+                # 当前读取的数据已处理完，阻塞读取前先输出
+                if parts:
+                    yield "".join(parts)
+                    parts.clear()
                 continue
-            
-            data_str = line_str[5:].strip()
-            if data_str == "[DONE]":
+            if payload == b"[DONE]":
                 break
             
             try:
-                data = json.loads(data_str)
+                data = _json_loads(payload)
                 choices = data.get("choices", [])
                 if choices:
                     content = choices[0].get("delta", {}).get("content", "")
                     if content:
-                        yield content
+                        parts.append(content)
+                        if len(parts) >= batch_size:
+                            yield "".join(parts)
+                            parts.clear()
             except json.JSONDecodeError:
                 continue
+        
+        if parts:
+            yield "".join(parts)
 
     def _parse_response(self, response: requests.Response) -> str:
         """解析非流式响应"""
@@ -328,19 +567,11 @@ class Pipeline:
         """格式化错误信息"""
         try:
             error_msg = response.json().get("error", {}).get("message", response.text)
-        except:
+        except (ValueError, AttributeError):
+            # 响应体不是 JSON，或 error 字段不是对象
             error_msg = response.text[:500]
         
-        status_messages = {
-            400: "请求参数错误",
-            401: "API Key 无效",
-            403: "无权访问此模型",
-            404: "模型不存在",
-            429: "请求频率超限",
-            500: "服务器错误",
-        }
-        
-        error_type = status_messages.get(response.status_code, "请求失败")
+        error_type = self.STATUS_MESSAGES.get(response.status_code, "请求失败")
         return f"❌ **{error_type}** (HTTP {response.status_code})\n\n{error_msg}"
 
     def pipe(
@@ -376,27 +607,23 @@ class Pipeline:
         is_streaming = request_body.get("stream", True)
         
         # 多媒体模型建议禁用流式
-        media_models = {"Sora-2", "Runway-Gen-4-Turbo", "DALL-E-3", "Imagen"}
-        if model_id in media_models and is_streaming:
+        if model_id in self.MEDIA_MODELS and is_streaming:
             request_body["stream"] = False
             is_streaming = False
             logger.info(f"[{self.name}] Disabled streaming for media model: {model_id}")
         
-        headers = {
-            "Authorization": f"Bearer {api_key}",
-            "Content-Type": "application/json"
-        }
-        
-        url = f"{self.valves.POE_API_BASE_URL}/chat/completions"
+        headers = self._headers_for(api_key)
+        url = self._chat_url
         
-        if self.valves.DEBUG_MODE:
+        if self._debug_enabled():
             # 脱敏日志
             safe_body = {k: v for k, v in request_body.items() if k != "messages"}
             safe_body["messages"] = f"[{len(messages)} messages]"
-            logger.debug(f"[{self.name}] Request: {json.dumps(safe_body, ensure_ascii=False)}")
+            logger.debug("[%s] Request: %s", self.name, json.dumps(safe_body, ensure_ascii=False))
         
         try:
-            response = self._make_request(url, headers, request_body, is_streaming)
+            payload = _json_dumps(request_body)
+            response = self._make_request(url, headers, payload, is_streaming)
             
             if response.status_code >= 400:
                 return self._format_error(response)
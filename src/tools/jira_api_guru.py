@@ -5,21 +5,241 @@ repository: https://github.com/your-username/open-webui-tools
 author: @your-username
 author_url: https://github.com/your-username
 version: 1.0.0
+requirements: aiohttp, orjson
 changelog:
   - 1.0.0: 初始版本，支持完整的 Jira API 调用、用户 PAT 权限控制和服务器配置
 """
 
-import requests
+import asyncio
+import hashlib
 import json
 import os
-from typing import Dict, List, Any, Optional, Union, Callable, Awaitable
+import re
+import time
+from types import MappingProxyType
+
+from typing import TYPE_CHECKING, Dict, List, Any, Iterable, Iterator, Optional, Sequence, Union, Callable, Awaitable
 from pydantic import BaseModel, Field, field_validator
 
+# aiohttp 在首次发起请求时才导入，避免 Open-WebUI 启动加载工具时的导入开销；
+# pydantic 需保留在模块级别，Valves 会在加载时被读取
+if TYPE_CHECKING:
+    import aiohttp
+
+# orjson 与 ujson 均为可选依赖：优先使用 orjson，其次 ujson，都未安装时回退到标准库 json
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+
+    def _json_dumps(obj: Any) -> str:
+        return orjson.dumps(obj).decode("utf-8")
+
+except ImportError:
+    try:
+        import ujson
+
+        _json_loads = ujson.loads
+
+        def _json_dumps(obj: Any) -> str:
+            return ujson.dumps(obj, ensure_ascii=False, escape_forward_slashes=False)
+
+    except ImportError:
+        _json_loads = json.loads
+
+        def _json_dumps(obj: Any) -> str:
+            return json.dumps(obj, ensure_ascii=False)
+
+
+def _json_error(message: str) -> str:
+    """
+    序列化错误结果 {"error": message}，只编码消息字符串，不构造临时字典
+    """
+    return '{"error":' + _json_dumps(message) + "}"
+
+
+# 工作日志表格表头
+_WORKLOG_HEADERS = ("ID", "作者", "花费时间", "描述", "创建时间")
+_WORKLOG_MANY_HEADERS = ("问题",) + _WORKLOG_HEADERS
+
+# 没有任何可更新字段时的固定错误结果
+_NO_UPDATE_FIELDS_MESSAGE = "未提供任何要更新的字段"
+_NO_UPDATE_FIELDS_JSON = _json_error(_NO_UPDATE_FIELDS_MESSAGE)
+
+# 未传入用户信息时使用的只读空字典
+_EMPTY_USER = MappingProxyType({})
+
+# 生成表格行时嵌套字段缺失或为 null 时的共享空字典，避免每行分配新的 {}；只读取，切勿修改
+_EMPTY_FIELDS: Dict[str, Any] = {}
+
+# 问题键 (如 PROJECT-123) 或数字问题 ID，用于在发送请求前拦截明显错误的输入；须用 fullmatch 校验
+_ISSUE_KEY_RE = re.compile(r"[A-Za-z][A-Za-z0-9_]*-\d+|\d+")
+# 项目键 (如 PROJECT) 或数字项目 ID
+_PROJECT_KEY_RE = re.compile(r"[A-Za-z][A-Za-z0-9_]*|\d+")
+
+# 匹配 /issue/{key} 端点中的问题键或 ID，用于缓存键规范化与失效
+_ISSUE_ENDPOINT_RE = re.compile(r"^/issue/([^/?]+)")
+
+
+def _is_error(result: Any) -> bool:
+    """
+    判断 _make_jira_request 的结果是否为错误
+
+    成功响应可能是列表 (如项目、优先级列表)，直接使用 "error" in result 会逐项比较，
+    因此先检查类型，只有字典才可能是错误结果
+    """
+    return type(result) is dict and "error" in result
+
+
+def _iter_changelog_markdown(histories: List[Dict[str, Any]]) -> Iterator[str]:
+    """
+    逐条生成变更历史记录的 Markdown 片段，由调用方一次性拼接
+
+    :param histories: changelog 中的 histories 列表
+    :return: Markdown 片段迭代器
+    """
+    history_count = len(histories)
+    for i, history in enumerate(histories, 1):
+        author = (history.get("author") or _EMPTY_FIELDS).get("displayName", "未知用户")
+        created = history.get("created", "")
+        yield f"""
+#### 变更 {i}/{history_count}
+**操作人:** {author}
+**时间:** {created}
+**变更内容:**
+"""
+        for item in history.get("items", []):
+            field = item.get("field", "")
+            from_value = item.get("fromString", "")
+            to_value = item.get("toString", "")
+            yield f"- {field}: {from_value} → {to_value}\n"
+
+        yield "\n---\n"
+
+
+# 固定的 Markdown 消息模板，调用时通过 format_map 填充
+_TRANSITION_MSG_TPL = """
+### 🔄 问题状态已更新
+
+问题 [{key}]({url}) 已转换到 **{name}** 状态
+"""
+_TRANSITION_COMMENT_TPL = """
+**添加评论:** {comment}
+"""
+_TRANSITION_RESOLUTION_TPL = """
+**解决结果:** {resolution}
+"""
+_SEARCH_EMPTY_MSG_TPL = """
+### 🔍 搜索结果
+
+未找到符合查询条件的{kind}: `{jql}`
+"""
+_WORKLOG_EMPTY_TPL = """
+### 📋 问题工作日志
+
+问题 [{key}]({url}) 没有工作日志
+"""
+_WORKLOG_ADDED_TPL = """
+### 📋 工作日志已添加
+
+成功添加工作日志到问题 [{key}]({url})
+**工作日志 ID:** {worklog_id}
+**花费时间:** {time_spent}
+**描述:** {description}
+"""
+_WORKLOG_UPDATED_TPL = """
+### 📋 工作日志已更新
+
+工作日志 {worklog_id} 已成功更新
+**问题:** [{key}]({url})
+**新的花费时间:** {time_spent}
+**新的描述:** {description}
+"""
+
+# 输出文本时以换行结尾的 ADF 块级节点
+_ADF_TEXT_BLOCKS = frozenset({"paragraph", "heading", "codeBlock"})
+# 栈中标记块级节点结束的哨兵
+_ADF_BLOCK_END = object()
+
+
+def _adf_paragraph(text: str) -> Dict[str, Any]:
+    """
+    将纯文本包装为只含一个段落的 ADF 文档
+
+    :param text: 文本内容
+    :return: ADF 文档字典
+    """
+    return {
+        "type": "doc",
+        "version": 1,
+        "content": [{"type": "paragraph", "content": [{"type": "text", "text": text}]}],
+    }
+
+
+def _adf_to_text(node: Any) -> str:
+    """
+    将 Jira ADF (Atlassian Document Format) 文档转换为纯文本
+
+    使用显式栈迭代遍历，可处理任意嵌套深度（列表、引用块等），
+    段落、标题、代码块之间以换行分隔
+
+    :param node: ADF 节点（通常为 type 为 doc 的根节点），纯文本直接返回
+    :return: 提取出的纯文本
+    """
+    if isinstance(node, str):
+        return node
+
+    blocks = []
+    current = []
+    stack = [node]
+    while stack:
+        item = stack.pop()
+        if item is _ADF_BLOCK_END:
+            blocks.append("".join(current))
+            current = []
+            continue
+        if not isinstance(item, dict):
+            continue
+
+        node_type = item.get("type")
+        if node_type == "text":
+            current.append(item.get("text", ""))
+        elif node_type == "hardBreak":
+            current.append("\n")
+        else:
+            if node_type in _ADF_TEXT_BLOCKS:
+                stack.append(_ADF_BLOCK_END)
+            children = item.get("content")
+            if isinstance(children, list):
+                stack.extend(reversed(children))
+
+    if current:
+        blocks.append("".join(current))
+    return "\n".join(blocks)
+
 
 class EventEmitter:
+    __slots__ = ("event_emitter",)
+
+    # Status icon by (done, error); error without done is rejected before lookup
+    _STATUS_ICONS = {
+        (False, False): "💬",
+        (True, False): "✅",
+        (True, True): "🚫 ",
+    }
+
     def __init__(self, event_emitter: Callable[[dict], Awaitable[None]]):
         self.event_emitter = event_emitter
 
+    async def _send(self, event: dict) -> None:
+        """
+        Deliver a single event to the underlying emitter.
+
+        Args:
+            event: The event payload to deliver.
+        """
+        await self.event_emitter(event)
+
     async def emit_status(
         self, description: str, done: bool, error: bool = False
     ) -> None:
@@ -34,10 +254,10 @@ class EventEmitter:
         if error and not done:
             raise ValueError("Error status must also be marked as done")
 
-        icon = "✅" if done and not error else "🚫 " if error else "💬"
+        icon = self._STATUS_ICONS[(done, error)]
 
         try:
-            await self.event_emitter(
+            await self._send(
                 {
                     "data": {
                         "description": f"{icon} {description}",
@@ -62,7 +282,7 @@ class EventEmitter:
             raise ValueError("Message content cannot be empty")
 
         try:
-            await self.event_emitter({"data": {"content": content}, "type": "message"})
+            await self._send({"data": {"content": content}, "type": "message"})
 
         except Exception as e:
             raise RuntimeError(f"Failed to emit message event: {str(e)}") from e
@@ -83,7 +303,7 @@ class EventEmitter:
             raise ValueError("Source name, URL, and content are required")
 
         try:
-            await self.event_emitter(
+            await self._send(
                 {
                     "type": "citation",
                     "data": {
@@ -98,7 +318,7 @@ class EventEmitter:
 
     async def emit_table(
         self,
-        headers: List[str],
+        headers: Sequence[str],
         rows: List[List[Any]],
         title: Optional[str] = "Results",
     ) -> None:
@@ -113,33 +333,267 @@ class EventEmitter:
         if not headers:
             raise ValueError("Table must have at least one header")
 
-        if any(len(row) != len(headers) for row in rows):
+        column_count = len(headers)
+        if any(len(row) != column_count for row in rows):
             raise ValueError("All rows must have the same number of columns as headers")
 
-        # Create markdown table
-        table = (
-            f"### {title}\n\n|"
-            + "|".join(headers)
-            + "|\n|"
-            + "|".join(["---"] * len(headers))
-            + "|\n"
-        )
+        # Create markdown table, collecting lines and joining once
+        lines = self._table_header_lines(headers, title)
+        lines.extend(self._table_row_line(row) for row in rows)
+        table = "\n".join(lines) + "\n\n"
+
+        # Reuse the emit_message method
+        await self.emit_message(table)
+
+    async def emit_table_chunked(
+        self,
+        headers: Sequence[str],
+        rows: Iterable[List[Any]],
+        title: Optional[str] = "Results",
+        chunk_size: int = 100,
+    ) -> None:
+        """
+        Emit a markdown table in several message events of up to chunk_size rows.
+
+        Message events are appended to the chat message, so the table grows as
+        chunks arrive and rows can come from a generator. Control is yielded to
+        the event loop after each full chunk so queued chunks can be delivered
+        while the remaining rows are formatted. A table that fits in one chunk
+        is emitted exactly like emit_table would emit it.
+
+        Args:
+            headers: List of column headers for the table.
+            rows: Iterable of rows, where each row is a list of values.
+            title: Optional title for the table, defaults to "Results".
+            chunk_size: Maximum number of rows per emitted chunk.
+        """
+        if not headers:
+            raise ValueError("Table must have at least one header")
 
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be at least 1")
+
+        column_count = len(headers)
+        lines = self._table_header_lines(headers, title)
+        pending_rows = 0
         for row in rows:
-            # Convert all cells to strings and escape pipe characters
-            formatted_row = [str(cell).replace("|", "\\|") for cell in row]
-            table += "|" + "|".join(formatted_row) + "|\n"
+            if len(row) != column_count:
+                raise ValueError("All rows must have the same number of columns as headers")
+            lines.append(self._table_row_line(row))
+            pending_rows += 1
+            if pending_rows >= chunk_size:
+                await self.emit_message("\n".join(lines) + "\n")
+                lines = []
+                pending_rows = 0
+                await asyncio.sleep(0)
+
+        await self.emit_message("\n".join(lines) + "\n\n" if lines else "\n")
+
+    @staticmethod
+    def _table_header_lines(headers: Sequence[str], title: Optional[str]) -> List[str]:
+        """
+        Build the title and header lines of a markdown table.
+        """
+        return [
+            f"### {title}",
+            "",
+            "|" + "|".join(headers) + "|",
+            "|" + "|".join(["---"] * len(headers)) + "|",
+        ]
 
-        table += "\n"
+    @staticmethod
+    def _table_row_line(row: List[Any]) -> str:
+        """
+        Format one markdown table row, converting cells to strings and escaping pipes.
+        """
+        return "|" + "|".join(str(cell).replace("|", "\\|") for cell in row) + "|"
+
+
+class BufferedEventEmitter(EventEmitter):
+    """
+    Event emitter that queues events and delivers them from a background task.
+
+    Tool code no longer waits for each event round trip; a final (done) status
+    flushes the queue so every event is delivered before the tool returns.
+    """
+
+    __slots__ = ("_queue", "_drain_task", "_error")
+
+    def __init__(self, event_emitter: Callable[[dict], Awaitable[None]]):
+        super().__init__(event_emitter)
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._drain_task: Optional[asyncio.Task] = None
+        self._error: Optional[Exception] = None
+
+    async def _send(self, event: dict) -> None:
+        """
+        Queue an event for delivery, starting the drain task if needed.
+
+        Args:
+            event: The event payload to deliver.
+        """
+        if self._drain_task is None or self._drain_task.done():
+            self._drain_task = asyncio.create_task(self._drain())
+        self._queue.put_nowait(event)
+
+    async def _drain(self) -> None:
+        """
+        Deliver queued events in order, remembering the first failure.
+
+        Message events are appended to the chat message, so consecutive
+        message events already waiting in the queue are merged and delivered
+        as one event.
+        """
+        carried: Optional[dict] = None
+        while True:
+            event = carried if carried is not None else await self._queue.get()
+            carried = None
+            consumed = 1
+
+            if event.get("type") == "message":
+                contents = [event["data"]["content"]]
+                while not self._queue.empty():
+                    queued = self._queue.get_nowait()
+                    if queued.get("type") != "message":
+                        carried = queued
+                        break
+                    contents.append(queued["data"]["content"])
+                    consumed += 1
+                if consumed > 1:
+                    event = {"data": {"content": "".join(contents)}, "type": "message"}
+
+            try:
+                if self._error is None:
+                    await self.event_emitter(event)
+            except Exception as e:
+                self._error = e
+            finally:
+                for _ in range(consumed):
+                    self._queue.task_done()
+
+    async def aclose(self) -> None:
+        """
+        Wait until all queued events are delivered and stop the drain task.
+
+        Raises:
+            RuntimeError: If delivering any queued event failed.
+        """
+        await self._queue.join()
+
+        if self._drain_task is not None:
+            self._drain_task.cancel()
+            self._drain_task = None
+
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise RuntimeError(f"Failed to emit event: {str(error)}") from error
+
+    async def emit_status(
+        self, description: str, done: bool, error: bool = False
+    ) -> None:
+        """
+        Emit a status event, flushing the queue once the process is done.
+
+        Args:
+            description: Text description of the status.
+            done: Whether the process is complete.
+            error: Whether an error occurred during the process.
+        """
+        await super().emit_status(description, done, error)
+        if done:
+            await self.aclose()
 
-        # Reuse the emit_message method
-        await self.emit_message(table)
+
+class NullEventEmitter:
+    """
+    No-op stand-in used when the tool is called without an event emitter.
+
+    Tool methods can await its emit methods unconditionally. It is falsy, so
+    blocks that only build display output can still be skipped with
+    ``if event_emitter:``.
+    """
+
+    __slots__ = ()
+
+    def __bool__(self) -> bool:
+        return False
+
+    async def emit_status(
+        self, description: str, done: bool, error: bool = False
+    ) -> None:
+        pass
+
+    async def emit_message(self, content: str) -> None:
+        pass
+
+    async def emit_source(
+        self, name: str, url: str, content: str, html: bool = False
+    ) -> None:
+        pass
+
+    async def emit_table(
+        self,
+        headers: Sequence[str],
+        rows: List[List[Any]],
+        title: Optional[str] = "Results",
+    ) -> None:
+        pass
+
+    async def emit_table_chunked(
+        self,
+        headers: Sequence[str],
+        rows: Iterable[List[Any]],
+        title: Optional[str] = "Results",
+        chunk_size: int = 100,
+    ) -> None:
+        pass
+
+
+# 所有未传入 event emitter 的调用共享同一个空实现
+_NULL_EMITTER = NullEventEmitter()
 
 
 class Tools:
+    # 连接池与超时配置：快速建连失败，读取保留足够时间
+    HTTP_CONNECT_TIMEOUT = 3.05
+    HTTP_READ_TIMEOUT = 30
+    # 支持的请求方法，其中只有 POST/PUT 携带请求体
+    SUPPORTED_METHODS = frozenset({"GET", "POST", "PUT", "DELETE"})
+    BODY_METHODS = frozenset({"POST", "PUT"})
+    # 重试配置：仅对幂等方法的限流/网关错误重试，建连失败对所有方法重试
+    RETRY_TOTAL = 3
+    RETRY_BACKOFF_FACTOR = 0.3
+    RETRY_STATUS_CODES = frozenset({429, 502, 503, 504})
+    RETRY_METHODS = frozenset({"GET", "PUT", "DELETE"})
+    RETRY_AFTER_MAX = 30.0
+    # fetch_all 模式下单次搜索最多合并的结果数
+    FETCH_ALL_MAX_RESULTS = 1000
+    # 大表格分块发送时每块的行数
+    TABLE_CHUNK_ROWS = 100
+    # 批量获取问题时每次 JQL 搜索包含的问题键数，不超过 Jira 单页结果上限
+    BULK_ISSUE_KEYS_PER_SEARCH = 50
+    # 幂等 GET 响应的短期缓存：按端点设置 TTL（秒），未列出的端点不缓存
+    RESPONSE_CACHE_TTLS = (
+        (re.compile(r"^/project$"), 300.0),
+        (re.compile(r"^/project/[^/?]+$"), 120.0),
+        (re.compile(r"^/issue/[^/?]+$"), 10.0),
+        (re.compile(r"^/issue/[^/?]+/transitions$"), 30.0),
+        (re.compile(r"^/issue/[^/?]+/comment$"), 30.0),
+        (re.compile(r"^/issue/[^/?]+/worklog$"), 60.0),
+        # 优先级、状态、解决结果、问题类型等基础数据极少变化
+        (re.compile(r"^/(?:priority|status|resolution|issuetype)$"), 3600.0),
+    )
+    RESPONSE_CACHE_MAX_ENTRIES = 256
+
     def __init__(self):
         self.valves = self.Valves()
         self.user_valves = self.UserValves()
+        self._http_session: Optional["aiohttp.ClientSession"] = None
+        # 规范化后的服务器地址缓存: (原始 base_url, 去除末尾斜杠后的地址, 浏览链接前缀, REST API 地址前缀)
+        self._server_url_cache: tuple = ("", "", "", "")
+        self._http_session_loop: Optional[asyncio.AbstractEventLoop] = None
+        # GET 响应缓存: (服务器地址, 令牌哈希, 端点, 参数) -> (过期时间, 响应对象)
+        self._response_cache: Dict[tuple, tuple] = {}
 
     class UserValves(BaseModel):
         user_pat: str = Field(
@@ -156,6 +610,11 @@ class Tools:
             "",
             description="默认的 Jira 个人访问令牌 (如果用户未提供则使用此令牌)",
         )
+        max_concurrent_requests: int = Field(
+            8,
+            ge=1,
+            description="批量获取时同时发往 Jira 的最大请求数，避免批量扇出时压垮 Jira 服务器",
+        )
 
         @field_validator('base_url')
         def validate_url(cls, v):
@@ -163,14 +622,15 @@ class Tools:
                 raise ValueError("Base URL cannot be empty")
             return v
 
-    def _get_jira_auth_token(self, __user__: dict = {}) -> Optional[str]:
+    def _get_jira_auth_token(self, __user__: Optional[dict] = None) -> Optional[str]:
         """
         从用户值存储获取个人访问令牌
         """
         # 优先使用用户级别的 PAT，如果没有则使用工具级别的 PAT
+        user = __user__ or _EMPTY_USER
         try:
-            if __user__ and "valves" in __user__ and "user_pat" in __user__["valves"]:
-                token = __user__["valves"]["user_pat"]
+            if "valves" in user and "user_pat" in user["valves"]:
+                token = user["valves"]["user_pat"]
                 if token:
                     return token
             return self.valves.pat
@@ -179,71 +639,401 @@ class Tools:
 
     def _get_jira_server(self) -> str:
         """
-        获取 Jira 服务器地址，直接从工具配置中获取
+        获取 Jira 服务器地址（不含末尾斜杠），直接从工具配置中获取
+
+        Open WebUI 可能在每次调用前重建 valves，因此按 base_url 的值缓存规范化结果
+        """
+        base_url = self.valves.base_url
+        if not base_url:
+            raise ValueError("必须在工具配置中设置 Jira 服务器地址")
+        cached_source, server_url, _, _ = self._server_url_cache
+        if base_url != cached_source:
+            server_url = base_url.rstrip('/')
+            self._server_url_cache = (base_url, server_url, f"{server_url}/browse/", f"{server_url}/rest/api/latest")
+        return server_url
+
+    def _browse_prefix(self) -> str:
+        """
+        获取 Jira 网页浏览地址前缀 (以 /browse/ 结尾)，生成表格行时在循环外获取一次
+        """
+        self._get_jira_server()
+        return self._server_url_cache[2]
+
+    def _browse_url(self, key: str) -> str:
+        """
+        获取问题或项目在 Jira 网页中的浏览地址
+
+        :param key: 问题或项目键值
+        :return: 浏览地址
+        """
+        return self._browse_prefix() + key
+
+    @staticmethod
+    def _issue_row(issue: Dict[str, Any], browse_prefix: str) -> List[str]:
+        """
+        生成问题表格行: [链接, 标题, 状态, 优先级]
+
+        :param issue: 问题对象
+        :param browse_prefix: 浏览地址前缀
+        :return: 表格行
+        """
+        key = issue.get("key", "")
+        fields = issue.get("fields") or _EMPTY_FIELDS
+        return [
+            f"[{key}]({browse_prefix}{key})",
+            fields.get("summary", ""),
+            (fields.get("status") or _EMPTY_FIELDS).get("name", ""),
+            (fields.get("priority") or _EMPTY_FIELDS).get("name", ""),
+        ]
+
+    @staticmethod
+    def _project_row(project: Dict[str, Any], browse_prefix: str) -> List[str]:
+        """
+        生成项目表格行: [链接, 名称, 负责人]
+
+        :param project: 项目对象
+        :param browse_prefix: 浏览地址前缀
+        :return: 表格行
+        """
+        key = project.get("key", "")
+        return [f"[{key}]({browse_prefix}{key})", project.get("name", ""), (project.get("lead") or _EMPTY_FIELDS).get("displayName", "")]
+
+    @staticmethod
+    def _worklog_row(worklog: Dict[str, Any]) -> List[str]:
+        """
+        生成工作日志表格行: [ID, 作者, 花费时间, 描述, 创建时间]
+
+        :param worklog: 工作日志对象
+        :return: 表格行
+        """
+        return [
+            worklog.get("id", ""),
+            (worklog.get("author") or _EMPTY_FIELDS).get("displayName", "未知用户"),
+            worklog.get("timeSpent", "0m"),
+            worklog.get("description", "无描述"),
+            worklog.get("created", ""),
+        ]
+
+    async def _get_http_session(self) -> "aiohttp.ClientSession":
+        """
+        获取共享的 aiohttp 会话，首次调用时在当前事件循环中创建
+
+        会话绑定创建时的事件循环，事件循环变化或会话已关闭时重新创建，并先关闭旧会话释放其连接
+        """
+        loop = asyncio.get_running_loop()
+        if (
+            self._http_session is None
+            or self._http_session.closed
+            or self._http_session_loop is not loop
+        ):
+            import aiohttp
+
+            await self._aclose()
+
+            # 固定不变的请求头设置为会话默认值，每次请求只需传入 Authorization
+            self._http_session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=32, limit_per_host=16, keepalive_timeout=60),
+                headers={
+                    "Content-Type": "application/json",
+                    "Accept": "application/json"
+                },
+                timeout=aiohttp.ClientTimeout(
+                    sock_connect=self.HTTP_CONNECT_TIMEOUT, sock_read=self.HTTP_READ_TIMEOUT
+                ),
+            )
+            self._http_session_loop = loop
+        return self._http_session
+
+    async def _aclose(self) -> None:
+        """
+        关闭共享的 aiohttp 会话并释放连接，之后的请求会重新创建会话
+
+        以下划线开头，避免被 Open WebUI 当作工具暴露；宿主或测试在不再使用工具实例时调用
+        """
+        session, self._http_session = self._http_session, None
+        self._http_session_loop = None
+        if session is None or session.closed:
+            return
+        try:
+            await session.close()
+        except Exception:
+            # 旧会话所属的事件循环已关闭时无法正常关闭连接，直接分离连接器并标记为已关闭
+            session.detach()
+
+    def _retry_delay(self, attempt: int, retry_after: Optional[str] = None) -> float:
+        """
+        计算重试等待时间，优先使用服务端返回的 Retry-After（秒）
+
+        :param attempt: 已失败的次数（从 0 开始）
+        :param retry_after: Retry-After 响应头的值
+        :return: 等待秒数
+        """
+        if retry_after:
+            try:
+                return min(max(0.0, float(retry_after)), self.RETRY_AFTER_MAX)
+            except ValueError:
+                pass
+        return self.RETRY_BACKOFF_FACTOR * (2 ** attempt)
+
+    def _response_cache_ttl(self, endpoint: str) -> float:
+        """
+        获取端点对应的缓存 TTL
+
+        :param endpoint: API 端点路径
+        :return: 缓存秒数，0 表示不缓存
+        """
+        for pattern, ttl in self.RESPONSE_CACHE_TTLS:
+            if pattern.match(endpoint):
+                return ttl
+        return 0.0
+
+    @staticmethod
+    def _response_cache_key(server_url: str, token: str, endpoint: str, params: Optional[Dict[str, Any]]) -> tuple:
+        """
+        构建 GET 响应缓存键，Jira 问题键不区分大小写，端点中的问题键统一转为大写；
+        缓存中只保存令牌哈希，不保存令牌本身
+        """
+        endpoint = _ISSUE_ENDPOINT_RE.sub(lambda match: "/issue/" + match.group(1).upper(), endpoint, count=1)
+        token_hash = hashlib.blake2b(token.encode(), digest_size=8).hexdigest()
+        return (server_url, token_hash, endpoint, tuple(sorted((params or {}).items())))
+
+    def _peek_cached_response(self, endpoint: str, __user__: Optional[dict] = None, params: Optional[Dict[str, Any]] = None) -> Optional[Any]:
+        """
+        只读取缓存中未过期的 GET 响应，不发起网络请求
+
+        :param endpoint: API 端点路径
+        :param __user__: 用户信息字典
+        :param params: 请求参数字典
+        :return: 缓存的响应对象，未命中时为 None
+        """
+        token = self._get_jira_auth_token(__user__)
+        cache_key = self._response_cache_key(self._get_jira_server(), token, endpoint, params)
+        cached = self._response_cache.get(cache_key)
+        if cached and cached[0] > time.monotonic():
+            return cached[1]
+        return None
+
+    def _store_cached_response(self, cache_key: tuple, ttl: float, result: Any) -> None:
+        """
+        写入 GET 响应缓存，超出容量时先清理过期条目，仍超出则整体清空
+        """
+        now = time.monotonic()
+        if len(self._response_cache) >= self.RESPONSE_CACHE_MAX_ENTRIES:
+            self._response_cache = {
+                key: entry for key, entry in self._response_cache.items() if entry[0] > now
+            }
+            if len(self._response_cache) >= self.RESPONSE_CACHE_MAX_ENTRIES:
+                self._response_cache.clear()
+        self._response_cache[cache_key] = (now + ttl, result)
+
+    def _invalidate_issue_cache(self, *issue_keys: str) -> None:
+        """
+        问题变更成功后，清除这些问题 /issue/{key} 及其子路径的缓存
+
+        问题键不区分大小写；缓存的问题详情中的 key 与数字 id 互为别名，一并清除，
+        因此通过数字 id 修改也会清除按问题键缓存的条目，反之亦然
+
+        :param issue_keys: 问题键或数字问题 ID
+        """
+        aliases = {issue_key.upper() for issue_key in issue_keys}
+        for cache_key, (_, result) in self._response_cache.items():
+            match = _ISSUE_ENDPOINT_RE.match(cache_key[2])
+            if match and type(result) is dict:
+                names = {str(result.get("key", "")).upper(), str(result.get("id", ""))} - {""}
+                if match.group(1) in aliases or names & aliases:
+                    aliases |= names
+
+        for cache_key in list(self._response_cache):
+            match = _ISSUE_ENDPOINT_RE.match(cache_key[2])
+            if match and match.group(1) in aliases:
+                del self._response_cache[cache_key]
+
+    def _invalidate_worklog_cache(self) -> None:
+        """
+        按 ID 更新工作日志后无法得知所属问题键，清除所有问题的工作日志缓存
+        """
+        for cache_key in list(self._response_cache):
+            if cache_key[2].endswith("/worklog"):
+                del self._response_cache[cache_key]
+
+    async def _invalid_keys_result(self, event_emitter: "EventEmitter", keys: Iterable[str], pattern: "re.Pattern" = _ISSUE_KEY_RE, kind: str = "问题键值") -> Optional[str]:
+        """
+        在拼接请求路径或 JQL 之前校验键值格式，存在无效键值时发送失败状态并返回列出这些键值的错误结果
+
+        :param event_emitter: 事件发送器
+        :param keys: 待校验的键值
+        :param pattern: 键值格式，默认为问题键格式
+        :param kind: 错误信息中的键值类型名称
+        :return: 错误结果 JSON 字符串，全部有效时为 None
+        """
+        rejected = [key for key in keys if not pattern.fullmatch(key)]
+        if not rejected:
+            return None
+        error_message = f"无效的{kind}: {', '.join(rejected)}"
+        await event_emitter.emit_status(error_message, True, True)
+        return _json_error(error_message)
+
+    async def _error_result(self, event_emitter: "EventEmitter", status_prefix: str, error_prefix: str, error: Exception) -> str:
+        """
+        工具方法异常时的统一处理：发送失败状态并返回错误结果
+
+        :param event_emitter: 事件发送器
+        :param status_prefix: 失败状态描述前缀
+        :param error_prefix: 返回结果中错误信息的前缀
+        :param error: 捕获到的异常
+        :return: 错误结果 JSON 字符串
+        """
+        error_message = str(error)
+        await event_emitter.emit_status(f"{status_prefix}: {error_message}", True, True)
+        return _json_error(f"{error_prefix}: {error_message}")
+
+    async def _gather_requests(self, specs: List[tuple], __user__: Optional[dict] = None) -> List[Any]:
+        """
+        并发发送多个 Jira 请求，并发数受 max_concurrent_requests 配置限制
+
+        :param specs: 请求描述列表，每项为 (method, endpoint, params, data)
+        :param __user__: 用户信息字典
+        :return: 与 specs 顺序一致的响应对象列表，请求抛出的异常会作为结果返回
+        """
+        semaphore = asyncio.Semaphore(self.valves.max_concurrent_requests)
+
+        async def run(method: str, endpoint: str, params: Optional[Dict[str, Any]], data: Optional[Dict[str, Any]]):
+            async with semaphore:
+                return await self._make_jira_request(method, endpoint, __user__, data=data, params=params)
+
+        return await asyncio.gather(
+            *(run(method, endpoint, params, data) for method, endpoint, params, data in specs),
+            return_exceptions=True
+        )
+
+    async def _fetch_remaining_pages(self, endpoint: str, data: Dict[str, Any], first_page: Dict[str, Any], items_key: str, __user__: Optional[dict] = None, method: str = "POST") -> Dict[str, Any]:
         """
-        if self.valves.base_url:
-            return self.valves.base_url
-        raise ValueError("必须在工具配置中设置 Jira 服务器地址")
+        根据首页返回的 total 并发获取其余分页，并与首页结果合并
 
-    def _make_jira_request(self, method: str, endpoint: str, __user__: dict = {}, data: Dict[str, Any] = None, params: Dict[str, Any] = None) -> str:
+        :param endpoint: 分页端点路径
+        :param data: 首页使用的分页参数 (POST 时为请求体，GET 时为查询参数)
+        :param first_page: 首页响应对象，可能来自缓存，不会被修改
+        :param items_key: 响应中结果列表的键名
+        :param __user__: 用户信息字典
+        :param method: 请求方法，POST 或 GET
+        :return: 合并后的响应对象，任一分页失败时为包含 error 键的字典
+        """
+        items = first_page.get(items_key, [])
+        page_size = first_page.get("maxResults") or len(items)
+        start_at = data.get("startAt", 0)
+        total = min(first_page.get("total", 0), start_at + self.FETCH_ALL_MAX_RESULTS)
+        if not page_size or len(items) < page_size:
+            return first_page
+
+        pages = (
+            {**data, "startAt": start, "maxResults": page_size}
+            for start in range(start_at + page_size, total, page_size)
+        )
+        if method == "GET":
+            specs = [(method, endpoint, page, None) for page in pages]
+        else:
+            specs = [(method, endpoint, None, page) for page in pages]
+        merged = list(items)
+        for page in await self._gather_requests(specs, __user__):
+            if isinstance(page, Exception):
+                raise page
+            if _is_error(page):
+                return page
+            merged.extend(page.get(items_key, []))
+
+        merged_page = dict(first_page)
+        merged_page[items_key] = merged
+        merged_page["maxResults"] = len(merged)
+        return merged_page
+
+    async def _make_jira_request(self, method: str, endpoint: str, __user__: Optional[dict] = None, data: Optional[Dict[str, Any]] = None, params: Optional[Dict[str, Any]] = None, parse: bool = True) -> Union[Dict[str, Any], List[Any], str]:
         """
-        向 Jira API 发送请求
+        向 Jira API 发送请求，返回解析后的响应对象
+
+        工具方法直接使用返回的对象生成展示信息，只在返回结果时序列化一次
 
         :param method: HTTP 方法 (GET, POST, PUT, DELETE)
         :param endpoint: API 端点路径
         :param __user__: 用户信息字典
         :param data: 请求体数据字典
         :param params: 请求参数字典
-        :return: API 响应结果 JSON 字符串
+        :param parse: 是否解析成功的响应体；为 False 时直接返回响应体 JSON 字符串，供无需展示结果的调用方原样返回
+        :return: API 响应结果对象，失败时为包含 error 键的字典
         """
+        method_upper = method.upper()
+        if method_upper not in self.SUPPORTED_METHODS:
+            raise ValueError(f"不支持的请求方法: {method}")
+        body = data if method_upper in self.BODY_METHODS else None
+
         token = self._get_jira_auth_token(__user__)
         if not token:
             raise ValueError("未找到 Jira 个人访问令牌。请在用户设置中添加您的令牌。")
 
+        import aiohttp
+
         # 获取 Jira 服务器地址
         server_url = self._get_jira_server()
 
-        # 构建完整 URL
-        url = f"{server_url.rstrip('/')}/rest/api/latest{endpoint}"
+        # 构建完整 URL，API 地址前缀随服务器地址一起缓存
+        url = self._server_url_cache[3] + endpoint
 
-        headers = {
-            "Authorization": f"Bearer {token}",
-            "Content-Type": "application/json",
-            "Accept": "application/json"
-        }
+        headers = {"Authorization": f"Bearer {token}"}
 
-        try:
-            if method.lower() == "get":
-                response = requests.get(url, headers=headers, params=params)
-            elif method.lower() == "post":
-                response = requests.post(url, headers=headers, json=data, params=params)
-            elif method.lower() == "put":
-                response = requests.put(url, headers=headers, json=data, params=params)
-            elif method.lower() == "delete":
-                response = requests.delete(url, headers=headers, params=params)
-            else:
-                raise ValueError(f"不支持的请求方法: {method}")
-
-            if response.status_code >= 400:
-                error_message = response.text
-                return json.dumps({"error": f"请求失败，状态码: {response.status_code}, 错误信息: {error_message}, 请求 URL: {url}"}, ensure_ascii=False)
+        # 幂等 GET 命中缓存时直接返回，省去一次网络往返
+        cache_ttl = self._response_cache_ttl(endpoint) if method_upper == "GET" else 0.0
+        if cache_ttl:
+            cache_key = self._response_cache_key(server_url, token, endpoint, params)
+            cached = self._response_cache.get(cache_key)
+            if cached and cached[0] > time.monotonic():
+                return cached[1]
 
-            # 检查响应是否包含内容
-            if response.text.strip():
-                return json.dumps(response.json(), ensure_ascii=False)
-            return json.dumps({"status": "success", "status_code": response.status_code}, ensure_ascii=False)
+        session = await self._get_http_session()
 
-        except requests.exceptions.RequestException as e:
-            error_message = str(e)
-            try:
-                if hasattr(e, 'response') and e.response and e.response.text:
-                    error_message = f"{error_message}: {e.response.text}"
-            except:
-                pass
-            error_response = {"error": f"Jira API 请求失败: {error_message}"}
-            return json.dumps(error_response, ensure_ascii=False)
+        try:
+            for attempt in range(self.RETRY_TOTAL + 1):
+                request = session.request(method_upper, url, headers=headers, json=body, params=params)
 
-    async def jira_get_issue(self, issue_key: str, expand: str = None, __user__: dict = {}, __event_emitter__: Callable[[dict], Awaitable[None]] = None) -> str:
+                try:
+                    async with request as response:
+                        status_code = response.status
+                        # 读取原始字节直接交给 JSON 解析，省去先解码为字符串的一步；204 No Content 无响应体，无需读取
+                        response_body = b"" if status_code == 204 else await response.read()
+                        retry_after = response.headers.get("Retry-After")
+                except aiohttp.ClientConnectorError:
+                    # 建连失败时请求尚未发出，对任何方法重试都是安全的
+                    if attempt >= self.RETRY_TOTAL:
+                        raise
+                    await asyncio.sleep(self._retry_delay(attempt))
+                    continue
+
+                if (
+                    status_code in self.RETRY_STATUS_CODES
+                    and method_upper in self.RETRY_METHODS
+                    and attempt < self.RETRY_TOTAL
+                ):
+                    await asyncio.sleep(self._retry_delay(attempt, retry_after))
+                    continue
+                break
+
+            if not 200 <= status_code < 300:
+                response_text = response_body.decode("utf-8", errors="replace")
+                return {"error": f"请求失败，状态码: {status_code}, 错误信息: {response_text}, 请求 URL: {url}"}
+
+            # 204 或空响应体直接视为成功，不做 JSON 解析
+            if response_body and not response_body.isspace():
+                if not parse:
+                    return response_body.decode("utf-8")
+                result = _json_loads(response_body)
+                if cache_ttl:
+                    self._store_cached_response(cache_key, cache_ttl, result)
+                return result
+            return {"status": "success", "status_code": status_code}
+
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            error_message = str(e) or type(e).__name__
+            return {"error": f"Jira API 请求失败: {error_message}"}
+
+    async def jira_get_issue(self, issue_key: str, expand: str = None, __user__: Optional[dict] = None, __event_emitter__: Callable[[dict], Awaitable[None]] = None) -> str:
         """
         获取 Jira 问题详情
 
@@ -251,51 +1041,150 @@ class Tools:
         :param expand: 要展开的字段，例如 "renderedFields,names,schema,transitions,operations,editmeta,changelog"
         :return: 包含问题详细信息的 JSON 字符串
         """
-        event_emitter = None
-        if __event_emitter__:
-            event_emitter = EventEmitter(__event_emitter__)
-            await event_emitter.emit_status(f"获取 Jira 问题 {issue_key} 的详细信息", False)
+        event_emitter = BufferedEventEmitter(__event_emitter__) if __event_emitter__ else _NULL_EMITTER
+        await event_emitter.emit_status(f"获取 Jira 问题 {issue_key} 的详细信息", False)
 
         try:
+            invalid_result = await self._invalid_keys_result(event_emitter, (issue_key,))
+            if invalid_result:
+                return invalid_result
+
             params = {}
             if expand:
                 params["expand"] = expand
 
-            result = self._make_jira_request("GET", f"/issue/{issue_key}", __user__, params=params)
+            result_obj = await self._make_jira_request("GET", f"/issue/{issue_key}", __user__, params=params)
 
             if event_emitter:
-                result_obj = json.loads(result)
-                if "error" in result_obj:
+                if _is_error(result_obj):
                     await event_emitter.emit_status(f"获取问题详情失败: {result_obj['error']}", True, True)
                 else:
                     # 提取关键信息
-                    summary = result_obj.get("fields", {}).get("summary", "无标题")
-                    status = result_obj.get("fields", {}).get("status", {}).get("name", "未知状态")
-                    project = result_obj.get("fields", {}).get("project", {}).get("key", "未知项目")
+                    fields = result_obj.get("fields") or _EMPTY_FIELDS
+                    summary = fields.get("summary", "无标题")
+                    status = (fields.get("status") or _EMPTY_FIELDS).get("name", "未知状态")
+                    project = (fields.get("project") or _EMPTY_FIELDS).get("key", "未知项目")
+                    description = _adf_to_text(fields.get("description") or "") or "无描述"
 
                     await event_emitter.emit_message(f"""
 ### Jira 问题详情
 
-**问题:** [{issue_key}]({self._get_jira_server()}/browse/{issue_key})
+**问题:** [{issue_key}]({self._browse_url(issue_key)})
 **标题:** {summary}
 **项目:** {project}
 **状态:** {status}
+**描述:** {description}
 """)
                     await event_emitter.emit_status(f"成功获取问题 {issue_key} 的详情", True)
 
-            return result
+            return _json_dumps(result_obj)
 
         except Exception as e:
-            error_message = str(e)
+            return await self._error_result(event_emitter, "获取问题详情失败", "获取 Jira 问题失败", e)
+
+    async def jira_get_issues(self, issue_keys: str, fields: str = "summary,status,priority", __user__: Optional[dict] = None, __event_emitter__: Callable[[dict], Awaitable[None]] = None) -> str:
+        """
+        批量获取多个 Jira 问题，通过一次 JQL 搜索代替逐个请求
+
+        :param issue_keys: 问题键值列表，逗号分隔，例如 "PROJECT-1,PROJECT-2"
+        :param fields: 要返回的字段列表，逗号分隔的字符串，默认字段与结果表格的 标题/状态/优先级 列一致
+        :return: 包含问题列表的 JSON 字符串
+        """
+        event_emitter = BufferedEventEmitter(__event_emitter__) if __event_emitter__ else _NULL_EMITTER
+        await event_emitter.emit_status(f"正在批量获取 Jira 问题: {issue_keys}", False)
+
+        try:
+            keys = [key.strip() for key in issue_keys.split(",") if key.strip()]
+            if not keys:
+                error_message = "未提供任何问题键值"
+                await event_emitter.emit_status(error_message, True, True)
+                return _json_error(error_message)
+
+            invalid_result = await self._invalid_keys_result(event_emitter, keys)
+            if invalid_result:
+                return invalid_result
+
+            # Jira 限制单页结果数，问题键较多时拆分为多次搜索并发执行，再合并结果
+            field_list = fields.split(',') if fields else None
+            specs = []
+            for i in range(0, len(keys), self.BULK_ISSUE_KEYS_PER_SEARCH):
+                chunk = keys[i:i + self.BULK_ISSUE_KEYS_PER_SEARCH]
+                # validateQuery=warn: 不存在的键只产生警告而不是让整个查询返回 400
+                data = {
+                    "jql": f"key in ({','.join(chunk)})",
+                    "startAt": 0,
+                    "maxResults": len(chunk),
+                    "validateQuery": "warn"
+                }
+                if field_list:
+                    data["fields"] = field_list
+                specs.append(("POST", "/search", None, data))
+
+            pages = await self._gather_requests(specs, __user__)
+            error_result = None
+            merged = []
+            warning_messages = []
+            for page in pages:
+                if isinstance(page, Exception):
+                    raise page
+                if _is_error(page):
+                    error_result = page
+                    break
+                merged.extend(page.get("issues", []))
+                warning_messages.extend(page.get("warningMessages", []))
+
+            missing_keys = []
+            if error_result is not None:
+                result_obj = error_result
+            else:
+                if len(pages) == 1:
+                    result_obj = dict(pages[0])
+                else:
+                    result_obj = {"startAt": 0, "maxResults": len(merged), "total": len(merged), "issues": merged}
+                    if warning_messages:
+                        result_obj["warningMessages"] = warning_messages
+
+                # 对照返回的问题键与 ID 找出不存在或无权访问的键，与 warningMessages 一并返回
+                found = set()
+                for issue in merged:
+                    found.add(str(issue.get("key", "")).upper())
+                    found.add(str(issue.get("id", "")))
+                missing_keys = [key for key in keys if key.upper() not in found]
+                if missing_keys:
+                    result_obj["missingKeys"] = missing_keys
+
             if event_emitter:
-                await event_emitter.emit_status(f"获取问题详情失败: {error_message}", True, True)
+                if _is_error(result_obj):
+                    await event_emitter.emit_status(f"批量获取问题失败: {result_obj['error']}", True, True)
+                else:
+                    issues = result_obj.get("issues", [])
+
+                    if not issues:
+                        await event_emitter.emit_message("未找到任何问题")
+                    else:
+                        # 准备表格数据
+                        browse_prefix = self._browse_prefix()
+                        rows = [self._issue_row(issue, browse_prefix) for issue in issues]
+
+                        await event_emitter.emit_table(
+                            ["问题", "标题", "状态", "优先级"],
+                            rows,
+                            f"Jira 问题详情 (共 {len(issues)} 个)"
+                        )
+
+                    if missing_keys:
+                        await event_emitter.emit_message(f"\n**以下问题不存在或无权访问:** {', '.join(missing_keys)}\n")
 
-            error_response = {"error": f"获取 Jira 问题失败: {error_message}"}
-            return json.dumps(error_response, ensure_ascii=False)
+                    await event_emitter.emit_status(f"成功获取 {len(issues)} 个问题的详情", True)
+
+            return _json_dumps(result_obj)
+
+        except Exception as e:
+            return await self._error_result(event_emitter, "批量获取问题失败", "批量获取 Jira 问题失败", e)
 
     async def jira_create_issue(self, project_key: str, issue_type: str, summary: str,
                     description: str = None, priority: str = None, assignee: str = None,
-                    custom_fields: str = None, __user__: dict = {}, __event_emitter__: Callable[[dict], Awaitable[None]] = None) -> str:
+                    custom_fields: str = None, __user__: Optional[dict] = None, __event_emitter__: Callable[[dict], Awaitable[None]] = None) -> str:
         """
         创建 Jira 问题
 
@@ -308,10 +1197,8 @@ class Tools:
         :param custom_fields: 自定义字段的JSON字符串 (可选)
         :return: 创建的问题信息 JSON 字符串
         """
-        event_emitter = None
-        if __event_emitter__:
-            event_emitter = EventEmitter(__event_emitter__)
-            await event_emitter.emit_status(f"正在创建 Jira 问题: {summary}", False)
+        event_emitter = BufferedEventEmitter(__event_emitter__) if __event_emitter__ else _NULL_EMITTER
+        await event_emitter.emit_status(f"正在创建 Jira 问题: {summary}", False)
 
         try:
             data = {
@@ -323,21 +1210,7 @@ class Tools:
             }
 
             if description:
-                data["fields"]["description"] = {
-                    "type": "doc",
-                    "version": 1,
-                    "content": [
-                        {
-                            "type": "paragraph",
-                            "content": [
-                                {
-                                    "type": "text",
-                                    "text": description
-                                }
-                            ]
-                        }
-                    ]
-                }
+                data["fields"]["description"] = _adf_paragraph(description)
 
             if priority:
                 data["fields"]["priority"] = {"name": priority}
@@ -347,21 +1220,22 @@ class Tools:
 
             if custom_fields:
                 try:
-                    custom_fields_dict = json.loads(custom_fields)
-                    for field_id, value in custom_fields_dict.items():
-                        data["fields"][field_id] = value
-                except json.JSONDecodeError:
+                    custom_fields_dict = _json_loads(custom_fields)
+                except ValueError:
+                    # orjson/标准库的 JSONDecodeError 与 ujson 的解析错误均为 ValueError 子类
                     raise ValueError("custom_fields 参数必须是有效的 JSON 字符串")
+                if not isinstance(custom_fields_dict, dict):
+                    raise ValueError("custom_fields 参数必须是 JSON 对象")
+                data["fields"].update(custom_fields_dict)
 
-            result = self._make_jira_request("POST", "/issue", __user__, data=data)
+            result_obj = await self._make_jira_request("POST", "/issue", __user__, data=data)
 
             if event_emitter:
-                result_obj = json.loads(result)
-                if "error" in result_obj:
+                if _is_error(result_obj):
                     await event_emitter.emit_status(f"创建问题失败: {result_obj['error']}", True, True)
                 else:
                     issue_key = result_obj.get("key", "未知问题")
-                    issue_url = f"{self._get_jira_server()}/browse/{issue_key}"
+                    issue_url = self._browse_url(issue_key)
 
                     await event_emitter.emit_message(f"""
 ### ✅ 问题创建成功
@@ -373,19 +1247,93 @@ class Tools:
 """)
                     await event_emitter.emit_status(f"问题 {issue_key} 创建成功", True)
 
-            return result
+            return _json_dumps(result_obj)
 
         except Exception as e:
-            error_message = str(e)
+            return await self._error_result(event_emitter, "创建问题失败", "创建 Jira 问题失败", e)
+
+    async def jira_bulk_create_issues(self, issues: str, __user__: Optional[dict] = None, __event_emitter__: Callable[[dict], Awaitable[None]] = None) -> str:
+        """
+        批量创建 Jira 问题，通过一次请求创建多个问题
+
+        :param issues: 问题列表的JSON字符串，每项包含 project_key、issue_type、summary，
+                       以及可选的 description、priority、assignee，
+                       例如 '[{"project_key": "PROJ", "issue_type": "Task", "summary": "标题"}]'
+        :return: 创建的问题列表 JSON 字符串
+        """
+        event_emitter = BufferedEventEmitter(__event_emitter__) if __event_emitter__ else _NULL_EMITTER
+        await event_emitter.emit_status("正在批量创建 Jira 问题", False)
+
+        try:
+            try:
+                issue_specs = _json_loads(issues)
+            except ValueError:
+                # orjson/标准库的 JSONDecodeError 与 ujson 的解析错误均为 ValueError 子类
+                raise ValueError("issues 参数必须是有效的 JSON 字符串")
+
+            if not isinstance(issue_specs, list) or not issue_specs:
+                raise ValueError("issues 参数必须是非空的 JSON 数组")
+
+            issue_updates = []
+            for spec in issue_specs:
+                fields = {
+                    "project": {"key": spec["project_key"]},
+                    "issuetype": {"name": spec["issue_type"]},
+                    "summary": spec["summary"]
+                }
+
+                if spec.get("description"):
+                    fields["description"] = _adf_paragraph(spec["description"])
+
+                if spec.get("priority"):
+                    fields["priority"] = {"name": spec["priority"]}
+
+                if spec.get("assignee"):
+                    fields["assignee"] = {"id": spec["assignee"]}
+
+                issue_updates.append({"fields": fields})
+
+            result_obj = await self._make_jira_request("POST", "/issue/bulk", __user__, data={"issueUpdates": issue_updates})
+
             if event_emitter:
-                await event_emitter.emit_status(f"创建问题失败: {error_message}", True, True)
+                if _is_error(result_obj):
+                    await event_emitter.emit_status(f"批量创建问题失败: {result_obj['error']}", True, True)
+                else:
+                    created = result_obj.get("issues", [])
+                    errors = result_obj.get("errors", [])
+
+                    if created:
+                        browse_prefix = self._browse_prefix()
+                        rows = [
+                            [f"[{issue.get('key', '')}]({browse_prefix}{issue.get('key', '')})", issue.get("id", "")]
+                            for issue in created
+                        ]
+
+                        await event_emitter.emit_table(
+                            ["问题", "ID"],
+                            rows,
+                            f"✅ 成功创建 {len(created)} 个问题"
+                        )
+
+                    if errors:
+                        await event_emitter.emit_message(f"⚠️ {len(errors)} 个问题创建失败: {_json_dumps(errors)}")
 
-            error_response = {"error": f"创建 Jira 问题失败: {error_message}"}
-            return json.dumps(error_response, ensure_ascii=False)
+                    await event_emitter.emit_status(f"批量创建完成: 成功 {len(created)} 个，失败 {len(errors)} 个", True)
+
+            return _json_dumps(result_obj)
+
+        except KeyError as e:
+            error_message = f"issues 中的每一项都必须包含 {e} 字段"
+            await event_emitter.emit_status(f"批量创建问题失败: {error_message}", True, True)
+
+            return _json_error(f"批量创建 Jira 问题失败: {error_message}")
+
+        except Exception as e:
+            return await self._error_result(event_emitter, "批量创建问题失败", "批量创建 Jira 问题失败", e)
 
     async def jira_update_issue(self, issue_key: str, summary: str = None,
                     description: str = None, priority: str = None, assignee: str = None,
-                    custom_fields: str = None, __user__: dict = {}, __event_emitter__: Callable[[dict], Awaitable[None]] = None) -> str:
+                    custom_fields: str = None, __user__: Optional[dict] = None, __event_emitter__: Callable[[dict], Awaitable[None]] = None) -> str:
         """
         更新 Jira 问题
 
@@ -397,33 +1345,21 @@ class Tools:
         :param custom_fields: 自定义字段的JSON字符串 (可选)
         :return: 更新操作结果 JSON 字符串
         """
-        event_emitter = None
-        if __event_emitter__:
-            event_emitter = EventEmitter(__event_emitter__)
-            await event_emitter.emit_status(f"正在更新 Jira 问题 {issue_key}", False)
+        event_emitter = BufferedEventEmitter(__event_emitter__) if __event_emitter__ else _NULL_EMITTER
+        await event_emitter.emit_status(f"正在更新 Jira 问题 {issue_key}", False)
 
         try:
+            invalid_result = await self._invalid_keys_result(event_emitter, (issue_key,))
+            if invalid_result:
+                return invalid_result
+
             data = {"fields": {}}
 
             if summary:
                 data["fields"]["summary"] = summary
 
             if description:
-                data["fields"]["description"] = {
-                    "type": "doc",
-                    "version": 1,
-                    "content": [
-                        {
-                            "type": "paragraph",
-                            "content": [
-                                {
-                                    "type": "text",
-                                    "text": description
-                                }
-                            ]
-                        }
-                    ]
-                }
+                data["fields"]["description"] = _adf_paragraph(description)
 
             if priority:
                 data["fields"]["priority"] = {"name": priority}
@@ -433,27 +1369,28 @@ class Tools:
 
             if custom_fields:
                 try:
-                    custom_fields_dict = json.loads(custom_fields)
-                    for field_id, value in custom_fields_dict.items():
-                        data["fields"][field_id] = value
-                except json.JSONDecodeError:
+                    custom_fields_dict = _json_loads(custom_fields)
+                except ValueError:
+                    # orjson/标准库的 JSONDecodeError 与 ujson 的解析错误均为 ValueError 子类
                     raise ValueError("custom_fields 参数必须是有效的 JSON 字符串")
+                if not isinstance(custom_fields_dict, dict):
+                    raise ValueError("custom_fields 参数必须是 JSON 对象")
+                data["fields"].update(custom_fields_dict)
 
             # 检查是否有字段要更新
             if not data["fields"]:
-                error_message = "未提供任何要更新的字段"
-                if event_emitter:
-                    await event_emitter.emit_status(error_message, True, True)
-                return json.dumps({"error": error_message}, ensure_ascii=False)
+                await event_emitter.emit_status(_NO_UPDATE_FIELDS_MESSAGE, True, True)
+                return _NO_UPDATE_FIELDS_JSON
 
-            result = self._make_jira_request("PUT", f"/issue/{issue_key}", __user__, data=data)
+            result_obj = await self._make_jira_request("PUT", f"/issue/{issue_key}", __user__, data=data)
+            if not _is_error(result_obj):
+                self._invalidate_issue_cache(issue_key)
 
             if event_emitter:
-                result_obj = json.loads(result)
-                if "error" in result_obj:
+                if _is_error(result_obj):
                     await event_emitter.emit_status(f"更新问题失败: {result_obj['error']}", True, True)
                 else:
-                    issue_url = f"{self._get_jira_server()}/browse/{issue_key}"
+                    issue_url = self._browse_url(issue_key)
                     update_fields = []
 
                     if summary:
@@ -479,17 +1416,12 @@ class Tools:
 """)
                     await event_emitter.emit_status(f"问题 {issue_key} 更新成功", True)
 
-            return result
+            return _json_dumps(result_obj)
 
         except Exception as e:
-            error_message = str(e)
-            if event_emitter:
-                await event_emitter.emit_status(f"更新问题失败: {error_message}", True, True)
-
-            error_response = {"error": f"更新 Jira 问题失败: {error_message}"}
-            return json.dumps(error_response, ensure_ascii=False)
+            return await self._error_result(event_emitter, "更新问题失败", "更新 Jira 问题失败", e)
 
-    async def jira_delete_issue(self, issue_key: str, delete_subtasks: bool = False, __user__: dict = {}, __event_emitter__: Callable[[dict], Awaitable[None]] = None) -> str:
+    async def jira_delete_issue(self, issue_key: str, delete_subtasks: bool = False, __user__: Optional[dict] = None, __event_emitter__: Callable[[dict], Awaitable[None]] = None) -> str:
         """
         删除 Jira 问题
 
@@ -497,21 +1429,24 @@ class Tools:
         :param delete_subtasks: 是否删除子任务
         :return: 删除操作结果 JSON 字符串
         """
-        event_emitter = None
-        if __event_emitter__:
-            event_emitter = EventEmitter(__event_emitter__)
-            await event_emitter.emit_status(f"正在删除 Jira 问题 {issue_key}", False)
+        event_emitter = BufferedEventEmitter(__event_emitter__) if __event_emitter__ else _NULL_EMITTER
+        await event_emitter.emit_status(f"正在删除 Jira 问题 {issue_key}", False)
 
         try:
+            invalid_result = await self._invalid_keys_result(event_emitter, (issue_key,))
+            if invalid_result:
+                return invalid_result
+
             params = {}
             if delete_subtasks:
                 params["deleteSubtasks"] = "true"
 
-            result = self._make_jira_request("DELETE", f"/issue/{issue_key}", __user__, params=params)
+            result_obj = await self._make_jira_request("DELETE", f"/issue/{issue_key}", __user__, params=params)
+            if not _is_error(result_obj):
+                self._invalidate_issue_cache(issue_key)
 
             if event_emitter:
-                result_obj = json.loads(result)
-                if "error" in result_obj:
+                if _is_error(result_obj):
                     await event_emitter.emit_status(f"删除问题失败: {result_obj['error']}", True, True)
                 else:
                     message = f"问题 {issue_key} 已成功删除"
@@ -525,69 +1460,105 @@ class Tools:
 """)
                     await event_emitter.emit_status(f"问题 {issue_key} 删除成功", True)
 
-            return result
+            return _json_dumps(result_obj)
 
         except Exception as e:
-            error_message = str(e)
-            if event_emitter:
-                await event_emitter.emit_status(f"删除问题失败: {error_message}", True, True)
-
-            error_response = {"error": f"删除 Jira 问题失败: {error_message}"}
-            return json.dumps(error_response, ensure_ascii=False)
+            return await self._error_result(event_emitter, "删除问题失败", "删除 Jira 问题失败", e)
 
 
-    async def jira_get_projects(self, __user__: dict = {}, __event_emitter__: Callable[[dict], Awaitable[None]] = None) -> str:
+    async def jira_get_projects(self, __user__: Optional[dict] = None, __event_emitter__: Callable[[dict], Awaitable[None]] = None) -> str:
         """
         获取所有项目
 
         :return: 项目列表 JSON 字符串
         """
-        event_emitter = None
-        if __event_emitter__:
-            event_emitter = EventEmitter(__event_emitter__)
-            await event_emitter.emit_status("正在获取 Jira 项目列表", False)
+        event_emitter = BufferedEventEmitter(__event_emitter__) if __event_emitter__ else _NULL_EMITTER
+        await event_emitter.emit_status("正在获取 Jira 项目列表", False)
 
         try:
-            result = self._make_jira_request("GET", "/project", __user__)
+            result_obj = await self._make_jira_request("GET", "/project", __user__)
 
             if event_emitter:
-                result_obj = json.loads(result)
-                if "error" in result_obj:
+                if _is_error(result_obj):
                     await event_emitter.emit_status(f"获取项目列表失败: {result_obj['error']}", True, True)
                 else:
                     if isinstance(result_obj, list) and result_obj:
-                        # 准备表格数据
-                        rows = []
-                        for project in result_obj:
-                            key = project.get("key", "")
-                            name = project.get("name", "")
-                            lead = project.get("lead", {}).get("displayName", "")
-                            project_url = f"{self._get_jira_server()}/browse/{key}"
-                            link = f"[{key}]({project_url})"
-
-                            rows.append([link, name, lead])
-
-                        await event_emitter.emit_table(
+                        # 逐行生成表格数据并分块发送，项目较多时无需等待全部行格式化完成
+                        browse_prefix = self._browse_prefix()
+                        await event_emitter.emit_table_chunked(
                             ["项目键", "项目名称", "负责人"],
-                            rows,
-                            "Jira 项目列表"
+                            (self._project_row(project, browse_prefix) for project in result_obj),
+                            "Jira 项目列表",
+                            self.TABLE_CHUNK_ROWS
                         )
                     else:
                         await event_emitter.emit_message("未找到任何项目")
 
                     await event_emitter.emit_status("项目列表获取完成", True)
 
-            return result
+            return _json_dumps(result_obj)
 
         except Exception as e:
-            error_message = str(e)
+            return await self._error_result(event_emitter, "获取项目列表失败", "获取 Jira 项目列表失败", e)
+
+    async def jira_get_projects_detailed(self, __user__: Optional[dict] = None, __event_emitter__: Callable[[dict], Awaitable[None]] = None) -> str:
+        """
+        获取所有项目及其详细信息，并发请求各项目详情
+
+        :return: 项目详细信息列表 JSON 字符串
+        """
+        event_emitter = BufferedEventEmitter(__event_emitter__) if __event_emitter__ else _NULL_EMITTER
+        await event_emitter.emit_status("正在获取 Jira 项目详细信息", False)
+
+        try:
+            projects = await self._make_jira_request("GET", "/project", __user__)
+
+            if _is_error(projects):
+                await event_emitter.emit_status(f"获取项目列表失败: {projects['error']}", True, True)
+                return _json_dumps(projects)
+
+            specs = [("GET", f"/project/{project.get('key', '')}", None, None) for project in projects]
+            details = await self._gather_requests(specs, __user__)
+
+            result_obj = []
+            for project, detail in zip(projects, details):
+                if isinstance(detail, Exception):
+                    detail = {"error": f"获取项目 {project.get('key', '')} 详情失败: {str(detail)}"}
+                result_obj.append(detail)
+
             if event_emitter:
-                await event_emitter.emit_status(f"获取项目列表失败: {error_message}", True, True)
+                if result_obj:
+                    # 准备表格数据
+                    browse_prefix = self._browse_prefix()
+                    rows = []
+                    for project, detail in zip(projects, result_obj):
+                        key = project.get("key", "")
+                        link = f"[{key}]({browse_prefix}{key})"
+                        if _is_error(detail):
+                            rows.append([link, project.get("name", ""), "", detail["error"]])
+                            continue
+
+                        name = detail.get("name", "")
+                        lead = (detail.get("lead") or _EMPTY_FIELDS).get("displayName", "")
+                        description = detail.get("description") or "无描述"
+                        rows.append([link, name, lead, description])
+
+                    await event_emitter.emit_table(
+                        ["项目键", "项目名称", "负责人", "描述"],
+                        rows,
+                        "Jira 项目详细信息"
+                    )
+                else:
+                    await event_emitter.emit_message("未找到任何项目")
 
-            error_response = {"error": f"获取 Jira 项目列表失败: {error_message}"}
-            return json.dumps(error_response, ensure_ascii=False)
+                await event_emitter.emit_status(f"已获取 {len(result_obj)} 个项目的详细信息", True)
 
-    async def jira_get_project(self, project_key: str, expand: str = None, __user__: dict = {}, __event_emitter__: Callable[[dict], Awaitable[None]] = None) -> str:
+            return _json_dumps(result_obj)
+
+        except Exception as e:
+            return await self._error_result(event_emitter, "获取项目详细信息失败", "获取 Jira 项目详细信息失败", e)
+
+    async def jira_get_project(self, project_key: str, expand: str = None, __user__: Optional[dict] = None, __event_emitter__: Callable[[dict], Awaitable[None]] = None) -> str:
         """
         获取特定项目详情
 
@@ -595,28 +1566,29 @@ class Tools:
         :param expand: 要展开的字段
         :return: 项目详细信息 JSON 字符串
         """
-        event_emitter = None
-        if __event_emitter__:
-            event_emitter = EventEmitter(__event_emitter__)
-            await event_emitter.emit_status(f"正在获取项目 {project_key} 的详细信息", False)
+        event_emitter = BufferedEventEmitter(__event_emitter__) if __event_emitter__ else _NULL_EMITTER
+        await event_emitter.emit_status(f"正在获取项目 {project_key} 的详细信息", False)
 
         try:
+            invalid_result = await self._invalid_keys_result(event_emitter, (project_key,), _PROJECT_KEY_RE, "项目键值")
+            if invalid_result:
+                return invalid_result
+
             params = {}
             if expand:
                 params["expand"] = expand
 
-            result = self._make_jira_request("GET", f"/project/{project_key}", __user__, params=params)
+            result_obj = await self._make_jira_request("GET", f"/project/{project_key}", __user__, params=params)
 
             if event_emitter:
-                result_obj = json.loads(result)
-                if "error" in result_obj:
+                if _is_error(result_obj):
                     await event_emitter.emit_status(f"获取项目详情失败: {result_obj['error']}", True, True)
                 else:
                     name = result_obj.get("name", "")
-                    lead = result_obj.get("lead", {}).get("displayName", "")
+                    lead = (result_obj.get("lead") or _EMPTY_FIELDS).get("displayName", "")
                     description = result_obj.get("description", "无描述")
                     url = result_obj.get("url", "")
-                    project_url = f"{self._get_jira_server()}/browse/{project_key}"
+                    project_url = self._browse_url(project_key)
 
                     await event_emitter.emit_message(f"""
 ### 项目详情: {name}
@@ -629,17 +1601,12 @@ class Tools:
 """)
                     await event_emitter.emit_status(f"项目 {project_key} 详情获取完成", True)
 
-            return result
+            return _json_dumps(result_obj)
 
         except Exception as e:
-            error_message = str(e)
-            if event_emitter:
-                await event_emitter.emit_status(f"获取项目详情失败: {error_message}", True, True)
-
-            error_response = {"error": f"获取项目详情失败: {error_message}"}
-            return json.dumps(error_response, ensure_ascii=False)
+            return await self._error_result(event_emitter, "获取项目详情失败", "获取项目详情失败", e)
 
-    async def jira_add_comment(self, issue_key: str, comment: str, __user__: dict = {}, __event_emitter__: Callable[[dict], Awaitable[None]] = None) -> str:
+    async def jira_add_comment(self, issue_key: str, comment: str, __user__: Optional[dict] = None, __event_emitter__: Callable[[dict], Awaitable[None]] = None) -> str:
         """
         添加评论到问题
 
@@ -647,38 +1614,25 @@ class Tools:
         :param comment: 评论内容
         :return: 创建的评论信息 JSON 字符串
         """
-        event_emitter = None
-        if __event_emitter__:
-            event_emitter = EventEmitter(__event_emitter__)
-            await event_emitter.emit_status(f"正在向问题 {issue_key} 添加评论", False)
+        event_emitter = BufferedEventEmitter(__event_emitter__) if __event_emitter__ else _NULL_EMITTER
+        await event_emitter.emit_status(f"正在向问题 {issue_key} 添加评论", False)
 
         try:
-            data = {
-                "body": {
-                    "type": "doc",
-                    "version": 1,
-                    "content": [
-                        {
-                            "type": "paragraph",
-                            "content": [
-                                {
-                                    "type": "text",
-                                    "text": comment
-                                }
-                            ]
-                        }
-                    ]
-                }
-            }
+            invalid_result = await self._invalid_keys_result(event_emitter, (issue_key,))
+            if invalid_result:
+                return invalid_result
+
+            data = {"body": _adf_paragraph(comment)}
 
-            result = self._make_jira_request("POST", f"/issue/{issue_key}/comment", __user__, data=data)
+            result_obj = await self._make_jira_request("POST", f"/issue/{issue_key}/comment", __user__, data=data)
+            if not _is_error(result_obj):
+                self._invalidate_issue_cache(issue_key)
 
             if event_emitter:
-                result_obj = json.loads(result)
-                if "error" in result_obj:
+                if _is_error(result_obj):
                     await event_emitter.emit_status(f"添加评论失败: {result_obj['error']}", True, True)
                 else:
-                    issue_url = f"{self._get_jira_server()}/browse/{issue_key}"
+                    issue_url = self._browse_url(issue_key)
                     created = result_obj.get("created", "")
 
                     await event_emitter.emit_message(f"""
@@ -689,17 +1643,12 @@ class Tools:
 """)
                     await event_emitter.emit_status(f"评论已添加到问题 {issue_key}", True)
 
-            return result
+            return _json_dumps(result_obj)
 
         except Exception as e:
-            error_message = str(e)
-            if event_emitter:
-                await event_emitter.emit_status(f"添加评论失败: {error_message}", True, True)
-
-            error_response = {"error": f"添加评论失败: {error_message}"}
-            return json.dumps(error_response, ensure_ascii=False)
+            return await self._error_result(event_emitter, "添加评论失败", "添加评论失败", e)
 
-    async def jira_get_comments(self, issue_key: str, start_at: int = 0, max_results: int = 50, __user__: dict = {}, __event_emitter__: Callable[[dict], Awaitable[None]] = None) -> str:
+    async def jira_get_comments(self, issue_key: str, start_at: int = 0, max_results: int = 50, __user__: Optional[dict] = None, __event_emitter__: Callable[[dict], Awaitable[None]] = None) -> str:
         """
         获取问题的所有评论
 
@@ -708,27 +1657,28 @@ class Tools:
         :param max_results: 最大结果数
         :return: 评论列表 JSON 字符串
         """
-        event_emitter = None
-        if __event_emitter__:
-            event_emitter = EventEmitter(__event_emitter__)
-            await event_emitter.emit_status(f"正在获取问题 {issue_key} 的评论", False)
+        event_emitter = BufferedEventEmitter(__event_emitter__) if __event_emitter__ else _NULL_EMITTER
+        await event_emitter.emit_status(f"正在获取问题 {issue_key} 的评论", False)
 
         try:
+            invalid_result = await self._invalid_keys_result(event_emitter, (issue_key,))
+            if invalid_result:
+                return invalid_result
+
             params = {
                 "startAt": start_at,
                 "maxResults": max_results
             }
 
-            result = self._make_jira_request("GET", f"/issue/{issue_key}/comment", __user__, params=params)
+            result_obj = await self._make_jira_request("GET", f"/issue/{issue_key}/comment", __user__, params=params)
 
             if event_emitter:
-                result_obj = json.loads(result)
-                if "error" in result_obj:
+                if _is_error(result_obj):
                     await event_emitter.emit_status(f"获取评论失败: {result_obj['error']}", True, True)
                 else:
                     comments = result_obj.get("comments", [])
                     total = result_obj.get("total", 0)
-                    issue_url = f"{self._get_jira_server()}/browse/{issue_key}"
+                    issue_url = self._browse_url(issue_key)
 
                     if not comments:
                         await event_emitter.emit_message(f"""
@@ -737,9 +1687,10 @@ class Tools:
 问题 [{issue_key}]({issue_url}) 没有评论
 """)
                     else:
-                        comments_text = ""
+                        comment_count = len(comments)
+                        comment_chunks = []
                         for i, comment in enumerate(comments, 1):
-                            author = comment.get("author", {}).get("displayName", "未知用户")
+                            author = (comment.get("author") or _EMPTY_FIELDS).get("displayName", "未知用户")
                             created = comment.get("created", "")
                             body = "未能提取评论正文"
 
@@ -748,32 +1699,23 @@ class Tools:
                                 # 处理 Jira API 的不同版本
                                 body_value = comment["body"]
                                 if isinstance(body_value, dict) and "content" in body_value:
-                                    # 尝试提取格式化文本内容
-                                    try:
-                                        paragraphs = []
-                                        for content_item in body_value["content"]:
-                                            if content_item["type"] == "paragraph":
-                                                paragraph_text = []
-                                                for text_item in content_item["content"]:
-                                                    if text_item["type"] == "text":
-                                                        paragraph_text.append(text_item["text"])
-                                                paragraphs.append("".join(paragraph_text))
-                                        body = "\n".join(paragraphs)
-                                    except:
-                                        body = "无法解析评论格式"
+                                    # 提取 ADF 格式化文本内容
+                                    body = _adf_to_text(body_value)
                                 else:
                                     # 纯文本评论
                                     body = str(body_value)
 
-                            comments_text += f"""
-#### 评论 {i}/{len(comments)}
+                            comment_chunks.append(f"""
+#### 评论 {i}/{comment_count}
 **作者:** {author}
 **时间:** {created}
 **内容:**
 {body}
 
 ---
-"""
+""")
+
+                        comments_text = "".join(comment_chunks)
 
                         await event_emitter.emit_message(f"""
 ### 💬 问题评论
@@ -784,38 +1726,34 @@ class Tools:
 
                     await event_emitter.emit_status(f"已获取问题 {issue_key} 的评论", True)
 
-            return result
+            return _json_dumps(result_obj)
 
         except Exception as e:
-            error_message = str(e)
-            if event_emitter:
-                await event_emitter.emit_status(f"获取评论失败: {error_message}", True, True)
-
-            error_response = {"error": f"获取评论失败: {error_message}"}
-            return json.dumps(error_response, ensure_ascii=False)
+            return await self._error_result(event_emitter, "获取评论失败", "获取评论失败", e)
 
-    async def jira_get_transitions(self, issue_key: str, __user__: dict = {}, __event_emitter__: Callable[[dict], Awaitable[None]] = None) -> str:
+    async def jira_get_transitions(self, issue_key: str, __user__: Optional[dict] = None, __event_emitter__: Callable[[dict], Awaitable[None]] = None) -> str:
         """
         获取问题可用的转换状态
 
         :param issue_key: 问题的键值，例如 PROJECT-123
         :return: 可用的转换状态列表 JSON 字符串
         """
-        event_emitter = None
-        if __event_emitter__:
-            event_emitter = EventEmitter(__event_emitter__)
-            await event_emitter.emit_status(f"正在获取问题 {issue_key} 可用的状态转换", False)
+        event_emitter = BufferedEventEmitter(__event_emitter__) if __event_emitter__ else _NULL_EMITTER
+        await event_emitter.emit_status(f"正在获取问题 {issue_key} 可用的状态转换", False)
 
         try:
-            result = self._make_jira_request("GET", f"/issue/{issue_key}/transitions", __user__)
+            invalid_result = await self._invalid_keys_result(event_emitter, (issue_key,))
+            if invalid_result:
+                return invalid_result
+
+            result_obj = await self._make_jira_request("GET", f"/issue/{issue_key}/transitions", __user__)
 
             if event_emitter:
-                result_obj = json.loads(result)
-                if "error" in result_obj:
+                if _is_error(result_obj):
                     await event_emitter.emit_status(f"获取状态转换失败: {result_obj['error']}", True, True)
                 else:
                     transitions = result_obj.get("transitions", [])
-                    issue_url = f"{self._get_jira_server()}/browse/{issue_key}"
+                    issue_url = self._browse_url(issue_key)
 
                     if not transitions:
                         await event_emitter.emit_message(f"""
@@ -825,13 +1763,10 @@ class Tools:
 """)
                     else:
                         # 准备表格数据
-                        rows = []
-                        for transition in transitions:
-                            id = transition.get("id", "")
-                            name = transition.get("name", "")
-                            to_status = transition.get("to", {}).get("name", "")
-
-                            rows.append([id, name, to_status])
+                        rows = [
+                            [transition.get("id", ""), transition.get("name", ""), (transition.get("to") or _EMPTY_FIELDS).get("name", "")]
+                            for transition in transitions
+                        ]
 
                         await event_emitter.emit_table(
                             ["转换ID", "名称", "目标状态"],
@@ -841,18 +1776,13 @@ class Tools:
 
                     await event_emitter.emit_status(f"已获取问题 {issue_key} 的状态转换", True)
 
-            return result
+            return _json_dumps(result_obj)
 
         except Exception as e:
-            error_message = str(e)
-            if event_emitter:
-                await event_emitter.emit_status(f"获取状态转换失败: {error_message}", True, True)
-
-            error_response = {"error": f"获取状态转换失败: {error_message}"}
-            return json.dumps(error_response, ensure_ascii=False)
+            return await self._error_result(event_emitter, "获取状态转换失败", "获取状态转换失败", e)
 
     async def jira_transition_issue(self, issue_key: str, transition_id: str,
-                        comment: str = None, resolution: str = None, __user__: dict = {},
+                        comment: str = None, resolution: str = None, __user__: Optional[dict] = None,
                         __event_emitter__: Callable[[dict], Awaitable[None]] = None) -> str:
         """
         转换问题状态
@@ -863,12 +1793,14 @@ class Tools:
         :param resolution: 解决结果 (可选)
         :return: 转换操作结果 JSON 字符串
         """
-        event_emitter = None
-        if __event_emitter__:
-            event_emitter = EventEmitter(__event_emitter__)
-            await event_emitter.emit_status(f"正在更新问题 {issue_key} 的状态", False)
+        event_emitter = BufferedEventEmitter(__event_emitter__) if __event_emitter__ else _NULL_EMITTER
+        await event_emitter.emit_status(f"正在更新问题 {issue_key} 的状态", False)
 
         try:
+            invalid_result = await self._invalid_keys_result(event_emitter, (issue_key,))
+            if invalid_result:
+                return invalid_result
+
             data = {
                 "transition": {
                     "id": transition_id
@@ -878,25 +1810,7 @@ class Tools:
             update = {}
 
             if comment:
-                update["comment"] = [{
-                    "add": {
-                        "body": {
-                            "type": "doc",
-                            "version": 1,
-                            "content": [
-                                {
-                                    "type": "paragraph",
-                                    "content": [
-                                        {
-                                            "type": "text",
-                                            "text": comment
-                                        }
-                                    ]
-                                }
-                            ]
-                        }
-                    }
-                }]
+                update["comment"] = [{"add": {"body": _adf_paragraph(comment)}}]
 
             if resolution:
                 data["fields"] = {
@@ -906,69 +1820,58 @@ class Tools:
             if update:
                 data["update"] = update
 
-            result = self._make_jira_request("POST", f"/issue/{issue_key}/transitions", __user__, data=data)
+            # 转换名称只用于展示：转换前从缓存的可用转换列表中查找，不再额外发起 GET 请求
+            transition_name = "新状态"
+            if event_emitter:
+                transitions_result = self._peek_cached_response(f"/issue/{issue_key}/transitions", __user__)
+                if transitions_result:
+                    name_by_id = {
+                        t.get("id"): (t.get("to") or _EMPTY_FIELDS).get("name", transition_name)
+                        for t in transitions_result.get("transitions", [])
+                    }
+                    transition_name = name_by_id.get(transition_id, transition_name)
+
+            result_obj = await self._make_jira_request("POST", f"/issue/{issue_key}/transitions", __user__, data=data)
+            if not _is_error(result_obj):
+                self._invalidate_issue_cache(issue_key)
 
             if event_emitter:
-                result_obj = json.loads(result)
-                if "error" in result_obj:
+                if _is_error(result_obj):
                     await event_emitter.emit_status(f"状态转换失败: {result_obj['error']}", True, True)
                 else:
-                    issue_url = f"{self._get_jira_server()}/browse/{issue_key}"
-
-                    # 尝试获取转换名称
-                    transition_name = "新状态"
-                    transitions_result = json.loads(self._make_jira_request("GET", f"/issue/{issue_key}/transitions", __user__))
+                    issue_url = self._browse_url(issue_key)
 
-                    if not "error" in transitions_result:
-                        for t in transitions_result.get("transitions", []):
-                            if t.get("id") == transition_id:
-                                transition_name = t.get("to", {}).get("name", transition_name)
-                                break
-
-                    message = f"""
-### 🔄 问题状态已更新
-
-问题 [{issue_key}]({issue_url}) 已转换到 **{transition_name}** 状态
-"""
+                    message_parts = [_TRANSITION_MSG_TPL.format_map({"key": issue_key, "url": issue_url, "name": transition_name})]
                     if comment:
-                        message += f"""
-**添加评论:** {comment}
-"""
+                        message_parts.append(_TRANSITION_COMMENT_TPL.format_map({"comment": comment}))
                     if resolution:
-                        message += f"""
-**解决结果:** {resolution}
-"""
+                        message_parts.append(_TRANSITION_RESOLUTION_TPL.format_map({"resolution": resolution}))
+                    message = "".join(message_parts)
 
                     await event_emitter.emit_message(message)
                     await event_emitter.emit_status(f"问题 {issue_key} 状态已更新", True)
 
-            return result
+            return _json_dumps(result_obj)
 
         except Exception as e:
-            error_message = str(e)
-            if event_emitter:
-                await event_emitter.emit_status(f"状态转换失败: {error_message}", True, True)
-
-            error_response = {"error": f"状态转换失败: {error_message}"}
-            return json.dumps(error_response, ensure_ascii=False)
+            return await self._error_result(event_emitter, "状态转换失败", "状态转换失败", e)
 
     async def jira_search_projects(self, jql: str, start_at: int = 0,
-                     max_results: int = 50, fields: str = None, expand: str = None, __user__: dict = {},
-                     __event_emitter__: Callable[[dict], Awaitable[None]] = None) -> str:
+                     max_results: int = 50, fields: str = None, expand: str = None, fetch_all: bool = False,
+                     __user__: Optional[dict] = None, __event_emitter__: Callable[[dict], Awaitable[None]] = None) -> str:
         """
         使用 JQL 搜索 Jira 项目
 
         :param jql: JQL 查询语句
         :param start_at: 起始索引
-        :param max_results: 最大结果数
+        :param max_results: 每页最大结果数
         :param fields: 要返回的字段列表，逗号分隔的字符串
         :param expand: 要展开的字段
+        :param fetch_all: 是否并发获取从 start_at 开始的全部分页结果 (最多 1000 条)
         :return: 匹配的项目列表 JSON 字符串
         """
-        event_emitter = None
-        if __event_emitter__:
-            event_emitter = EventEmitter(__event_emitter__)
-            await event_emitter.emit_status(f"正在搜索 Jira 项目: {jql}", False)
+        event_emitter = BufferedEventEmitter(__event_emitter__) if __event_emitter__ else _NULL_EMITTER
+        await event_emitter.emit_status(f"正在搜索 Jira 项目: {jql}", False)
 
         try:
             data = {
@@ -983,73 +1886,57 @@ class Tools:
             if expand:
                 data["expand"] = expand
 
-            result = self._make_jira_request("POST", "/project/search", __user__, data=data)
+            result_obj = await self._make_jira_request("POST", "/project/search", __user__, data=data)
+            if fetch_all and not _is_error(result_obj):
+                result_obj = await self._fetch_remaining_pages("/project/search", data, result_obj, "projects", __user__)
 
             if event_emitter:
-                result_obj = json.loads(result)
-                if "error" in result_obj:
+                if _is_error(result_obj):
                     await event_emitter.emit_status(f"搜索项目失败: {result_obj['error']}", True, True)
                 else:
                     projects = result_obj.get("projects", [])
                     total = result_obj.get("total", 0)
 
                     if not projects:
-                        await event_emitter.emit_message(f"""
-### 🔍 搜索结果
-
-未找到符合查询条件的项目: `{jql}`
-""")
+                        await event_emitter.emit_message(_SEARCH_EMPTY_MSG_TPL.format_map({"kind": "项目", "jql": jql}))
                     else:
-                        # 准备表格数据
-                        rows = []
-                        for project in projects:
-                            key = project.get("key", "")
-                            name = project.get("name", "")
-                            lead = project.get("lead", {}).get("displayName", "")
-
-                            link = f"[{key}]({self._get_jira_server()}/browse/{key})"
-                            rows.append([link, name, lead])
-
                         # 显示分页信息
                         start = start_at + 1
                         end = min(start_at + len(projects), total)
                         pagination = f"显示 {start} 到 {end}，共 {total} 个结果"
 
-                        await event_emitter.emit_table(
+                        # 逐行生成表格数据并分块发送，fetch_all 时结果可能较多
+                        browse_prefix = self._browse_prefix()
+                        await event_emitter.emit_table_chunked(
                             ["项目", "名称", "负责人"],
-                            rows,
-                            f"搜索结果: {pagination}"
+                            (self._project_row(project, browse_prefix) for project in projects),
+                            f"搜索结果: {pagination}",
+                            self.TABLE_CHUNK_ROWS
                         )
 
                     await event_emitter.emit_status(f"搜索完成，找到 {total} 个项目", True)
 
-            return result
+            return _json_dumps(result_obj)
 
         except Exception as e:
-            error_message = str(e)
-            if event_emitter:
-                await event_emitter.emit_status(f"搜索项目失败: {error_message}", True, True)
-
-            error_response = {"error": f"搜索 Jira 项目失败: {error_message}"}
-            return json.dumps(error_response, ensure_ascii=False)
+            return await self._error_result(event_emitter, "搜索项目失败", "搜索 Jira 项目失败", e)
 
     async def jira_search_issues(self, jql: str, start_at: int = 0,
-                     max_results: int = 50, fields: str = None, expand: str = None, __user__: dict = {},
-                     __event_emitter__: Callable[[dict], Awaitable[None]] = None) -> str:
+                     max_results: int = 50, fields: str = None, expand: str = None, fetch_all: bool = False,
+                     __user__: Optional[dict] = None, __event_emitter__: Callable[[dict], Awaitable[None]] = None) -> str:
         """
         使用 JQL 搜索 Jira 问题
 
         :param jql: JQL 查询语句
         :param start_at: 起始索引
-        :param max_results: 最大结果数
+        :param max_results: 每页最大结果数
         :param fields: 要返回的字段列表，逗号分隔的字符串
         :param expand: 要展开的字段
+        :param fetch_all: 是否并发获取从 start_at 开始的全部分页结果 (最多 1000 条)
         :return: 匹配的问题列表 JSON 字符串
         """
-        event_emitter = None
-        if __event_emitter__:
-            event_emitter = EventEmitter(__event_emitter__)
-            await event_emitter.emit_status(f"正在搜索 Jira 问题: {jql}", False)
+        event_emitter = BufferedEventEmitter(__event_emitter__) if __event_emitter__ else _NULL_EMITTER
+        await event_emitter.emit_status(f"正在搜索 Jira 问题: {jql}", False)
 
         try:
             data = {
@@ -1064,74 +1951,54 @@ class Tools:
             if expand:
                 data["expand"] = expand
 
-            result = self._make_jira_request("POST", "/search", __user__, data=data)
+            result_obj = await self._make_jira_request("POST", "/search", __user__, data=data)
+            if fetch_all and not _is_error(result_obj):
+                result_obj = await self._fetch_remaining_pages("/search", data, result_obj, "issues", __user__)
 
             if event_emitter:
-                result_obj = json.loads(result)
-                if "error" in result_obj:
+                if _is_error(result_obj):
                     await event_emitter.emit_status(f"搜索问题失败: {result_obj['error']}", True, True)
                 else:
                     issues = result_obj.get("issues", [])
                     total = result_obj.get("total", 0)
 
                     if not issues:
-                        await event_emitter.emit_message(f"""
-### 🔍 搜索结果
-
-未找到符合查询条件的问题: `{jql}`
-""")
+                        await event_emitter.emit_message(_SEARCH_EMPTY_MSG_TPL.format_map({"kind": "问题", "jql": jql}))
                     else:
-                        # 准备表格数据
-                        rows = []
-                        for issue in issues:
-                            key = issue.get("key", "")
-                            fields = issue.get("fields", {})
-                            summary = fields.get("summary", "")
-                            status = fields.get("status", {}).get("name", "")
-                            priority = fields.get("priority", {}).get("name", "")
-
-                            link = f"[{key}]({self._get_jira_server()}/browse/{key})"
-                            rows.append([link, summary, status, priority])
-
                         # 显示分页信息
                         start = start_at + 1
                         end = min(start_at + len(issues), total)
                         pagination = f"显示 {start} 到 {end}，共 {total} 个结果"
 
-                        await event_emitter.emit_table(
+                        # 逐行生成表格数据并分块发送，结果较多时用户无需等待全部行格式化完成
+                        browse_prefix = self._browse_prefix()
+                        await event_emitter.emit_table_chunked(
                             ["问题", "标题", "状态", "优先级"],
-                            rows,
-                            f"搜索结果: {pagination}"
+                            (self._issue_row(issue, browse_prefix) for issue in issues),
+                            f"搜索结果: {pagination}",
+                            self.TABLE_CHUNK_ROWS
                         )
 
                     await event_emitter.emit_status(f"搜索完成，找到 {total} 个问题", True)
 
-            return result
+            return _json_dumps(result_obj)
 
         except Exception as e:
-            error_message = str(e)
-            if event_emitter:
-                await event_emitter.emit_status(f"搜索问题失败: {error_message}", True, True)
-
-            error_response = {"error": f"搜索 Jira 问题失败: {error_message}"}
-            return json.dumps(error_response, ensure_ascii=False)
-    async def jira_get_issue_types(self, __user__: dict = {}, __event_emitter__: Callable[[dict], Awaitable[None]] = None) -> str:
+            return await self._error_result(event_emitter, "搜索问题失败", "搜索 Jira 问题失败", e)
+    async def jira_get_issue_types(self, __user__: Optional[dict] = None, __event_emitter__: Callable[[dict], Awaitable[None]] = None) -> str:
         """
         获取所有问题类型
 
         :return: 问题类型列表 JSON 字符串
         """
-        event_emitter = None
-        if __event_emitter__:
-            event_emitter = EventEmitter(__event_emitter__)
-            await event_emitter.emit_status("正在获取问题类型列表", False)
+        event_emitter = BufferedEventEmitter(__event_emitter__) if __event_emitter__ else _NULL_EMITTER
+        await event_emitter.emit_status("正在获取问题类型列表", False)
 
         try:
-            result = self._make_jira_request("GET", "/issuetype", __user__)
+            result_obj = await self._make_jira_request("GET", "/issuetype", __user__)
 
             if event_emitter:
-                result_obj = json.loads(result)
-                if "error" in result_obj:
+                if _is_error(result_obj):
                     await event_emitter.emit_status(f"获取问题类型列表失败: {result_obj['error']}", True, True)
                 else:
                     issue_types = result_obj
@@ -1139,13 +2006,10 @@ class Tools:
                         await event_emitter.emit_message("未找到任何问题类型")
                     else:
                         # 准备表格数据
-                        rows = []
-                        for issue_type in issue_types:
-                            id = issue_type.get("id", "")
-                            name = issue_type.get("name", "")
-                            description = issue_type.get("description", "无描述")
-
-                            rows.append([id, name, description])
+                        rows = [
+                            [issue_type.get("id", ""), issue_type.get("name", ""), issue_type.get("description", "无描述")]
+                            for issue_type in issue_types
+                        ]
 
                         await event_emitter.emit_table(
                             ["ID", "名称", "描述"],
@@ -1155,17 +2019,12 @@ class Tools:
 
                     await event_emitter.emit_status("问题类型列表获取完成", True)
 
-            return result
+            return _json_dumps(result_obj)
 
         except Exception as e:
-            error_message = str(e)
-            if event_emitter:
-                await event_emitter.emit_status(f"获取问题类型列表失败: {error_message}", True, True)
-
-            error_response = {"error": f"获取问题类型失败: {error_message}"}
-            return json.dumps(error_response, ensure_ascii=False)
+            return await self._error_result(event_emitter, "获取问题类型列表失败", "获取问题类型失败", e)
 
-    async def jira_get_issue_changelog(self, issue_key: str, start_at: int = 0, max_results: int = 50, __user__: dict = {}, __event_emitter__: Callable[[dict], Awaitable[None]] = None) -> str:
+    async def jira_get_issue_changelog(self, issue_key: str, start_at: int = 0, max_results: int = 50, __user__: Optional[dict] = None, __event_emitter__: Callable[[dict], Awaitable[None]] = None) -> str:
         """
         获取问题的变更历史记录
 
@@ -1174,27 +2033,28 @@ class Tools:
         :param max_results: 最大结果数
         :return: 变更历史记录 JSON 字符串
         """
-        event_emitter = None
-        if __event_emitter__:
-            event_emitter = EventEmitter(__event_emitter__)
-            await event_emitter.emit_status(f"正在获取问题 {issue_key} 的变更历史", False)
+        event_emitter = BufferedEventEmitter(__event_emitter__) if __event_emitter__ else _NULL_EMITTER
+        await event_emitter.emit_status(f"正在获取问题 {issue_key} 的变更历史", False)
 
         try:
+            invalid_result = await self._invalid_keys_result(event_emitter, (issue_key,))
+            if invalid_result:
+                return invalid_result
+
             params = {
                 "startAt": start_at,
                 "maxResults": max_results,
                 "expand": "changelog"
             }
 
-            result = self._make_jira_request("GET", f"/issue/{issue_key}", __user__, params=params)
+            result_obj = await self._make_jira_request("GET", f"/issue/{issue_key}", __user__, params=params)
 
             if event_emitter:
-                result_obj = json.loads(result)
-                if "error" in result_obj:
+                if _is_error(result_obj):
                     await event_emitter.emit_status(f"获取变更历史失败: {result_obj['error']}", True, True)
                 else:
-                    changelog = result_obj.get("changelog", {}).get("histories", [])
-                    issue_url = f"{self._get_jira_server()}/browse/{issue_key}"
+                    changelog = (result_obj.get("changelog") or _EMPTY_FIELDS).get("histories") or []
+                    issue_url = self._browse_url(issue_key)
 
                     if not changelog:
                         await event_emitter.emit_message(f"""
@@ -1203,82 +2063,47 @@ class Tools:
 问题 [{issue_key}]({issue_url}) 没有变更历史记录
 """)
                     else:
-                        # 提取每个变更的关键信息
-                        change_log_items = []
-                        for history in changelog:
-                            author = history.get("author", {}).get("displayName", "未知用户")
-                            created = history.get("created", "")
-                            items = history.get("items", [])
-
-                            changes = []
-                            for item in items:
-                                field = item.get("field", "")
-                                from_value = item.get("fromString", "")
-                                to_value = item.get("toString", "")
-                                changes.append(f"{field}: {from_value} → {to_value}")
-
-                            change_log_items.append({
-                                "author": author,
-                                "created": created,
-                                "changes": changes
-                            })
-
-                        # 格式化变更历史记录
-                        history_text = ""
-                        for i, change in enumerate(change_log_items, 1):
-                            history_text += f"""
-#### 变更 {i}/{len(change_log_items)}
-**操作人:** {change['author']}
-**时间:** {change['created']}
-**变更内容:**
-"""
-                            for change_item in change["changes"]:
-                                history_text += f"- {change_item}\n"
-
-                            history_text += "\n---\n"
+                        history_count = len(changelog)
+                        history_text = "".join(_iter_changelog_markdown(changelog))
 
                         await event_emitter.emit_message(f"""
 ### 📝 问题变更历史
 
-问题 [{issue_key}]({issue_url}) 的变更历史 (共 {len(change_log_items)} 条记录):
+问题 [{issue_key}]({issue_url}) 的变更历史 (共 {history_count} 条记录):
 {history_text}
 """)
 
                     await event_emitter.emit_status(f"已获取问题 {issue_key} 的变更历史", True)
 
-            return result
+            return _json_dumps(result_obj)
 
         except Exception as e:
-            error_message = str(e)
-            if event_emitter:
-                await event_emitter.emit_status(f"获取变更历史失败: {error_message}", True, True)
-
-            error_response = {"error": f"获取问题变更历史失败: {error_message}"}
-            return json.dumps(error_response, ensure_ascii=False)
+            return await self._error_result(event_emitter, "获取变更历史失败", "获取问题变更历史失败", e)
 
-    async def jira_get_issue_links(self, issue_key: str, __user__: dict = {}, __event_emitter__: Callable[[dict], Awaitable[None]] = None) -> str:
+    async def jira_get_issue_links(self, issue_key: str, __user__: Optional[dict] = None, __event_emitter__: Callable[[dict], Awaitable[None]] = None) -> str:
         """
         获取问题的链接关系
 
         :param issue_key: 问题的键值，例如 PROJECT-123
         :return: 问题链接关系 JSON 字符串
         """
-        event_emitter = None
-        if __event_emitter__:
-            event_emitter = EventEmitter(__event_emitter__)
-            await event_emitter.emit_status(f"正在获取问题 {issue_key} 的链接关系", False)
+        event_emitter = BufferedEventEmitter(__event_emitter__) if __event_emitter__ else _NULL_EMITTER
+        await event_emitter.emit_status(f"正在获取问题 {issue_key} 的链接关系", False)
 
         try:
+            invalid_result = await self._invalid_keys_result(event_emitter, (issue_key,))
+            if invalid_result:
+                return invalid_result
+
             # 通过获取问题详情来获取问题链接
-            result = self._make_jira_request("GET", f"/issue/{issue_key}?fields=issuelinks", __user__)
+            result_obj = await self._make_jira_request("GET", f"/issue/{issue_key}?fields=issuelinks", __user__)
 
             if event_emitter:
-                result_obj = json.loads(result)
-                if "error" in result_obj:
+                if _is_error(result_obj):
                     await event_emitter.emit_status(f"获取问题链接失败: {result_obj['error']}", True, True)
                 else:
-                    links = result_obj.get("fields", {}).get("issuelinks", [])
-                    issue_url = f"{self._get_jira_server()}/browse/{issue_key}"
+                    links = (result_obj.get("fields") or _EMPTY_FIELDS).get("issuelinks") or []
+                    issue_url = self._browse_url(issue_key)
 
                     if not links:
                         await event_emitter.emit_message(f"""
@@ -1289,26 +2114,27 @@ class Tools:
                     else:
                         # 准备表格数据
                         rows = []
+                        browse_prefix = self._browse_prefix()
                         for link in links:
-                            link_type = link.get("type", {}).get("name", "未知关系")
-                            inward_desc = link.get("type", {}).get("inward", "")
-                            outward_desc = link.get("type", {}).get("outward", "")
+                            link_type_info = link.get("type") or _EMPTY_FIELDS
+                            link_type = link_type_info.get("name", "未知关系")
 
                             if "inwardIssue" in link:
                                 direction = "入向"
                                 related_issue = link["inwardIssue"]
-                                relationship = inward_desc
+                                relationship = link_type_info.get("inward", "")
                             elif "outwardIssue" in link:
                                 direction = "出向"
                                 related_issue = link["outwardIssue"]
-                                relationship = outward_desc
+                                relationship = link_type_info.get("outward", "")
                             else:
                                 continue
 
                             related_key = related_issue.get("key", "")
-                            related_summary = related_issue.get("fields", {}).get("summary", "")
-                            related_status = related_issue.get("fields", {}).get("status", {}).get("name", "")
-                            related_url = f"{self._get_jira_server()}/browse/{related_key}"
+                            related_fields = related_issue.get("fields") or _EMPTY_FIELDS
+                            related_summary = related_fields.get("summary", "")
+                            related_status = (related_fields.get("status") or _EMPTY_FIELDS).get("name", "")
+                            related_url = browse_prefix + related_key
 
                             link_text = f"[{related_key}]({related_url})"
                             rows.append([link_type, relationship, link_text, related_summary, related_status])
@@ -1321,17 +2147,12 @@ class Tools:
 
                     await event_emitter.emit_status(f"已获取问题 {issue_key} 的链接关系", True)
 
-            return result
+            return _json_dumps(result_obj)
 
         except Exception as e:
-            error_message = str(e)
-            if event_emitter:
-                await event_emitter.emit_status(f"获取问题链接失败: {error_message}", True, True)
+            return await self._error_result(event_emitter, "获取问题链接失败", "获取问题链接失败", e)
 
-            error_response = {"error": f"获取问题链接失败: {error_message}"}
-            return json.dumps(error_response, ensure_ascii=False)
-
-    async def jira_create_issue_link(self, link_type: str, inward_issue: str, outward_issue: str, comment: str = None, __user__: dict = {}, __event_emitter__: Callable[[dict], Awaitable[None]] = None) -> str:
+    async def jira_create_issue_link(self, link_type: str, inward_issue: str, outward_issue: str, comment: str = None, __user__: Optional[dict] = None, __event_emitter__: Callable[[dict], Awaitable[None]] = None) -> str:
         """
         创建问题链接关系
 
@@ -1341,12 +2162,14 @@ class Tools:
         :param comment: 可选的评论内容
         :return: 创建链接操作结果 JSON 字符串
         """
-        event_emitter = None
-        if __event_emitter__:
-            event_emitter = EventEmitter(__event_emitter__)
-            await event_emitter.emit_status(f"正在创建问题 {outward_issue} 到 {inward_issue} 的链接关系", False)
+        event_emitter = BufferedEventEmitter(__event_emitter__) if __event_emitter__ else _NULL_EMITTER
+        await event_emitter.emit_status(f"正在创建问题 {outward_issue} 到 {inward_issue} 的链接关系", False)
 
         try:
+            invalid_result = await self._invalid_keys_result(event_emitter, (inward_issue, outward_issue))
+            if invalid_result:
+                return invalid_result
+
             data = {
                 "type": {
                     "name": link_type
@@ -1360,33 +2183,18 @@ class Tools:
             }
 
             if comment:
-                data["comment"] = {
-                    "body": {
-                        "type": "doc",
-                        "version": 1,
-                        "content": [
-                            {
-                                "type": "paragraph",
-                                "content": [
-                                    {
-                                        "type": "text",
-                                        "text": comment
-                                    }
-                                ]
-                            }
-                        ]
-                    }
-                }
+                data["comment"] = {"body": _adf_paragraph(comment)}
 
-            result = self._make_jira_request("POST", "/issueLink", __user__, data=data)
+            result_obj = await self._make_jira_request("POST", "/issueLink", __user__, data=data)
+            if not _is_error(result_obj):
+                self._invalidate_issue_cache(inward_issue, outward_issue)
 
             if event_emitter:
-                result_obj = json.loads(result)
-                if "error" in result_obj:
+                if _is_error(result_obj):
                     await event_emitter.emit_status(f"创建问题链接失败: {result_obj['error']}", True, True)
                 else:
-                    inward_url = f"{self._get_jira_server()}/browse/{inward_issue}"
-                    outward_url = f"{self._get_jira_server()}/browse/{outward_issue}"
+                    inward_url = self._browse_url(inward_issue)
+                    outward_url = self._browse_url(outward_issue)
 
                     await event_emitter.emit_message(f"""
 ### 🔗 问题链接创建成功
@@ -1401,34 +2209,26 @@ class Tools:
 
                     await event_emitter.emit_status("问题链接创建成功", True)
 
-            return result
+            return _json_dumps(result_obj)
 
         except Exception as e:
-            error_message = str(e)
-            if event_emitter:
-                await event_emitter.emit_status(f"创建问题链接失败: {error_message}", True, True)
-
-            error_response = {"error": f"创建问题链接失败: {error_message}"}
-            return json.dumps(error_response, ensure_ascii=False)
+            return await self._error_result(event_emitter, "创建问题链接失败", "创建问题链接失败", e)
 
-    async def jira_delete_issue_link(self, link_id: str, __user__: dict = {}, __event_emitter__: Callable[[dict], Awaitable[None]] = None) -> str:
+    async def jira_delete_issue_link(self, link_id: str, __user__: Optional[dict] = None, __event_emitter__: Callable[[dict], Awaitable[None]] = None) -> str:
         """
         删除问题链接关系
 
         :param link_id: 链接ID
         :return: 删除链接操作结果 JSON 字符串
         """
-        event_emitter = None
-        if __event_emitter__:
-            event_emitter = EventEmitter(__event_emitter__)
-            await event_emitter.emit_status(f"正在删除问题链接 {link_id}", False)
+        event_emitter = BufferedEventEmitter(__event_emitter__) if __event_emitter__ else _NULL_EMITTER
+        await event_emitter.emit_status(f"正在删除问题链接 {link_id}", False)
 
         try:
-            result = self._make_jira_request("DELETE", f"/issueLink/{link_id}", __user__)
+            result_obj = await self._make_jira_request("DELETE", f"/issueLink/{link_id}", __user__)
 
             if event_emitter:
-                result_obj = json.loads(result)
-                if "error" in result_obj:
+                if _is_error(result_obj):
                     await event_emitter.emit_status(f"删除问题链接失败: {result_obj['error']}", True, True)
                 else:
                     await event_emitter.emit_message(f"""
@@ -1438,33 +2238,25 @@ class Tools:
 """)
                     await event_emitter.emit_status("问题链接删除成功", True)
 
-            return result
+            return _json_dumps(result_obj)
 
         except Exception as e:
-            error_message = str(e)
-            if event_emitter:
-                await event_emitter.emit_status(f"删除问题链接失败: {error_message}", True, True)
-
-            error_response = {"error": f"删除问题链接失败: {error_message}"}
-            return json.dumps(error_response, ensure_ascii=False)
+            return await self._error_result(event_emitter, "删除问题链接失败", "删除问题链接失败", e)
 
-    async def jira_get_priorities(self, __user__: dict = {}, __event_emitter__: Callable[[dict], Awaitable[None]] = None) -> str:
+    async def jira_get_priorities(self, __user__: Optional[dict] = None, __event_emitter__: Callable[[dict], Awaitable[None]] = None) -> str:
         """
         获取所有问题优先级
 
         :return: 优先级列表 JSON 字符串
         """
-        event_emitter = None
-        if __event_emitter__:
-            event_emitter = EventEmitter(__event_emitter__)
-            await event_emitter.emit_status("正在获取问题优先级列表", False)
+        event_emitter = BufferedEventEmitter(__event_emitter__) if __event_emitter__ else _NULL_EMITTER
+        await event_emitter.emit_status("正在获取问题优先级列表", False)
 
         try:
-            result = self._make_jira_request("GET", "/priority", __user__)
+            result_obj = await self._make_jira_request("GET", "/priority", __user__)
 
             if event_emitter:
-                result_obj = json.loads(result)
-                if "error" in result_obj:
+                if _is_error(result_obj):
                     await event_emitter.emit_status(f"获取优先级列表失败: {result_obj['error']}", True, True)
                 else:
                     priorities = result_obj
@@ -1472,14 +2264,10 @@ class Tools:
                         await event_emitter.emit_message("未找到任何优先级")
                     else:
                         # 准备表格数据
-                        rows = []
-                        for priority in priorities:
-                            id = priority.get("id", "")
-                            name = priority.get("name", "")
-                            description = priority.get("description", "无描述")
-                            icon_url = priority.get("iconUrl", "")
-
-                            rows.append([id, name, description])
+                        rows = [
+                            [priority.get("id", ""), priority.get("name", ""), priority.get("description", "无描述")]
+                            for priority in priorities
+                        ]
 
                         await event_emitter.emit_table(
                             ["ID", "名称", "描述"],
@@ -1489,33 +2277,25 @@ class Tools:
 
                     await event_emitter.emit_status("优先级列表获取完成", True)
 
-            return result
+            return _json_dumps(result_obj)
 
         except Exception as e:
-            error_message = str(e)
-            if event_emitter:
-                await event_emitter.emit_status(f"获取优先级列表失败: {error_message}", True, True)
+            return await self._error_result(event_emitter, "获取优先级列表失败", "获取问题优先级失败", e)
 
-            error_response = {"error": f"获取问题优先级失败: {error_message}"}
-            return json.dumps(error_response, ensure_ascii=False)
-
-    async def jira_get_statuses(self, __user__: dict = {}, __event_emitter__: Callable[[dict], Awaitable[None]] = None) -> str:
+    async def jira_get_statuses(self, __user__: Optional[dict] = None, __event_emitter__: Callable[[dict], Awaitable[None]] = None) -> str:
         """
         获取所有问题状态
 
         :return: 状态列表 JSON 字符串
         """
-        event_emitter = None
-        if __event_emitter__:
-            event_emitter = EventEmitter(__event_emitter__)
-            await event_emitter.emit_status("正在获取问题状态列表", False)
+        event_emitter = BufferedEventEmitter(__event_emitter__) if __event_emitter__ else _NULL_EMITTER
+        await event_emitter.emit_status("正在获取问题状态列表", False)
 
         try:
-            result = self._make_jira_request("GET", "/status", __user__)
+            result_obj = await self._make_jira_request("GET", "/status", __user__)
 
             if event_emitter:
-                result_obj = json.loads(result)
-                if "error" in result_obj:
+                if _is_error(result_obj):
                     await event_emitter.emit_status(f"获取状态列表失败: {result_obj['error']}", True, True)
                 else:
                     statuses = result_obj
@@ -1523,14 +2303,15 @@ class Tools:
                         await event_emitter.emit_message("未找到任何状态")
                     else:
                         # 准备表格数据
-                        rows = []
-                        for status in statuses:
-                            id = status.get("id", "")
-                            name = status.get("name", "")
-                            description = status.get("description", "无描述")
-                            category = status.get("statusCategory", {}).get("name", "")
-
-                            rows.append([id, name, category, description])
+                        rows = [
+                            [
+                                status.get("id", ""),
+                                status.get("name", ""),
+                                (status.get("statusCategory") or _EMPTY_FIELDS).get("name", ""),
+                                status.get("description", "无描述"),
+                            ]
+                            for status in statuses
+                        ]
 
                         await event_emitter.emit_table(
                             ["ID", "名称", "类别", "描述"],
@@ -1540,33 +2321,25 @@ class Tools:
 
                     await event_emitter.emit_status("状态列表获取完成", True)
 
-            return result
+            return _json_dumps(result_obj)
 
         except Exception as e:
-            error_message = str(e)
-            if event_emitter:
-                await event_emitter.emit_status(f"获取状态列表失败: {error_message}", True, True)
-
-            error_response = {"error": f"获取问题状态失败: {error_message}"}
-            return json.dumps(error_response, ensure_ascii=False)
+            return await self._error_result(event_emitter, "获取状态列表失败", "获取问题状态失败", e)
 
-    async def jira_get_resolutions(self, __user__: dict = {}, __event_emitter__: Callable[[dict], Awaitable[None]] = None) -> str:
+    async def jira_get_resolutions(self, __user__: Optional[dict] = None, __event_emitter__: Callable[[dict], Awaitable[None]] = None) -> str:
         """
         获取所有问题解决结果
 
         :return: 解决结果列表 JSON 字符串
         """
-        event_emitter = None
-        if __event_emitter__:
-            event_emitter = EventEmitter(__event_emitter__)
-            await event_emitter.emit_status("正在获取问题解决结果列表", False)
+        event_emitter = BufferedEventEmitter(__event_emitter__) if __event_emitter__ else _NULL_EMITTER
+        await event_emitter.emit_status("正在获取问题解决结果列表", False)
 
         try:
-            result = self._make_jira_request("GET", "/resolution", __user__)
+            result_obj = await self._make_jira_request("GET", "/resolution", __user__)
 
             if event_emitter:
-                result_obj = json.loads(result)
-                if "error" in result_obj:
+                if _is_error(result_obj):
                     await event_emitter.emit_status(f"获取解决结果列表失败: {result_obj['error']}", True, True)
                 else:
                     resolutions = result_obj
@@ -1574,13 +2347,10 @@ class Tools:
                         await event_emitter.emit_message("未找到任何解决结果")
                     else:
                         # 准备表格数据
-                        rows = []
-                        for resolution in resolutions:
-                            id = resolution.get("id", "")
-                            name = resolution.get("name", "")
-                            description = resolution.get("description", "无描述")
-
-                            rows.append([id, name, description])
+                        rows = [
+                            [resolution.get("id", ""), resolution.get("name", ""), resolution.get("description", "无描述")]
+                            for resolution in resolutions
+                        ]
 
                         await event_emitter.emit_table(
                             ["ID", "名称", "描述"],
@@ -1590,89 +2360,134 @@ class Tools:
 
                     await event_emitter.emit_status("解决结果列表获取完成", True)
 
-            return result
+            return _json_dumps(result_obj)
 
         except Exception as e:
-            error_message = str(e)
-            if event_emitter:
-                await event_emitter.emit_status(f"获取解决结果列表失败: {error_message}", True, True)
+            return await self._error_result(event_emitter, "获取解决结果列表失败", "获取问题解决结果失败", e)
 
-            error_response = {"error": f"获取问题解决结果失败: {error_message}"}
-            return json.dumps(error_response, ensure_ascii=False)
-
-    async def jira_get_worklogs(self, issue_key: str, start_at: int = 0, max_results: int = 50, __user__: dict = {}, __event_emitter__: Callable[[dict], Awaitable[None]] = None) -> str:
+    async def jira_get_worklogs(self, issue_key: str, start_at: int = 0, max_results: int = 100, batch_size: int = None, __user__: Optional[dict] = None, __event_emitter__: Callable[[dict], Awaitable[None]] = None) -> str:
         """
         获取问题的工作日志
 
         :param issue_key: 问题的键值，例如 PROJECT-123
         :param start_at: 起始索引
         :param max_results: 最大结果数
+        :param batch_size: 每批获取的数量 (可选)；提供时忽略 max_results，按批并发获取从 start_at 开始的全部工作日志 (最多 1000 条)
         :return: 工作日志列表 JSON 字符串
         """
-        event_emitter = None
-        if __event_emitter__:
-            event_emitter = EventEmitter(__event_emitter__)
-            await event_emitter.emit_status(f"正在获取问题 {issue_key} 的工作日志", False)
+        event_emitter = BufferedEventEmitter(__event_emitter__) if __event_emitter__ else _NULL_EMITTER
+        await event_emitter.emit_status(f"正在获取问题 {issue_key} 的工作日志", False)
 
         try:
+            invalid_result = await self._invalid_keys_result(event_emitter, (issue_key,))
+            if invalid_result:
+                return invalid_result
+
             params = {
                 "startAt": start_at,
-                "maxResults": max_results
+                "maxResults": batch_size or max_results
             }
 
-            result = self._make_jira_request("GET", f"/issue/{issue_key}/worklog", __user__, params=params)
+            endpoint = f"/issue/{issue_key}/worklog"
+            result_obj = await self._make_jira_request("GET", endpoint, __user__, params=params)
+            if batch_size and not _is_error(result_obj):
+                result_obj = await self._fetch_remaining_pages(endpoint, params, result_obj, "worklogs", __user__, method="GET")
 
             if event_emitter:
-                result_obj = json.loads(result)
-                if "error" in result_obj:
+                if _is_error(result_obj):
                     await event_emitter.emit_status(f"获取工作日志失败: {result_obj['error']}", True, True)
                 else:
                     worklogs = result_obj.get("worklogs", [])
+                    worklog_count = len(worklogs)
                     total = result_obj.get("total", 0)
-                    issue_url = f"{self._get_jira_server()}/browse/{issue_key}"
 
-                    if not worklogs:
-                        await event_emitter.emit_message(f"""
-### 📋 问题工作日志
-
-问题 [{issue_key}]({issue_url}) 没有工作日志
-""")
+                    if not worklog_count:
+                        await event_emitter.emit_message(_WORKLOG_EMPTY_TPL.format_map({"key": issue_key, "url": self._browse_url(issue_key)}))
                     else:
-                        # 准备表格数据
-                        rows = []
-                        for worklog in worklogs:
-                            id = worklog.get("id", "")
-                            author = worklog.get("author", {}).get("displayName", "未知用户")
-                            time_spent = worklog.get("timeSpent", "0m")
-                            description = worklog.get("description", "无描述")
-                            created = worklog.get("created", "")
-
-                            rows.append([id, author, time_spent, description, created])
-
                         # 显示分页信息
-                        start = start_at + 1
-                        end = min(start_at + len(worklogs), total)
-                        pagination = f"显示 {start} 到 {end}，共 {total} 个结果"
-
-                        await event_emitter.emit_table(
-                            ["ID", "作者", "花费时间", "描述", "创建时间"],
-                            rows,
-                            f"问题 {issue_key} 的工作日志: {pagination}"
+                        pagination = f"显示 {start_at + 1} 到 {min(start_at + worklog_count, total)}，共 {total} 个结果"
+
+                        # 逐行生成表格数据，每行格式化后即可释放，不保留完整的行列表
+                        await event_emitter.emit_table_chunked(
+                            _WORKLOG_HEADERS,
+                            (self._worklog_row(worklog) for worklog in worklogs),
+                            f"问题 {issue_key} 的工作日志: {pagination}",
+                            self.TABLE_CHUNK_ROWS
                         )
 
                     await event_emitter.emit_status(f"已获取问题 {issue_key} 的工作日志", True)
 
-            return result
+            return _json_dumps(result_obj)
 
         except Exception as e:
-            error_message = str(e)
+            return await self._error_result(event_emitter, "获取工作日志失败", "获取问题工作日志失败", e)
+
+    async def jira_get_worklogs_many(self, issue_keys: str, max_results: int = 50, __user__: Optional[dict] = None, __event_emitter__: Callable[[dict], Awaitable[None]] = None) -> str:
+        """
+        并发获取多个问题的工作日志
+
+        :param issue_keys: 问题键值列表，逗号分隔，例如 "PROJECT-1,PROJECT-2"
+        :param max_results: 每个问题的最大结果数
+        :return: 以问题键值为键的工作日志 JSON 字符串
+        """
+        event_emitter = BufferedEventEmitter(__event_emitter__) if __event_emitter__ else _NULL_EMITTER
+        await event_emitter.emit_status(f"正在批量获取工作日志: {issue_keys}", False)
+
+        try:
+            keys = list(dict.fromkeys(key.strip() for key in issue_keys.split(",") if key.strip()))
+            if not keys:
+                error_message = "未提供任何问题键值"
+                await event_emitter.emit_status(error_message, True, True)
+                return _json_error(error_message)
+
+            invalid_result = await self._invalid_keys_result(event_emitter, keys)
+            if invalid_result:
+                return invalid_result
+
+            params = {
+                "startAt": 0,
+                "maxResults": max_results
+            }
+            specs = [("GET", f"/issue/{key}/worklog", params, None) for key in keys]
+            results = await self._gather_requests(specs, __user__)
+
+            result_obj = {}
+            for key, result in zip(keys, results):
+                if isinstance(result, Exception):
+                    result = {"error": f"获取问题 {key} 工作日志失败: {str(result)}"}
+                result_obj[key] = result
+
             if event_emitter:
-                await event_emitter.emit_status(f"获取工作日志失败: {error_message}", True, True)
+                browse_prefix = self._browse_prefix()
+                rows = []
+                failed = []
+                for key, result in result_obj.items():
+                    if _is_error(result):
+                        failed.append(key)
+                        continue
+                    link = f"[{key}]({browse_prefix}{key})"
+                    rows.extend([link, *self._worklog_row(worklog)] for worklog in result.get("worklogs", []))
+
+                if rows:
+                    await event_emitter.emit_table(
+                        _WORKLOG_MANY_HEADERS,
+                        rows,
+                        f"{len(keys)} 个问题的工作日志 (共 {len(rows)} 条)"
+                    )
+                else:
+                    await event_emitter.emit_message("未找到任何工作日志")
 
-            error_response = {"error": f"获取问题工作日志失败: {error_message}"}
-            return json.dumps(error_response, ensure_ascii=False)
+                if failed:
+                    await event_emitter.emit_message(f"⚠️ {len(failed)} 个问题的工作日志获取失败: {', '.join(failed)}")
+
+                await event_emitter.emit_status(f"已获取 {len(keys) - len(failed)} 个问题的工作日志", True)
+
+            return _json_dumps(result_obj)
+
+        except Exception as e:
+            return await self._error_result(event_emitter, "批量获取工作日志失败", "批量获取问题工作日志失败", e)
 
-    async def jira_add_worklog(self, issue_key: str, time_spent: str, description: str = None, __user__: dict = {}, __event_emitter__: Callable[[dict], Awaitable[None]] = None) -> str:
+    async def jira_add_worklog(self, issue_key: str, time_spent: str, description: str = None, __user__: Optional[dict] = None, __event_emitter__: Callable[[dict], Awaitable[None]] = None) -> str:
         """
         添加工作日志到问题
 
@@ -1681,12 +2496,14 @@ class Tools:
         :param description: 工作日志描述 (可选)
         :return: 创建的工作日志信息 JSON 字符串
         """
-        event_emitter = None
-        if __event_emitter__:
-            event_emitter = EventEmitter(__event_emitter__)
-            await event_emitter.emit_status(f"正在向问题 {issue_key} 添加工作日志", False)
+        event_emitter = BufferedEventEmitter(__event_emitter__) if __event_emitter__ else _NULL_EMITTER
+        await event_emitter.emit_status(f"正在向问题 {issue_key} 添加工作日志", False)
 
         try:
+            invalid_result = await self._invalid_keys_result(event_emitter, (issue_key,))
+            if invalid_result:
+                return invalid_result
+
             data = {
                 "timeSpent": time_spent
             }
@@ -1694,37 +2511,33 @@ class Tools:
             if description:
                 data["description"] = description
 
-            result = self._make_jira_request("POST", f"/issue/{issue_key}/worklog", __user__, data=data)
+            # 不展示结果时无需解析响应体，直接原样返回
+            result_obj = await self._make_jira_request("POST", f"/issue/{issue_key}/worklog", __user__, data=data, parse=bool(event_emitter))
+            if not _is_error(result_obj):
+                self._invalidate_issue_cache(issue_key)
 
             if event_emitter:
-                result_obj = json.loads(result)
-                if "error" in result_obj:
+                if _is_error(result_obj):
                     await event_emitter.emit_status(f"添加工作日志失败: {result_obj['error']}", True, True)
                 else:
                     worklog_id = result_obj.get("id", "")
-                    issue_url = f"{self._get_jira_server()}/browse/{issue_key}"
-
-                    await event_emitter.emit_message(f"""
-### 📋 工作日志已添加
-
-成功添加工作日志到问题 [{issue_key}]({issue_url})
-**工作日志 ID:** {worklog_id}
-**花费时间:** {time_spent}
-**描述:** {description if description else "无"}
-""")
+                    issue_url = self._browse_url(issue_key)
+
+                    await event_emitter.emit_message(_WORKLOG_ADDED_TPL.format_map({
+                        "key": issue_key,
+                        "url": issue_url,
+                        "worklog_id": worklog_id,
+                        "time_spent": time_spent,
+                        "description": description or "无",
+                    }))
                     await event_emitter.emit_status(f"工作日志已添加到问题 {issue_key}", True)
 
-            return result
+            return result_obj if isinstance(result_obj, str) else _json_dumps(result_obj)
 
         except Exception as e:
-            error_message = str(e)
-            if event_emitter:
-                await event_emitter.emit_status(f"添加工作日志失败: {error_message}", True, True)
+            return await self._error_result(event_emitter, "添加工作日志失败", "添加工作日志失败", e)
 
-            error_response = {"error": f"添加工作日志失败: {error_message}"}
-            return json.dumps(error_response, ensure_ascii=False)
-
-    async def jira_update_worklog(self, worklog_id: str, time_spent: str = None, description: str = None, __user__: dict = {}, __event_emitter__: Callable[[dict], Awaitable[None]] = None) -> str:
+    async def jira_update_worklog(self, worklog_id: str, time_spent: str = None, description: str = None, __user__: Optional[dict] = None, __event_emitter__: Callable[[dict], Awaitable[None]] = None) -> str:
         """
         更新工作日志
 
@@ -1733,50 +2546,42 @@ class Tools:
         :param description: 新的描述 (可选)
         :return: 更新的工作日志信息 JSON 字符串
         """
-        event_emitter = None
-        if __event_emitter__:
-            event_emitter = EventEmitter(__event_emitter__)
-            await event_emitter.emit_status(f"正在更新工作日志 {worklog_id}", False)
+        event_emitter = BufferedEventEmitter(__event_emitter__) if __event_emitter__ else _NULL_EMITTER
+        await event_emitter.emit_status(f"正在更新工作日志 {worklog_id}", False)
 
         try:
+            if not time_spent and not description:
+                await event_emitter.emit_status(_NO_UPDATE_FIELDS_MESSAGE, True, True)
+                return _NO_UPDATE_FIELDS_JSON
+
             data = {}
             if time_spent:
                 data["timeSpent"] = time_spent
             if description:
                 data["description"] = description
 
-            if not data:
-                error_message = "未提供任何要更新的字段"
-                if event_emitter:
-                    await event_emitter.emit_status(error_message, True, True)
-                return json.dumps({"error": error_message}, ensure_ascii=False)
-
-            result = self._make_jira_request("PUT", f"/issue/worklog/{worklog_id}", __user__, data=data)
+            # 不展示结果时无需解析响应体，直接原样返回
+            result_obj = await self._make_jira_request("PUT", f"/issue/worklog/{worklog_id}", __user__, data=data, parse=bool(event_emitter))
+            if not _is_error(result_obj):
+                self._invalidate_worklog_cache()
 
             if event_emitter:
-                result_obj = json.loads(result)
-                if "error" in result_obj:
+                if _is_error(result_obj):
                     await event_emitter.emit_status(f"更新工作日志失败: {result_obj['error']}", True, True)
                 else:
                     issue_key = result_obj.get("issueId", "")
-                    issue_url = f"{self._get_jira_server()}/browse/{issue_key}"
-
-                    await event_emitter.emit_message(f"""
-### 📋 工作日志已更新
-
-工作日志 {worklog_id} 已成功更新
-**问题:** [{issue_key}]({issue_url})
-**新的花费时间:** {time_spent if time_spent else "无变化"}
-**新的描述:** {description if description else "无变化"}
-""")
+                    issue_url = self._browse_url(issue_key)
+
+                    await event_emitter.emit_message(_WORKLOG_UPDATED_TPL.format_map({
+                        "key": issue_key,
+                        "url": issue_url,
+                        "worklog_id": worklog_id,
+                        "time_spent": time_spent or "无变化",
+                        "description": description or "无变化",
+                    }))
                     await event_emitter.emit_status(f"工作日志 {worklog_id} 更新成功", True)
 
-            return result
+            return result_obj if isinstance(result_obj, str) else _json_dumps(result_obj)
 
         except Exception as e:
-            error_message = str(e)
-            if event_emitter:
-                await event_emitter.emit_status(f"更新工作日志失败: {error_message}", True, True)
-
-            error_response = {"error": f"更新工作日志失败: {error_message}"}
-            return json.dumps(error_response, ensure_ascii=False)
+            return await self._error_result(event_emitter, "更新工作日志失败", "更新工作日志失败", e)
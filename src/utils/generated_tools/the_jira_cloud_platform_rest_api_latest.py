@@ -5,16 +5,21 @@ repository: https://github.com/your-username/open-webui-tools
 author: @your-username
 author_url: https://github.com/your-username
 version: 1001.0.0-SNAPSHOT-b5a48ff2c26218961680e8ef4b61f08fac3c4942
+requirements: aiohttp
 changelog:
   - 1001.0.0-SNAPSHOT-b5a48ff2c26218961680e8ef4b61f08fac3c4942: Initial version
 """
 
-import requests
+import asyncio
 import json
 import os
-from typing import Dict, List, Any, Optional, Union, Callable, Awaitable
+from typing import TYPE_CHECKING, Dict, List, Any, Optional, Union, Callable, Awaitable
 from pydantic import BaseModel, Field, field_validator
 
+# aiohttp is imported on the first request; the annotation-only import keeps type hints intact
+if TYPE_CHECKING:
+    import aiohttp
+
 
 class EventEmitter:
     def __init__(self, event_emitter: Callable[[dict], Awaitable[None]]):
@@ -144,6 +149,9 @@ class Tools:
         self._base_path = ""
         self._default_scheme = "https"
         self._host = ""
+        # Shared HTTP session, created lazily on the running event loop
+        self._http_session: Optional["aiohttp.ClientSession"] = None
+        self._http_session_loop: Optional[asyncio.AbstractEventLoop] = None
 
     class UserValves(BaseModel):
         user_token: str = Field(
@@ -189,11 +197,74 @@ class Tools:
             return self.valves.base_url
         raise ValueError("API server address must be set in tool configuration")
 
-    def _make_api_request(self, method: str, endpoint: str, __user__: dict = {}, data: Dict[str, Any] = None, params: Dict[str, Any] = None) -> str:
+    async def _get_http_session(self) -> "aiohttp.ClientSession":
+        """
+        Get the shared aiohttp session, creating it on the running event loop when needed
+
+        Reusing one session keeps connections alive between calls instead of opening a new
+        TCP/TLS connection per request. A session left over from a previous event loop is
+        closed before it is replaced.
+        """
+        loop = asyncio.get_running_loop()
+        if (
+            self._http_session is None
+            or self._http_session.closed
+            or self._http_session_loop is not loop
+        ):
+            import aiohttp
+
+            await self._aclose()
+
+            self._http_session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=100, limit_per_host=20, keepalive_timeout=60),
+                headers={
+                    "Content-Type": "application/json",
+                    "Accept": "application/json"
+                },
+            )
+            self._http_session_loop = loop
+        return self._http_session
+
+    async def _aclose(self) -> None:
+        """
+        Close the shared aiohttp session and release its connections
+
+        Underscore-prefixed so Open WebUI does not expose it as a tool. The next request
+        creates a new session.
+        """
+        session, self._http_session = self._http_session, None
+        self._http_session_loop = None
+        if session is None or session.closed:
+            return
+        try:
+            await session.close()
+        except Exception:
+            # The session's event loop is already closed; detach the connector and mark it closed
+            session.detach()
+
+    @staticmethod
+    def _query_items(params: Optional[Dict[str, Any]]) -> List[tuple]:
+        """
+        Convert query parameters to (name, value) pairs accepted by aiohttp
+
+        Lists become repeated parameters and booleans become "true"/"false".
+        """
+        items = []
+        for name, value in (params or {}).items():
+            values = value if isinstance(value, (list, tuple)) else [value]
+            for item in values:
+                if item is None:
+                    continue
+                if isinstance(item, bool):
+                    item = "true" if item else "false"
+                items.append((name, str(item)))
+        return items
+
+    async def _make_api_request(self, method: str, endpoint: str, __user__: dict = {}, data: Dict[str, Any] = None, params: Dict[str, Any] = None) -> str:
         """
-        Send a request to the API
+        Send a request to the API without blocking the event loop
 
-        :param method: HTTP method (GET, POST, PUT, DELETE)
+        :param method: HTTP method (GET, POST, PUT, DELETE, PATCH)
         :param endpoint: API endpoint path
         :param __user__: User information dictionary
         :param data: Request body data dictionary
@@ -204,49 +275,38 @@ class Tools:
         if not token:
             raise ValueError("API token not found. Please add your token in user settings.")
 
+        method_upper = method.upper()
+        if method_upper not in ("GET", "POST", "PUT", "DELETE", "PATCH"):
+            raise ValueError(f"Unsupported request method: {method}")
+
+        import aiohttp
+
         # Get API server address
         server_url = self._get_api_server()
 
         # Build complete URL
         url = f"{server_url.rstrip('/')}{self._base_path}{endpoint}"
 
-        headers = {
-            "Authorization": f"Bearer {token}",
-            "Content-Type": "application/json",
-            "Accept": "application/json"
-        }
+        headers = {"Authorization": f"Bearer {token}"}
 
         try:
-            if method.lower() == "get":
-                response = requests.get(url, headers=headers, params=params)
-            elif method.lower() == "post":
-                response = requests.post(url, headers=headers, json=data, params=params)
-            elif method.lower() == "put":
-                response = requests.put(url, headers=headers, json=data, params=params)
-            elif method.lower() == "delete":
-                response = requests.delete(url, headers=headers, params=params)
-            else:
-                raise ValueError(f"Unsupported request method: {method}")
+            session = await self._get_http_session()
+            async with session.request(method_upper, url, headers=headers, json=data, params=self._query_items(params)) as response:
+                status_code = response.status
+                response_text = await response.text()
 
-            if response.status_code < 200 or response.status_code >= 300:
-                error_message = response.text
-                return json.dumps({"error": f"Request failed, status code: {response.status_code}, error message: {error_message}, request URL: {url}"}, ensure_ascii=False)
+            if status_code < 200 or status_code >= 300:
+                return json.dumps({"error": f"Request failed, status code: {status_code}, error message: {response_text}, request URL: {url}"}, ensure_ascii=False)
 
             # Check if response contains content
-            if response.text.strip():
-                return json.dumps(response.json(), ensure_ascii=False)
-            return json.dumps({"status": "success", "status_code": response.status_code}, ensure_ascii=False)
+            if response_text.strip():
+                return json.dumps(json.loads(response_text), ensure_ascii=False)
+            return json.dumps({"status": "success", "status_code": status_code}, ensure_ascii=False)
 
-        except requests.exceptions.RequestException as e:
-            error_message = str(e)
-            try:
-                if hasattr(e, 'response') and e.response and e.response.text:
-                    error_message = f"{error_message}: {e.response.text}"
-            except:
-                pass
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            error_message = str(e) or type(e).__name__
             error_response = {"error": f"API request failed: {error_message}"}
             return json.dumps(error_response, ensure_ascii=False)
-
     async def getBanner(self, __user__: dict = {}, __event_emitter__: Callable[[dict], Awaitable[None]] = None) -> str:
         """
         Returns the current announcement banner configuration.
@@ -265,7 +325,7 @@ class Tools:
             endpoint = "/rest/api/2/announcementBanner"
             params = None
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -307,7 +367,7 @@ class Tools:
             params = None
             request_data = None
 
-            result = self._make_api_request("PUT", endpoint, __user__, data=request_data, params=params)
+            result = await self._make_api_request("PUT", endpoint, __user__, data=request_data, params=params)
 
             if event_emitter:
                 try:
@@ -378,7 +438,7 @@ Otherwise, all configurations for the provided list of custom fields are returne
                 params["maxResults"] = maxResults
             request_data = None
 
-            result = self._make_api_request("POST", endpoint, __user__, data=request_data, params=params)
+            result = await self._make_api_request("POST", endpoint, __user__, data=request_data, params=params)
 
             if event_emitter:
                 try:
@@ -426,7 +486,7 @@ The new `write:app-data:jira` OAuth scope is 100% optional now, and not using it
                 params["generateChangelog"] = generateChangelog
             request_data = None
 
-            result = self._make_api_request("POST", endpoint, __user__, data=request_data, params=params)
+            result = await self._make_api_request("POST", endpoint, __user__, data=request_data, params=params)
 
             if event_emitter:
                 try:
@@ -497,7 +557,7 @@ Otherwise, all configurations are returned.
             if maxResults is not None:
                 params["maxResults"] = maxResults
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -539,7 +599,7 @@ Otherwise, all configurations are returned.
             params = None
             request_data = None
 
-            result = self._make_api_request("PUT", endpoint, __user__, data=request_data, params=params)
+            result = await self._make_api_request("PUT", endpoint, __user__, data=request_data, params=params)
 
             if event_emitter:
                 try:
@@ -588,7 +648,7 @@ The new `write:app-data:jira` OAuth scope is 100% optional now, and not using it
                 params["generateChangelog"] = generateChangelog
             request_data = None
 
-            result = self._make_api_request("PUT", endpoint, __user__, data=request_data, params=params)
+            result = await self._make_api_request("PUT", endpoint, __user__, data=request_data, params=params)
 
             if event_emitter:
                 try:
@@ -639,7 +699,7 @@ If you specify a value for the `key` parameter, then an application property is
             if keyFilter is not None:
                 params["keyFilter"] = keyFilter
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -680,7 +740,7 @@ If you specify a value for the `key` parameter, then an application property is
             endpoint = "/rest/api/2/application-properties/advanced-settings"
             params = None
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -771,7 +831,7 @@ The settings listed below adjust the [look and feel](https://confluence.atlassia
             params = None
             request_data = None
 
-            result = self._make_api_request("PUT", endpoint, __user__, data=request_data, params=params)
+            result = await self._make_api_request("PUT", endpoint, __user__, data=request_data, params=params)
 
             if event_emitter:
                 try:
@@ -812,7 +872,7 @@ The settings listed below adjust the [look and feel](https://confluence.atlassia
             endpoint = "/rest/api/2/applicationrole"
             params = None
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -853,7 +913,7 @@ The settings listed below adjust the [look and feel](https://confluence.atlassia
             endpoint = f"/rest/api/2/applicationrole/{key}"
             params = None
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -905,7 +965,7 @@ This operation can be accessed anonymously.
             if redirect is not None:
                 params["redirect"] = redirect
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -950,7 +1010,7 @@ This operation can be accessed anonymously.
             endpoint = "/rest/api/2/attachment/meta"
             params = None
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -1011,7 +1071,7 @@ This operation can be accessed anonymously.
             if height is not None:
                 params["height"] = height
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -1057,7 +1117,7 @@ This operation can be accessed anonymously.
             endpoint = f"/rest/api/2/attachment/{id}"
             params = None
 
-            result = self._make_api_request("DELETE", endpoint, __user__, params=params)
+            result = await self._make_api_request("DELETE", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -1104,7 +1164,7 @@ This operation can be accessed anonymously.
             endpoint = f"/rest/api/2/attachment/{id}"
             params = None
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -1153,7 +1213,7 @@ This operation can be accessed anonymously.
             endpoint = f"/rest/api/2/attachment/{id}/expand/human"
             params = None
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -1202,7 +1262,7 @@ This operation can be accessed anonymously.
             endpoint = f"/rest/api/2/attachment/{id}/expand/raw"
             params = None
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -1273,7 +1333,7 @@ This operation can be accessed anonymously.
             if to is not None:
                 params["to"] = to
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -1316,7 +1376,7 @@ This operation can be accessed anonymously.
             endpoint = f"/rest/api/2/avatar/{type}/system"
             params = None
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -1365,7 +1425,7 @@ Issues are identified by their ID or key, and optionally changelogs can be filte
             params = None
             request_data = None
 
-            result = self._make_api_request("POST", endpoint, __user__, data=request_data, params=params)
+            result = await self._make_api_request("POST", endpoint, __user__, data=request_data, params=params)
 
             if event_emitter:
                 try:
@@ -1411,7 +1471,7 @@ Issues are identified by their ID or key, and optionally changelogs can be filte
             if orderBy is not None:
                 params["orderBy"] = orderBy
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -1464,7 +1524,7 @@ This operation can be accessed anonymously.
                 params["expand"] = expand
             request_data = None
 
-            result = self._make_api_request("POST", endpoint, __user__, data=request_data, params=params)
+            result = await self._make_api_request("POST", endpoint, __user__, data=request_data, params=params)
 
             if event_emitter:
                 try:
@@ -1511,7 +1571,7 @@ This operation can be accessed anonymously.
             endpoint = f"/rest/api/2/comment/{commentId}/properties"
             params = None
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -1558,7 +1618,7 @@ Also, when the visibility of a comment is restricted to a role or group the user
             endpoint = f"/rest/api/2/comment/{commentId}/properties/{propertyKey}"
             params = None
 
-            result = self._make_api_request("DELETE", endpoint, __user__, params=params)
+            result = await self._make_api_request("DELETE", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -1606,7 +1666,7 @@ This operation can be accessed anonymously.
             endpoint = f"/rest/api/2/comment/{commentId}/properties/{propertyKey}"
             params = None
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -1656,7 +1716,7 @@ Also, when the visibility of a comment is restricted to a role or group the user
             params = None
             request_data = None
 
-            result = self._make_api_request("PUT", endpoint, __user__, data=request_data, params=params)
+            result = await self._make_api_request("PUT", endpoint, __user__, data=request_data, params=params)
 
             if event_emitter:
                 try:
@@ -1716,7 +1776,7 @@ This operation can be accessed anonymously.
             if query is not None:
                 params["query"] = query
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -1760,7 +1820,7 @@ This operation can be accessed anonymously.
             params = None
             request_data = None
 
-            result = self._make_api_request("POST", endpoint, __user__, data=request_data, params=params)
+            result = await self._make_api_request("POST", endpoint, __user__, data=request_data, params=params)
 
             if event_emitter:
                 try:
@@ -1806,7 +1866,7 @@ This operation can be accessed anonymously.
             if moveIssuesTo is not None:
                 params["moveIssuesTo"] = moveIssuesTo
 
-            result = self._make_api_request("DELETE", endpoint, __user__, params=params)
+            result = await self._make_api_request("DELETE", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -1849,7 +1909,7 @@ This operation can be accessed anonymously.
             endpoint = f"/rest/api/2/component/{id}"
             params = None
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -1893,7 +1953,7 @@ This operation can be accessed anonymously.
             params = None
             request_data = None
 
-            result = self._make_api_request("PUT", endpoint, __user__, data=request_data, params=params)
+            result = await self._make_api_request("PUT", endpoint, __user__, data=request_data, params=params)
 
             if event_emitter:
                 try:
@@ -1941,7 +2001,7 @@ This operation can be accessed anonymously.
             endpoint = f"/rest/api/2/component/{id}/relatedIssueCounts"
             params = None
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -1982,7 +2042,7 @@ This operation can be accessed anonymously.
             endpoint = "/rest/api/2/configuration"
             params = None
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -2023,7 +2083,7 @@ This operation can be accessed anonymously.
             endpoint = "/rest/api/2/configuration/timetracking"
             params = None
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -2065,7 +2125,7 @@ This operation can be accessed anonymously.
             params = None
             request_data = None
 
-            result = self._make_api_request("PUT", endpoint, __user__, data=request_data, params=params)
+            result = await self._make_api_request("PUT", endpoint, __user__, data=request_data, params=params)
 
             if event_emitter:
                 try:
@@ -2106,7 +2166,7 @@ This operation can be accessed anonymously.
             endpoint = "/rest/api/2/configuration/timetracking/list"
             params = None
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -2147,7 +2207,7 @@ This operation can be accessed anonymously.
             endpoint = "/rest/api/2/configuration/timetracking/options"
             params = None
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -2189,7 +2249,7 @@ This operation can be accessed anonymously.
             params = None
             request_data = None
 
-            result = self._make_api_request("PUT", endpoint, __user__, data=request_data, params=params)
+            result = await self._make_api_request("PUT", endpoint, __user__, data=request_data, params=params)
 
             if event_emitter:
                 try:
@@ -2237,7 +2297,7 @@ This operation can be accessed anonymously.
             endpoint = f"/rest/api/2/customFieldOption/{id}"
             params = None
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -2291,7 +2351,7 @@ This operation can be accessed anonymously.
             if maxResults is not None:
                 params["maxResults"] = maxResults
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -2335,7 +2395,7 @@ This operation can be accessed anonymously.
                 params["extendAdminPermissions"] = extendAdminPermissions
             request_data = None
 
-            result = self._make_api_request("POST", endpoint, __user__, data=request_data, params=params)
+            result = await self._make_api_request("POST", endpoint, __user__, data=request_data, params=params)
 
             if event_emitter:
                 try:
@@ -2379,7 +2439,7 @@ The dashboards to be updated must be owned by the user, or the user must be an a
             params = None
             request_data = None
 
-            result = self._make_api_request("PUT", endpoint, __user__, data=request_data, params=params)
+            result = await self._make_api_request("PUT", endpoint, __user__, data=request_data, params=params)
 
             if event_emitter:
                 try:
@@ -2420,7 +2480,7 @@ The dashboards to be updated must be owned by the user, or the user must be an a
             endpoint = "/rest/api/2/dashboard/gadgets"
             params = None
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -2517,7 +2577,7 @@ This operation can be accessed anonymously.
             if expand is not None:
                 params["expand"] = expand
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -2576,7 +2636,7 @@ This operation can be accessed anonymously.
             if gadgetId is not None:
                 params["gadgetId"] = gadgetId
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -2618,7 +2678,7 @@ This operation can be accessed anonymously.
             params = None
             request_data = None
 
-            result = self._make_api_request("POST", endpoint, __user__, data=request_data, params=params)
+            result = await self._make_api_request("POST", endpoint, __user__, data=request_data, params=params)
 
             if event_emitter:
                 try:
@@ -2662,7 +2722,7 @@ When a gadget is removed from a dashboard, other gadgets in the same column are
             endpoint = f"/rest/api/2/dashboard/{dashboardId}/gadget/{gadgetId}"
             params = None
 
-            result = self._make_api_request("DELETE", endpoint, __user__, params=params)
+            result = await self._make_api_request("DELETE", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -2705,7 +2765,7 @@ When a gadget is removed from a dashboard, other gadgets in the same column are
             params = None
             request_data = None
 
-            result = self._make_api_request("PUT", endpoint, __user__, data=request_data, params=params)
+            result = await self._make_api_request("PUT", endpoint, __user__, data=request_data, params=params)
 
             if event_emitter:
                 try:
@@ -2749,7 +2809,7 @@ This operation can be accessed anonymously.
             endpoint = f"/rest/api/2/dashboard/{dashboardId}/items/{itemId}/properties"
             params = None
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -2794,7 +2854,7 @@ This operation can be accessed anonymously.
             endpoint = f"/rest/api/2/dashboard/{dashboardId}/items/{itemId}/properties/{propertyKey}"
             params = None
 
-            result = self._make_api_request("DELETE", endpoint, __user__, params=params)
+            result = await self._make_api_request("DELETE", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -2845,7 +2905,7 @@ This operation can be accessed anonymously.
             endpoint = f"/rest/api/2/dashboard/{dashboardId}/items/{itemId}/properties/{propertyKey}"
             params = None
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -2899,7 +2959,7 @@ This operation can be accessed anonymously.
             params = None
             request_data = None
 
-            result = self._make_api_request("PUT", endpoint, __user__, data=request_data, params=params)
+            result = await self._make_api_request("PUT", endpoint, __user__, data=request_data, params=params)
 
             if event_emitter:
                 try:
@@ -2942,7 +3002,7 @@ The dashboard to be deleted must be owned by the user.
             endpoint = f"/rest/api/2/dashboard/{id}"
             params = None
 
-            result = self._make_api_request("DELETE", endpoint, __user__, params=params)
+            result = await self._make_api_request("DELETE", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -2987,7 +3047,7 @@ However, to get a dashboard, the dashboard must be shared with the user or the u
             endpoint = f"/rest/api/2/dashboard/{id}"
             params = None
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -3034,7 +3094,7 @@ The dashboard to be updated must be owned by the user.
                 params["extendAdminPermissions"] = extendAdminPermissions
             request_data = None
 
-            result = self._make_api_request("PUT", endpoint, __user__, data=request_data, params=params)
+            result = await self._make_api_request("PUT", endpoint, __user__, data=request_data, params=params)
 
             if event_emitter:
                 try:
@@ -3081,7 +3141,7 @@ The dashboard to be copied must be owned by or shared with the user.
                 params["extendAdminPermissions"] = extendAdminPermissions
             request_data = None
 
-            result = self._make_api_request("POST", endpoint, __user__, data=request_data, params=params)
+            result = await self._make_api_request("POST", endpoint, __user__, data=request_data, params=params)
 
             if event_emitter:
                 try:
@@ -3120,7 +3180,7 @@ The dashboard to be copied must be owned by or shared with the user.
             endpoint = "/rest/api/2/data-policy"
             params = None
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -3161,7 +3221,7 @@ The dashboard to be copied must be owned by or shared with the user.
             if ids is not None:
                 params["ids"] = ids
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -3202,7 +3262,7 @@ The dashboard to be copied must be owned by or shared with the user.
             endpoint = "/rest/api/2/events"
             params = None
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -3254,7 +3314,7 @@ Learn more about Jira expressions in the [documentation](https://developer.atlas
                 params["check"] = check
             request_data = None
 
-            result = self._make_api_request("POST", endpoint, __user__, data=request_data, params=params)
+            result = await self._make_api_request("POST", endpoint, __user__, data=request_data, params=params)
 
             if event_emitter:
                 try:
@@ -3324,7 +3384,7 @@ Permission to access Jira Software is required to access Jira Software context v
                 params["expand"] = expand
             request_data = None
 
-            result = self._make_api_request("POST", endpoint, __user__, data=request_data, params=params)
+            result = await self._make_api_request("POST", endpoint, __user__, data=request_data, params=params)
 
             if event_emitter:
                 try:
@@ -3394,7 +3454,7 @@ Permission to access Jira Software is required to access Jira Software context v
                 params["expand"] = expand
             request_data = None
 
-            result = self._make_api_request("POST", endpoint, __user__, data=request_data, params=params)
+            result = await self._make_api_request("POST", endpoint, __user__, data=request_data, params=params)
 
             if event_emitter:
                 try:
@@ -3442,7 +3502,7 @@ This operation can be accessed anonymously.
             endpoint = "/rest/api/2/field"
             params = None
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -3484,7 +3544,7 @@ This operation can be accessed anonymously.
             params = None
             request_data = None
 
-            result = self._make_api_request("POST", endpoint, __user__, data=request_data, params=params)
+            result = await self._make_api_request("POST", endpoint, __user__, data=request_data, params=params)
 
             if event_emitter:
                 try:
@@ -3565,7 +3625,7 @@ Use `type` must be set to `custom` to show custom fields only.
             if expand is not None:
                 params["expand"] = expand
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -3629,7 +3689,7 @@ Only custom fields can be queried, `type` must be set to `custom`.
             if orderBy is not None:
                 params["orderBy"] = orderBy
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -3671,7 +3731,7 @@ Only custom fields can be queried, `type` must be set to `custom`.
             params = None
             request_data = None
 
-            result = self._make_api_request("PUT", endpoint, __user__, data=request_data, params=params)
+            result = await self._make_api_request("PUT", endpoint, __user__, data=request_data, params=params)
 
             if event_emitter:
                 try:
@@ -3732,7 +3792,7 @@ Only custom fields can be queried, `type` must be set to `custom`.
             if maxResults is not None:
                 params["maxResults"] = maxResults
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -3776,7 +3836,7 @@ If `projectIds` is empty, a global context is created. A global context is one t
             params = None
             request_data = None
 
-            result = self._make_api_request("POST", endpoint, __user__, data=request_data, params=params)
+            result = await self._make_api_request("POST", endpoint, __user__, data=request_data, params=params)
 
             if event_emitter:
                 try:
@@ -3858,7 +3918,7 @@ Forge custom fields [types](https://developer.atlassian.com/platform/forge/manif
             if maxResults is not None:
                 params["maxResults"] = maxResults
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -3933,7 +3993,7 @@ Only one type of default object can be included in a request. To remove a defaul
             params = None
             request_data = None
 
-            result = self._make_api_request("PUT", endpoint, __user__, data=request_data, params=params)
+            result = await self._make_api_request("PUT", endpoint, __user__, data=request_data, params=params)
 
             if event_emitter:
                 try:
@@ -3983,7 +4043,7 @@ Only one type of default object can be included in a request. To remove a defaul
             if maxResults is not None:
                 params["maxResults"] = maxResults
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -4037,7 +4097,7 @@ The order of the returned values is the same as provided in the request.
                 params["maxResults"] = maxResults
             request_data = None
 
-            result = self._make_api_request("POST", endpoint, __user__, data=request_data, params=params)
+            result = await self._make_api_request("POST", endpoint, __user__, data=request_data, params=params)
 
             if event_emitter:
                 try:
@@ -4087,7 +4147,7 @@ The order of the returned values is the same as provided in the request.
             if maxResults is not None:
                 params["maxResults"] = maxResults
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -4129,7 +4189,7 @@ The order of the returned values is the same as provided in the request.
             endpoint = f"/rest/api/2/field/{fieldId}/context/{contextId}"
             params = None
 
-            result = self._make_api_request("DELETE", endpoint, __user__, params=params)
+            result = await self._make_api_request("DELETE", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -4172,7 +4232,7 @@ The order of the returned values is the same as provided in the request.
             params = None
             request_data = None
 
-            result = self._make_api_request("PUT", endpoint, __user__, data=request_data, params=params)
+            result = await self._make_api_request("PUT", endpoint, __user__, data=request_data, params=params)
 
             if event_emitter:
                 try:
@@ -4219,7 +4279,7 @@ If any of the issue types exists in the custom field context, the operation fail
             params = None
             request_data = None
 
-            result = self._make_api_request("PUT", endpoint, __user__, data=request_data, params=params)
+            result = await self._make_api_request("PUT", endpoint, __user__, data=request_data, params=params)
 
             if event_emitter:
                 try:
@@ -4264,7 +4324,7 @@ A custom field context without any issue types applies to all issue types.
             params = None
             request_data = None
 
-            result = self._make_api_request("POST", endpoint, __user__, data=request_data, params=params)
+            result = await self._make_api_request("POST", endpoint, __user__, data=request_data, params=params)
 
             if event_emitter:
                 try:
@@ -4320,7 +4380,7 @@ This operation works for custom field options created in Jira or the operations
             if maxResults is not None:
                 params["maxResults"] = maxResults
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -4367,7 +4427,7 @@ This operation works for custom field options created in Jira or the operations
             params = None
             request_data = None
 
-            result = self._make_api_request("POST", endpoint, __user__, data=request_data, params=params)
+            result = await self._make_api_request("POST", endpoint, __user__, data=request_data, params=params)
 
             if event_emitter:
                 try:
@@ -4414,7 +4474,7 @@ Note that this operation **only works for issue field select list options create
             params = None
             request_data = None
 
-            result = self._make_api_request("PUT", endpoint, __user__, data=request_data, params=params)
+            result = await self._make_api_request("PUT", endpoint, __user__, data=request_data, params=params)
 
             if event_emitter:
                 try:
@@ -4459,7 +4519,7 @@ This operation works for custom field options created in Jira or the operations
             params = None
             request_data = None
 
-            result = self._make_api_request("PUT", endpoint, __user__, data=request_data, params=params)
+            result = await self._make_api_request("PUT", endpoint, __user__, data=request_data, params=params)
 
             if event_emitter:
                 try:
@@ -4506,7 +4566,7 @@ This operation works for custom field options created in Jira or the operations
             endpoint = f"/rest/api/2/field/{fieldId}/context/{contextId}/option/{optionId}"
             params = None
 
-            result = self._make_api_request("DELETE", endpoint, __user__, params=params)
+            result = await self._make_api_request("DELETE", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -4557,7 +4617,7 @@ Note that this operation **only works for issue field select list options create
             if jql is not None:
                 params["jql"] = jql
 
-            result = self._make_api_request("DELETE", endpoint, __user__, params=params)
+            result = await self._make_api_request("DELETE", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -4602,7 +4662,7 @@ If any project in the request is assigned to any context of the custom field, th
             params = None
             request_data = None
 
-            result = self._make_api_request("PUT", endpoint, __user__, data=request_data, params=params)
+            result = await self._make_api_request("PUT", endpoint, __user__, data=request_data, params=params)
 
             if event_emitter:
                 try:
@@ -4649,7 +4709,7 @@ If any project in the request is not assigned to the context, or the operation w
             params = None
             request_data = None
 
-            result = self._make_api_request("POST", endpoint, __user__, data=request_data, params=params)
+            result = await self._make_api_request("POST", endpoint, __user__, data=request_data, params=params)
 
             if event_emitter:
                 try:
@@ -4696,7 +4756,7 @@ If any project in the request is not assigned to the context, or the operation w
             if maxResults is not None:
                 params["maxResults"] = maxResults
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -4746,7 +4806,7 @@ If any project in the request is not assigned to the context, or the operation w
             if expand is not None:
                 params["expand"] = expand
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -4798,7 +4858,7 @@ Note that this operation **only works for issue field select list options added
             if maxResults is not None:
                 params["maxResults"] = maxResults
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -4847,7 +4907,7 @@ Each field can have a maximum of 10000 options, and each option can have a maxim
             params = None
             request_data = None
 
-            result = self._make_api_request("POST", endpoint, __user__, data=request_data, params=params)
+            result = await self._make_api_request("POST", endpoint, __user__, data=request_data, params=params)
 
             if event_emitter:
                 try:
@@ -4902,7 +4962,7 @@ Note that this operation **only works for issue field select list options added
             if projectId is not None:
                 params["projectId"] = projectId
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -4957,7 +5017,7 @@ Note that this operation **only works for issue field select list options added
             if projectId is not None:
                 params["projectId"] = projectId
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -5004,7 +5064,7 @@ Note that this operation **only works for issue field select list options added
             endpoint = f"/rest/api/2/field/{fieldKey}/option/{optionId}"
             params = None
 
-            result = self._make_api_request("DELETE", endpoint, __user__, params=params)
+            result = await self._make_api_request("DELETE", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -5051,7 +5111,7 @@ Note that this operation **only works for issue field select list options added
             endpoint = f"/rest/api/2/field/{fieldKey}/option/{optionId}"
             params = None
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -5099,7 +5159,7 @@ Note that this operation **only works for issue field select list options added
             params = None
             request_data = None
 
-            result = self._make_api_request("PUT", endpoint, __user__, data=request_data, params=params)
+            result = await self._make_api_request("PUT", endpoint, __user__, data=request_data, params=params)
 
             if event_emitter:
                 try:
@@ -5162,7 +5222,7 @@ Note that this operation **only works for issue field select list options added
             if overrideEditableFlag is not None:
                 params["overrideEditableFlag"] = overrideEditableFlag
 
-            result = self._make_api_request("DELETE", endpoint, __user__, params=params)
+            result = await self._make_api_request("DELETE", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -5205,7 +5265,7 @@ This operation is [asynchronous](#async). Follow the `location` link in the resp
             endpoint = f"/rest/api/2/field/{id}"
             params = None
 
-            result = self._make_api_request("DELETE", endpoint, __user__, params=params)
+            result = await self._make_api_request("DELETE", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -5247,7 +5307,7 @@ This operation is [asynchronous](#async). Follow the `location` link in the resp
             params = None
             request_data = None
 
-            result = self._make_api_request("POST", endpoint, __user__, data=request_data, params=params)
+            result = await self._make_api_request("POST", endpoint, __user__, data=request_data, params=params)
 
             if event_emitter:
                 try:
@@ -5289,7 +5349,7 @@ This operation is [asynchronous](#async). Follow the `location` link in the resp
             params = None
             request_data = None
 
-            result = self._make_api_request("POST", endpoint, __user__, data=request_data, params=params)
+            result = await self._make_api_request("POST", endpoint, __user__, data=request_data, params=params)
 
             if event_emitter:
                 try:
@@ -5350,7 +5410,7 @@ Only field configurations used in company-managed (classic) projects are returne
             if query is not None:
                 params["query"] = query
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -5394,7 +5454,7 @@ This operation can only create configurations for use in company-managed (classi
             params = None
             request_data = None
 
-            result = self._make_api_request("POST", endpoint, __user__, data=request_data, params=params)
+            result = await self._make_api_request("POST", endpoint, __user__, data=request_data, params=params)
 
             if event_emitter:
                 try:
@@ -5437,7 +5497,7 @@ This operation can only delete configurations used in company-managed (classic)
             endpoint = f"/rest/api/2/fieldconfiguration/{id}"
             params = None
 
-            result = self._make_api_request("DELETE", endpoint, __user__, params=params)
+            result = await self._make_api_request("DELETE", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -5481,7 +5541,7 @@ This operation can only update configurations used in company-managed (classic)
             params = None
             request_data = None
 
-            result = self._make_api_request("PUT", endpoint, __user__, data=request_data, params=params)
+            result = await self._make_api_request("PUT", endpoint, __user__, data=request_data, params=params)
 
             if event_emitter:
                 try:
@@ -5530,7 +5590,7 @@ Only the fields from configurations used in company-managed (classic) projects a
             if maxResults is not None:
                 params["maxResults"] = maxResults
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -5576,7 +5636,7 @@ The operation can set the renderer for text fields to the default text renderer
             params = None
             request_data = None
 
-            result = self._make_api_request("PUT", endpoint, __user__, data=request_data, params=params)
+            result = await self._make_api_request("PUT", endpoint, __user__, data=request_data, params=params)
 
             if event_emitter:
                 try:
@@ -5627,7 +5687,7 @@ Only field configuration schemes used in classic projects are returned.
             if id is not None:
                 params["id"] = id
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -5671,7 +5731,7 @@ This operation can only create field configuration schemes used in company-manag
             params = None
             request_data = None
 
-            result = self._make_api_request("POST", endpoint, __user__, data=request_data, params=params)
+            result = await self._make_api_request("POST", endpoint, __user__, data=request_data, params=params)
 
             if event_emitter:
                 try:
@@ -5722,7 +5782,7 @@ Only items used in classic projects are returned.
             if fieldConfigurationSchemeId is not None:
                 params["fieldConfigurationSchemeId"] = fieldConfigurationSchemeId
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -5775,7 +5835,7 @@ Only field configuration schemes used in classic projects are returned.
             if projectId is not None:
                 params["projectId"] = projectId
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -5819,7 +5879,7 @@ Field configuration schemes can only be assigned to classic projects.
             params = None
             request_data = None
 
-            result = self._make_api_request("PUT", endpoint, __user__, data=request_data, params=params)
+            result = await self._make_api_request("PUT", endpoint, __user__, data=request_data, params=params)
 
             if event_emitter:
                 try:
@@ -5862,7 +5922,7 @@ This operation can only delete field configuration schemes used in company-manag
             endpoint = f"/rest/api/2/fieldconfigurationscheme/{id}"
             params = None
 
-            result = self._make_api_request("DELETE", endpoint, __user__, params=params)
+            result = await self._make_api_request("DELETE", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -5906,7 +5966,7 @@ This operation can only update field configuration schemes used in company-manag
             params = None
             request_data = None
 
-            result = self._make_api_request("PUT", endpoint, __user__, data=request_data, params=params)
+            result = await self._make_api_request("PUT", endpoint, __user__, data=request_data, params=params)
 
             if event_emitter:
                 try:
@@ -5950,7 +6010,7 @@ This operation can only modify field configuration schemes used in company-manag
             params = None
             request_data = None
 
-            result = self._make_api_request("PUT", endpoint, __user__, data=request_data, params=params)
+            result = await self._make_api_request("PUT", endpoint, __user__, data=request_data, params=params)
 
             if event_emitter:
                 try:
@@ -5994,7 +6054,7 @@ This operation can only modify field configuration schemes used in company-manag
             params = None
             request_data = None
 
-            result = self._make_api_request("POST", endpoint, __user__, data=request_data, params=params)
+            result = await self._make_api_request("POST", endpoint, __user__, data=request_data, params=params)
 
             if event_emitter:
                 try:
@@ -6044,7 +6104,7 @@ This operation can only modify field configuration schemes used in company-manag
                 params["overrideSharePermissions"] = overrideSharePermissions
             request_data = None
 
-            result = self._make_api_request("POST", endpoint, __user__, data=request_data, params=params)
+            result = await self._make_api_request("POST", endpoint, __user__, data=request_data, params=params)
 
             if event_emitter:
                 try:
@@ -6085,7 +6145,7 @@ This operation can only modify field configuration schemes used in company-manag
             endpoint = "/rest/api/2/filter/defaultShareScope"
             params = None
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -6127,7 +6187,7 @@ This operation can only modify field configuration schemes used in company-manag
             params = None
             request_data = None
 
-            result = self._make_api_request("PUT", endpoint, __user__, data=request_data, params=params)
+            result = await self._make_api_request("PUT", endpoint, __user__, data=request_data, params=params)
 
             if event_emitter:
                 try:
@@ -6183,7 +6243,7 @@ For example, if the user favorites a public filter that is subsequently made pri
             if expand is not None:
                 params["expand"] = expand
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -6240,7 +6300,7 @@ For example, if the user favorites a public filter that is subsequently made pri
             if includeFavourites is not None:
                 params["includeFavourites"] = includeFavourites
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -6351,7 +6411,7 @@ This operation can be accessed anonymously.
             if isSubstringMatch is not None:
                 params["isSubstringMatch"] = isSubstringMatch
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -6392,7 +6452,7 @@ This operation can be accessed anonymously.
             endpoint = f"/rest/api/2/filter/{id}"
             params = None
 
-            result = self._make_api_request("DELETE", endpoint, __user__, params=params)
+            result = await self._make_api_request("DELETE", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -6450,7 +6510,7 @@ This operation can be accessed anonymously.
             if overrideSharePermissions is not None:
                 params["overrideSharePermissions"] = overrideSharePermissions
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -6501,7 +6561,7 @@ This operation can be accessed anonymously.
                 params["overrideSharePermissions"] = overrideSharePermissions
             request_data = None
 
-            result = self._make_api_request("PUT", endpoint, __user__, data=request_data, params=params)
+            result = await self._make_api_request("PUT", endpoint, __user__, data=request_data, params=params)
 
             if event_emitter:
                 try:
@@ -6548,7 +6608,7 @@ This operation can be accessed anonymously.
             endpoint = f"/rest/api/2/filter/{id}/columns"
             params = None
 
-            result = self._make_api_request("DELETE", endpoint, __user__, params=params)
+            result = await self._make_api_request("DELETE", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -6597,7 +6657,7 @@ This operation can be accessed anonymously.
             endpoint = f"/rest/api/2/filter/{id}/columns"
             params = None
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -6649,7 +6709,7 @@ The parameters for this resource are expressed as HTML form data. For example, i
             params = None
             request_data = None
 
-            result = self._make_api_request("PUT", endpoint, __user__, data=request_data, params=params)
+            result = await self._make_api_request("PUT", endpoint, __user__, data=request_data, params=params)
 
             if event_emitter:
                 try:
@@ -6696,7 +6756,7 @@ The parameters for this resource are expressed as HTML form data. For example, i
             if expand is not None:
                 params["expand"] = expand
 
-            result = self._make_api_request("DELETE", endpoint, __user__, params=params)
+            result = await self._make_api_request("DELETE", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -6750,7 +6810,7 @@ The parameters for this resource are expressed as HTML form data. For example, i
                 params["expand"] = expand
             request_data = None
 
-            result = self._make_api_request("PUT", endpoint, __user__, data=request_data, params=params)
+            result = await self._make_api_request("PUT", endpoint, __user__, data=request_data, params=params)
 
             if event_emitter:
                 try:
@@ -6792,7 +6852,7 @@ The parameters for this resource are expressed as HTML form data. For example, i
             params = None
             request_data = None
 
-            result = self._make_api_request("PUT", endpoint, __user__, data=request_data, params=params)
+            result = await self._make_api_request("PUT", endpoint, __user__, data=request_data, params=params)
 
             if event_emitter:
                 try:
@@ -6841,7 +6901,7 @@ This operation can be accessed anonymously.
             endpoint = f"/rest/api/2/filter/{id}/permission"
             params = None
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -6885,7 +6945,7 @@ Be aware that this operation uses different objects for updating share permissio
             params = None
             request_data = None
 
-            result = self._make_api_request("POST", endpoint, __user__, data=request_data, params=params)
+            result = await self._make_api_request("POST", endpoint, __user__, data=request_data, params=params)
 
             if event_emitter:
                 try:
@@ -6927,7 +6987,7 @@ Be aware that this operation uses different objects for updating share permissio
             endpoint = f"/rest/api/2/filter/{id}/permission/{permissionId}"
             params = None
 
-            result = self._make_api_request("DELETE", endpoint, __user__, params=params)
+            result = await self._make_api_request("DELETE", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -6977,7 +7037,7 @@ This operation can be accessed anonymously.
             endpoint = f"/rest/api/2/filter/{id}/permission/{permissionId}"
             params = None
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -7030,7 +7090,7 @@ The group to transfer restrictions to. Only comments and worklogs are transferre
             if swapGroupId is not None:
                 params["swapGroupId"] = swapGroupId
 
-            result = self._make_api_request("DELETE", endpoint, __user__, params=params)
+            result = await self._make_api_request("DELETE", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -7085,7 +7145,7 @@ The name of the group. This parameter cannot be used with the `groupId` paramete
             if expand is not None:
                 params["expand"] = expand
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -7127,7 +7187,7 @@ The name of the group. This parameter cannot be used with the `groupId` paramete
             params = None
             request_data = None
 
-            result = self._make_api_request("POST", endpoint, __user__, data=request_data, params=params)
+            result = await self._make_api_request("POST", endpoint, __user__, data=request_data, params=params)
 
             if event_emitter:
                 try:
@@ -7185,7 +7245,7 @@ The name of the group. This parameter cannot be used with the `groupId` paramete
             if applicationKey is not None:
                 params["applicationKey"] = applicationKey
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -7246,7 +7306,7 @@ The name of the group. This parameter cannot be used with the `groupId` paramete
             if maxResults is not None:
                 params["maxResults"] = maxResults
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -7299,7 +7359,7 @@ The name of the group. This parameter cannot be used with the `groupId` paramete
             if accountId is not None:
                 params["accountId"] = accountId
 
-            result = self._make_api_request("DELETE", endpoint, __user__, params=params)
+            result = await self._make_api_request("DELETE", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -7347,7 +7407,7 @@ The name of the group. This parameter cannot be used with the `groupId` paramete
                 params["groupId"] = groupId
             request_data = None
 
-            result = self._make_api_request("POST", endpoint, __user__, data=request_data, params=params)
+            result = await self._make_api_request("POST", endpoint, __user__, data=request_data, params=params)
 
             if event_emitter:
                 try:
@@ -7417,7 +7477,7 @@ A group to exclude from the result. To exclude multiple groups, provide an amper
             if userName is not None:
                 params["userName"] = userName
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -7504,7 +7564,7 @@ This operation can be accessed anonymously.
             if excludeConnectAddons is not None:
                 params["excludeConnectAddons"] = excludeConnectAddons
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -7545,7 +7605,7 @@ This operation can be accessed anonymously.
             endpoint = "/rest/api/2/instance/license"
             params = None
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -7596,7 +7656,7 @@ Creating a subtask differs from creating an issue as follows:
                 params["updateHistory"] = updateHistory
             request_data = None
 
-            result = self._make_api_request("POST", endpoint, __user__, data=request_data, params=params)
+            result = await self._make_api_request("POST", endpoint, __user__, data=request_data, params=params)
 
             if event_emitter:
                 try:
@@ -7654,7 +7714,7 @@ You can use the [get task](https://developer.atlassian.com/cloud/jira/platform/r
             params = None
             request_data = None
 
-            result = self._make_api_request("POST", endpoint, __user__, data=request_data, params=params)
+            result = await self._make_api_request("POST", endpoint, __user__, data=request_data, params=params)
 
             if event_emitter:
                 try:
@@ -7708,7 +7768,7 @@ You can use the [get task](https://developer.atlassian.com/cloud/jira/platform/r
             params = None
             request_data = None
 
-            result = self._make_api_request("PUT", endpoint, __user__, data=request_data, params=params)
+            result = await self._make_api_request("PUT", endpoint, __user__, data=request_data, params=params)
 
             if event_emitter:
                 try:
@@ -7757,7 +7817,7 @@ Creating a subtask differs from creating an issue as follows:
             params = None
             request_data = None
 
-            result = self._make_api_request("POST", endpoint, __user__, data=request_data, params=params)
+            result = await self._make_api_request("POST", endpoint, __user__, data=request_data, params=params)
 
             if event_emitter:
                 try:
@@ -7808,7 +7868,7 @@ This operation can be accessed anonymously.
             params = None
             request_data = None
 
-            result = self._make_api_request("POST", endpoint, __user__, data=request_data, params=params)
+            result = await self._make_api_request("POST", endpoint, __user__, data=request_data, params=params)
 
             if event_emitter:
                 try:
@@ -7869,7 +7929,7 @@ This operation can be accessed anonymously.
             if expand is not None:
                 params["expand"] = expand
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -7918,7 +7978,7 @@ This operation can be accessed anonymously.
             if maxResults is not None:
                 params["maxResults"] = maxResults
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -7968,7 +8028,7 @@ This operation can be accessed anonymously.
             if maxResults is not None:
                 params["maxResults"] = maxResults
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -8016,7 +8076,7 @@ Usage: Add `?isReturningKeys=true` to the end of the path to request issue keys.
             if isReturningKeys is not None:
                 params["isReturningKeys"] = isReturningKeys
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -8081,7 +8141,7 @@ This operation can be accessed anonymously.
             if showSubTaskParent is not None:
                 params["showSubTaskParent"] = showSubTaskParent
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -8133,7 +8193,7 @@ This operation is:
             params = None
             request_data = None
 
-            result = self._make_api_request("POST", endpoint, __user__, data=request_data, params=params)
+            result = await self._make_api_request("POST", endpoint, __user__, data=request_data, params=params)
 
             if event_emitter:
                 try:
@@ -8185,7 +8245,7 @@ This operation is:
             params = None
             request_data = None
 
-            result = self._make_api_request("POST", endpoint, __user__, data=request_data, params=params)
+            result = await self._make_api_request("POST", endpoint, __user__, data=request_data, params=params)
 
             if event_emitter:
                 try:
@@ -8244,7 +8304,7 @@ This operation is:
             endpoint = f"/rest/api/2/issue/properties/{propertyKey}"
             params = None
 
-            result = self._make_api_request("DELETE", endpoint, __user__, params=params)
+            result = await self._make_api_request("DELETE", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -8314,7 +8374,7 @@ This operation is:
             params = None
             request_data = None
 
-            result = self._make_api_request("PUT", endpoint, __user__, data=request_data, params=params)
+            result = await self._make_api_request("PUT", endpoint, __user__, data=request_data, params=params)
 
             if event_emitter:
                 try:
@@ -8368,7 +8428,7 @@ This operation is:
             params = None
             request_data = None
 
-            result = self._make_api_request("PUT", endpoint, __user__, data=request_data, params=params)
+            result = await self._make_api_request("PUT", endpoint, __user__, data=request_data, params=params)
 
             if event_emitter:
                 try:
@@ -8415,7 +8475,7 @@ This operation requires the **Allow users to watch issues** option to be *ON*. T
             params = None
             request_data = None
 
-            result = self._make_api_request("POST", endpoint, __user__, data=request_data, params=params)
+            result = await self._make_api_request("POST", endpoint, __user__, data=request_data, params=params)
 
             if event_emitter:
                 try:
@@ -8466,7 +8526,7 @@ This operation can be accessed anonymously.
             if deleteSubtasks is not None:
                 params["deleteSubtasks"] = deleteSubtasks
 
-            result = self._make_api_request("DELETE", endpoint, __user__, params=params)
+            result = await self._make_api_request("DELETE", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -8565,7 +8625,7 @@ This parameter may be specified multiple times. For example, `properties=prop1,p
             if failFast is not None:
                 params["failFast"] = failFast
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -8633,7 +8693,7 @@ This operation can be accessed anonymously.
                 params["expand"] = expand
             request_data = None
 
-            result = self._make_api_request("PUT", endpoint, __user__, data=request_data, params=params)
+            result = await self._make_api_request("PUT", endpoint, __user__, data=request_data, params=params)
 
             if event_emitter:
                 try:
@@ -8685,7 +8745,7 @@ This operation can be accessed anonymously.
             params = None
             request_data = None
 
-            result = self._make_api_request("PUT", endpoint, __user__, data=request_data, params=params)
+            result = await self._make_api_request("PUT", endpoint, __user__, data=request_data, params=params)
 
             if event_emitter:
                 try:
@@ -8873,7 +8933,7 @@ This operation can be accessed anonymously.
             params = None
             request_data = None
 
-            result = self._make_api_request("POST", endpoint, __user__, data=request_data, params=params)
+            result = await self._make_api_request("POST", endpoint, __user__, data=request_data, params=params)
 
             if event_emitter:
                 try:
@@ -8925,7 +8985,7 @@ This operation can be accessed anonymously.
             if maxResults is not None:
                 params["maxResults"] = maxResults
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -8972,7 +9032,7 @@ This operation can be accessed anonymously.
             params = None
             request_data = None
 
-            result = self._make_api_request("POST", endpoint, __user__, data=request_data, params=params)
+            result = await self._make_api_request("POST", endpoint, __user__, data=request_data, params=params)
 
             if event_emitter:
                 try:
@@ -9031,7 +9091,7 @@ This operation can be accessed anonymously.
             if expand is not None:
                 params["expand"] = expand
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -9081,7 +9141,7 @@ This operation can be accessed anonymously.
                 params["expand"] = expand
             request_data = None
 
-            result = self._make_api_request("POST", endpoint, __user__, data=request_data, params=params)
+            result = await self._make_api_request("POST", endpoint, __user__, data=request_data, params=params)
 
             if event_emitter:
                 try:
@@ -9128,7 +9188,7 @@ This operation can be accessed anonymously.
             endpoint = f"/rest/api/2/issue/{issueIdOrKey}/comment/{id}"
             params = None
 
-            result = self._make_api_request("DELETE", endpoint, __user__, params=params)
+            result = await self._make_api_request("DELETE", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -9179,7 +9239,7 @@ This operation can be accessed anonymously.
             if expand is not None:
                 params["expand"] = expand
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -9238,7 +9298,7 @@ This operation can be accessed anonymously.
                 params["expand"] = expand
             request_data = None
 
-            result = self._make_api_request("PUT", endpoint, __user__, data=request_data, params=params)
+            result = await self._make_api_request("PUT", endpoint, __user__, data=request_data, params=params)
 
             if event_emitter:
                 try:
@@ -9311,7 +9371,7 @@ Note: For any fields to be editable the user must have the *Edit issues* [projec
             if overrideEditableFlag is not None:
                 params["overrideEditableFlag"] = overrideEditableFlag
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -9356,7 +9416,7 @@ Note: For any fields to be editable the user must have the *Edit issues* [projec
             params = None
             request_data = None
 
-            result = self._make_api_request("POST", endpoint, __user__, data=request_data, params=params)
+            result = await self._make_api_request("POST", endpoint, __user__, data=request_data, params=params)
 
             if event_emitter:
                 try:
@@ -9402,7 +9462,7 @@ This operation can be accessed anonymously.
             endpoint = f"/rest/api/2/issue/{issueIdOrKey}/properties"
             params = None
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -9449,7 +9509,7 @@ This operation can be accessed anonymously.
             endpoint = f"/rest/api/2/issue/{issueIdOrKey}/properties/{propertyKey}"
             params = None
 
-            result = self._make_api_request("DELETE", endpoint, __user__, params=params)
+            result = await self._make_api_request("DELETE", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -9496,7 +9556,7 @@ This operation can be accessed anonymously.
             endpoint = f"/rest/api/2/issue/{issueIdOrKey}/properties/{propertyKey}"
             params = None
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -9546,7 +9606,7 @@ This operation can be accessed anonymously.
             params = None
             request_data = None
 
-            result = self._make_api_request("PUT", endpoint, __user__, data=request_data, params=params)
+            result = await self._make_api_request("PUT", endpoint, __user__, data=request_data, params=params)
 
             if event_emitter:
                 try:
@@ -9597,7 +9657,7 @@ This operation can be accessed anonymously.
             if globalId is not None:
                 params["globalId"] = globalId
 
-            result = self._make_api_request("DELETE", endpoint, __user__, params=params)
+            result = await self._make_api_request("DELETE", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -9648,7 +9708,7 @@ This operation can be accessed anonymously.
             if globalId is not None:
                 params["globalId"] = globalId
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -9699,7 +9759,7 @@ This operation can be accessed anonymously.
             params = None
             request_data = None
 
-            result = self._make_api_request("POST", endpoint, __user__, data=request_data, params=params)
+            result = await self._make_api_request("POST", endpoint, __user__, data=request_data, params=params)
 
             if event_emitter:
                 try:
@@ -9748,7 +9808,7 @@ This operation can be accessed anonymously.
             endpoint = f"/rest/api/2/issue/{issueIdOrKey}/remotelink/{linkId}"
             params = None
 
-            result = self._make_api_request("DELETE", endpoint, __user__, params=params)
+            result = await self._make_api_request("DELETE", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -9797,7 +9857,7 @@ This operation can be accessed anonymously.
             endpoint = f"/rest/api/2/issue/{issueIdOrKey}/remotelink/{linkId}"
             params = None
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -9849,7 +9909,7 @@ This operation can be accessed anonymously.
             params = None
             request_data = None
 
-            result = self._make_api_request("PUT", endpoint, __user__, data=request_data, params=params)
+            result = await self._make_api_request("PUT", endpoint, __user__, data=request_data, params=params)
 
             if event_emitter:
                 try:
@@ -9914,7 +9974,7 @@ However, if the user does not have the *Transition issues* [ project permission]
             if sortByOpsBarAndStatus is not None:
                 params["sortByOpsBarAndStatus"] = sortByOpsBarAndStatus
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -9963,7 +10023,7 @@ This operation can be accessed anonymously.
             params = None
             request_data = None
 
-            result = self._make_api_request("POST", endpoint, __user__, data=request_data, params=params)
+            result = await self._make_api_request("POST", endpoint, __user__, data=request_data, params=params)
 
             if event_emitter:
                 try:
@@ -10009,7 +10069,7 @@ This operation requires the **Allow users to vote on issues** option to be *ON*.
             endpoint = f"/rest/api/2/issue/{issueIdOrKey}/votes"
             params = None
 
-            result = self._make_api_request("DELETE", endpoint, __user__, params=params)
+            result = await self._make_api_request("DELETE", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -10059,7 +10119,7 @@ Note that users with the necessary permissions for this operation but without th
             endpoint = f"/rest/api/2/issue/{issueIdOrKey}/votes"
             params = None
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -10106,7 +10166,7 @@ This operation requires the **Allow users to vote on issues** option to be *ON*.
             params = None
             request_data = None
 
-            result = self._make_api_request("POST", endpoint, __user__, data=request_data, params=params)
+            result = await self._make_api_request("POST", endpoint, __user__, data=request_data, params=params)
 
             if event_emitter:
                 try:
@@ -10159,7 +10219,7 @@ This operation requires the **Allow users to watch issues** option to be *ON*. T
             if accountId is not None:
                 params["accountId"] = accountId
 
-            result = self._make_api_request("DELETE", endpoint, __user__, params=params)
+            result = await self._make_api_request("DELETE", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -10208,7 +10268,7 @@ This operation can be accessed anonymously.
             endpoint = f"/rest/api/2/issue/{issueIdOrKey}/watchers"
             params = None
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -10256,7 +10316,7 @@ This operation requires the **Allow users to watch issues** option to be *ON*. T
             params = None
             request_data = None
 
-            result = self._make_api_request("POST", endpoint, __user__, data=request_data, params=params)
+            result = await self._make_api_request("POST", endpoint, __user__, data=request_data, params=params)
 
             if event_emitter:
                 try:
@@ -10316,7 +10376,7 @@ Time tracking must be enabled in Jira, otherwise this operation returns an error
             if overrideEditableFlag is not None:
                 params["overrideEditableFlag"] = overrideEditableFlag
 
-            result = self._make_api_request("DELETE", endpoint, __user__, params=params)
+            result = await self._make_api_request("DELETE", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -10380,7 +10440,7 @@ This operation can be accessed anonymously.
             if expand is not None:
                 params["expand"] = expand
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -10452,7 +10512,7 @@ This operation can be accessed anonymously.
                 params["overrideEditableFlag"] = overrideEditableFlag
             request_data = None
 
-            result = self._make_api_request("POST", endpoint, __user__, data=request_data, params=params)
+            result = await self._make_api_request("POST", endpoint, __user__, data=request_data, params=params)
 
             if event_emitter:
                 try:
@@ -10517,7 +10577,7 @@ Time tracking must be enabled in Jira, otherwise this operation returns an error
                 params["overrideEditableFlag"] = overrideEditableFlag
             request_data = None
 
-            result = self._make_api_request("POST", endpoint, __user__, data=request_data, params=params)
+            result = await self._make_api_request("POST", endpoint, __user__, data=request_data, params=params)
 
             if event_emitter:
                 try:
@@ -10588,7 +10648,7 @@ This operation can be accessed anonymously.
             if overrideEditableFlag is not None:
                 params["overrideEditableFlag"] = overrideEditableFlag
 
-            result = self._make_api_request("DELETE", endpoint, __user__, params=params)
+            result = await self._make_api_request("DELETE", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -10643,7 +10703,7 @@ This operation can be accessed anonymously.
             if expand is not None:
                 params["expand"] = expand
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -10714,7 +10774,7 @@ This operation can be accessed anonymously.
                 params["overrideEditableFlag"] = overrideEditableFlag
             request_data = None
 
-            result = self._make_api_request("PUT", endpoint, __user__, data=request_data, params=params)
+            result = await self._make_api_request("PUT", endpoint, __user__, data=request_data, params=params)
 
             if event_emitter:
                 try:
@@ -10762,7 +10822,7 @@ This operation can be accessed anonymously.
             endpoint = f"/rest/api/2/issue/{issueIdOrKey}/worklog/{worklogId}/properties"
             params = None
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -10811,7 +10871,7 @@ This operation can be accessed anonymously.
             endpoint = f"/rest/api/2/issue/{issueIdOrKey}/worklog/{worklogId}/properties/{propertyKey}"
             params = None
 
-            result = self._make_api_request("DELETE", endpoint, __user__, params=params)
+            result = await self._make_api_request("DELETE", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -10860,7 +10920,7 @@ This operation can be accessed anonymously.
             endpoint = f"/rest/api/2/issue/{issueIdOrKey}/worklog/{worklogId}/properties/{propertyKey}"
             params = None
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -10913,7 +10973,7 @@ This operation can be accessed anonymously.
             params = None
             request_data = None
 
-            result = self._make_api_request("PUT", endpoint, __user__, data=request_data, params=params)
+            result = await self._make_api_request("PUT", endpoint, __user__, data=request_data, params=params)
 
             if event_emitter:
                 try:
@@ -10966,7 +11026,7 @@ This operation can be accessed anonymously.
             params = None
             request_data = None
 
-            result = self._make_api_request("POST", endpoint, __user__, data=request_data, params=params)
+            result = await self._make_api_request("POST", endpoint, __user__, data=request_data, params=params)
 
             if event_emitter:
                 try:
@@ -11013,7 +11073,7 @@ This operation can be accessed anonymously.
             endpoint = f"/rest/api/2/issueLink/{linkId}"
             params = None
 
-            result = self._make_api_request("DELETE", endpoint, __user__, params=params)
+            result = await self._make_api_request("DELETE", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -11059,7 +11119,7 @@ This operation can be accessed anonymously.
             endpoint = f"/rest/api/2/issueLink/{linkId}"
             params = None
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -11104,7 +11164,7 @@ This operation can be accessed anonymously.
             endpoint = "/rest/api/2/issueLinkType"
             params = None
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -11148,7 +11208,7 @@ To use this operation, the site must have [issue linking](https://confluence.atl
             params = None
             request_data = None
 
-            result = self._make_api_request("POST", endpoint, __user__, data=request_data, params=params)
+            result = await self._make_api_request("POST", endpoint, __user__, data=request_data, params=params)
 
             if event_emitter:
                 try:
@@ -11191,7 +11251,7 @@ To use this operation, the site must have [issue linking](https://confluence.atl
             endpoint = f"/rest/api/2/issueLinkType/{issueLinkTypeId}"
             params = None
 
-            result = self._make_api_request("DELETE", endpoint, __user__, params=params)
+            result = await self._make_api_request("DELETE", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -11236,7 +11296,7 @@ This operation can be accessed anonymously.
             endpoint = f"/rest/api/2/issueLinkType/{issueLinkTypeId}"
             params = None
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -11280,7 +11340,7 @@ To use this operation, the site must have [issue linking](https://confluence.atl
             params = None
             request_data = None
 
-            result = self._make_api_request("PUT", endpoint, __user__, data=request_data, params=params)
+            result = await self._make_api_request("PUT", endpoint, __user__, data=request_data, params=params)
 
             if event_emitter:
                 try:
@@ -11333,7 +11393,7 @@ Note that this API only exports the values of system fields and archival-specifi
             params = None
             request_data = None
 
-            result = self._make_api_request("PUT", endpoint, __user__, data=request_data, params=params)
+            result = await self._make_api_request("PUT", endpoint, __user__, data=request_data, params=params)
 
             if event_emitter:
                 try:
@@ -11374,7 +11434,7 @@ Note that this API only exports the values of system fields and archival-specifi
             endpoint = "/rest/api/2/issuesecurityschemes"
             params = None
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -11416,7 +11476,7 @@ Note that this API only exports the values of system fields and archival-specifi
             params = None
             request_data = None
 
-            result = self._make_api_request("POST", endpoint, __user__, data=request_data, params=params)
+            result = await self._make_api_request("POST", endpoint, __user__, data=request_data, params=params)
 
             if event_emitter:
                 try:
@@ -11475,7 +11535,7 @@ Filtering using IDs is inclusive: if you specify both security scheme IDs and le
             if onlyDefault is not None:
                 params["onlyDefault"] = onlyDefault
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -11517,7 +11577,7 @@ Filtering using IDs is inclusive: if you specify both security scheme IDs and le
             params = None
             request_data = None
 
-            result = self._make_api_request("PUT", endpoint, __user__, data=request_data, params=params)
+            result = await self._make_api_request("PUT", endpoint, __user__, data=request_data, params=params)
 
             if event_emitter:
                 try:
@@ -11585,7 +11645,7 @@ Filtering using parameters is inclusive: if you specify both security scheme IDs
             if expand is not None:
                 params["expand"] = expand
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -11635,7 +11695,7 @@ Filtering using parameters is inclusive: if you specify both security scheme IDs
             if projectId is not None:
                 params["projectId"] = projectId
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -11679,7 +11739,7 @@ This operation is [asynchronous](#async). Follow the `location` link in the resp
             params = None
             request_data = None
 
-            result = self._make_api_request("PUT", endpoint, __user__, data=request_data, params=params)
+            result = await self._make_api_request("PUT", endpoint, __user__, data=request_data, params=params)
 
             if event_emitter:
                 try:
@@ -11734,7 +11794,7 @@ Only issue security schemes in the context of classic projects are returned.
             if projectId is not None:
                 params["projectId"] = projectId
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -11778,7 +11838,7 @@ Only issue security schemes in the context of classic projects are returned.
             endpoint = f"/rest/api/2/issuesecurityschemes/{id}"
             params = None
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -11820,7 +11880,7 @@ Only issue security schemes in the context of classic projects are returned.
             params = None
             request_data = None
 
-            result = self._make_api_request("PUT", endpoint, __user__, data=request_data, params=params)
+            result = await self._make_api_request("PUT", endpoint, __user__, data=request_data, params=params)
 
             if event_emitter:
                 try:
@@ -11881,7 +11941,7 @@ Only issue security level members in context of classic projects are returned.
             if expand is not None:
                 params["expand"] = expand
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -11922,7 +11982,7 @@ Only issue security level members in context of classic projects are returned.
             endpoint = f"/rest/api/2/issuesecurityschemes/{schemeId}"
             params = None
 
-            result = self._make_api_request("DELETE", endpoint, __user__, params=params)
+            result = await self._make_api_request("DELETE", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -11964,7 +12024,7 @@ Only issue security level members in context of classic projects are returned.
             params = None
             request_data = None
 
-            result = self._make_api_request("PUT", endpoint, __user__, data=request_data, params=params)
+            result = await self._make_api_request("PUT", endpoint, __user__, data=request_data, params=params)
 
             if event_emitter:
                 try:
@@ -12011,7 +12071,7 @@ This operation is [asynchronous](#async). Follow the `location` link in the resp
             if replaceWith is not None:
                 params["replaceWith"] = replaceWith
 
-            result = self._make_api_request("DELETE", endpoint, __user__, params=params)
+            result = await self._make_api_request("DELETE", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -12054,7 +12114,7 @@ This operation is [asynchronous](#async). Follow the `location` link in the resp
             params = None
             request_data = None
 
-            result = self._make_api_request("PUT", endpoint, __user__, data=request_data, params=params)
+            result = await self._make_api_request("PUT", endpoint, __user__, data=request_data, params=params)
 
             if event_emitter:
                 try:
@@ -12097,7 +12157,7 @@ This operation is [asynchronous](#async). Follow the `location` link in the resp
             params = None
             request_data = None
 
-            result = self._make_api_request("PUT", endpoint, __user__, data=request_data, params=params)
+            result = await self._make_api_request("PUT", endpoint, __user__, data=request_data, params=params)
 
             if event_emitter:
                 try:
@@ -12140,7 +12200,7 @@ This operation is [asynchronous](#async). Follow the `location` link in the resp
             endpoint = f"/rest/api/2/issuesecurityschemes/{schemeId}/level/{levelId}/member/{memberId}"
             params = None
 
-            result = self._make_api_request("DELETE", endpoint, __user__, params=params)
+            result = await self._make_api_request("DELETE", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -12186,7 +12246,7 @@ This operation can be accessed anonymously.
             endpoint = "/rest/api/2/issuetype"
             params = None
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -12228,7 +12288,7 @@ This operation can be accessed anonymously.
             params = None
             request_data = None
 
-            result = self._make_api_request("POST", endpoint, __user__, data=request_data, params=params)
+            result = await self._make_api_request("POST", endpoint, __user__, data=request_data, params=params)
 
             if event_emitter:
                 try:
@@ -12280,7 +12340,7 @@ This operation can be accessed anonymously.
             if level is not None:
                 params["level"] = level
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -12324,7 +12384,7 @@ This operation can be accessed anonymously.
             if alternativeIssueTypeId is not None:
                 params["alternativeIssueTypeId"] = alternativeIssueTypeId
 
-            result = self._make_api_request("DELETE", endpoint, __user__, params=params)
+            result = await self._make_api_request("DELETE", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -12367,7 +12427,7 @@ This operation can be accessed anonymously.
             endpoint = f"/rest/api/2/issuetype/{id}"
             params = None
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -12409,7 +12469,7 @@ This operation can be accessed anonymously.
             params = None
             request_data = None
 
-            result = self._make_api_request("PUT", endpoint, __user__, data=request_data, params=params)
+            result = await self._make_api_request("PUT", endpoint, __user__, data=request_data, params=params)
 
             if event_emitter:
                 try:
@@ -12452,7 +12512,7 @@ This operation can be accessed anonymously.
             endpoint = f"/rest/api/2/issuetype/{id}/alternatives"
             params = None
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -12517,7 +12577,7 @@ After creating the avatar, use [ Update issue type](#api-rest-api-2-issuetype-id
                 params["size"] = size
             request_data = None
 
-            result = self._make_api_request("POST", endpoint, __user__, data=request_data, params=params)
+            result = await self._make_api_request("POST", endpoint, __user__, data=request_data, params=params)
 
             if event_emitter:
                 try:
@@ -12563,7 +12623,7 @@ This operation can be accessed anonymously.
             endpoint = f"/rest/api/2/issuetype/{issueTypeId}/properties"
             params = None
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -12605,7 +12665,7 @@ This operation can be accessed anonymously.
             endpoint = f"/rest/api/2/issuetype/{issueTypeId}/properties/{propertyKey}"
             params = None
 
-            result = self._make_api_request("DELETE", endpoint, __user__, params=params)
+            result = await self._make_api_request("DELETE", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -12652,7 +12712,7 @@ This operation can be accessed anonymously.
             endpoint = f"/rest/api/2/issuetype/{issueTypeId}/properties/{propertyKey}"
             params = None
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -12697,7 +12757,7 @@ The value of the request body must be a [valid](http://tools.ietf.org/html/rfc46
             params = None
             request_data = None
 
-            result = self._make_api_request("PUT", endpoint, __user__, data=request_data, params=params)
+            result = await self._make_api_request("PUT", endpoint, __user__, data=request_data, params=params)
 
             if event_emitter:
                 try:
@@ -12763,7 +12823,7 @@ Only issue type schemes used in classic projects are returned.
             if queryString is not None:
                 params["queryString"] = queryString
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -12805,7 +12865,7 @@ Only issue type schemes used in classic projects are returned.
             params = None
             request_data = None
 
-            result = self._make_api_request("POST", endpoint, __user__, data=request_data, params=params)
+            result = await self._make_api_request("POST", endpoint, __user__, data=request_data, params=params)
 
             if event_emitter:
                 try:
@@ -12856,7 +12916,7 @@ Only issue type scheme items used in classic projects are returned.
             if issueTypeSchemeId is not None:
                 params["issueTypeSchemeId"] = issueTypeSchemeId
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -12907,7 +12967,7 @@ Only issue type schemes used in classic projects are returned.
             if projectId is not None:
                 params["projectId"] = projectId
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -12953,7 +13013,7 @@ Issue type schemes can only be assigned to classic projects.
             params = None
             request_data = None
 
-            result = self._make_api_request("PUT", endpoint, __user__, data=request_data, params=params)
+            result = await self._make_api_request("PUT", endpoint, __user__, data=request_data, params=params)
 
             if event_emitter:
                 try:
@@ -12998,7 +13058,7 @@ Any projects assigned to the scheme are reassigned to the default issue type sch
             endpoint = f"/rest/api/2/issuetypescheme/{issueTypeSchemeId}"
             params = None
 
-            result = self._make_api_request("DELETE", endpoint, __user__, params=params)
+            result = await self._make_api_request("DELETE", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -13040,7 +13100,7 @@ Any projects assigned to the scheme are reassigned to the default issue type sch
             params = None
             request_data = None
 
-            result = self._make_api_request("PUT", endpoint, __user__, data=request_data, params=params)
+            result = await self._make_api_request("PUT", endpoint, __user__, data=request_data, params=params)
 
             if event_emitter:
                 try:
@@ -13086,7 +13146,7 @@ If any of the issue types exist in the issue type scheme, the operation fails an
             params = None
             request_data = None
 
-            result = self._make_api_request("PUT", endpoint, __user__, data=request_data, params=params)
+            result = await self._make_api_request("PUT", endpoint, __user__, data=request_data, params=params)
 
             if event_emitter:
                 try:
@@ -13134,7 +13194,7 @@ The request body parameters must meet the following requirements:
             params = None
             request_data = None
 
-            result = self._make_api_request("PUT", endpoint, __user__, data=request_data, params=params)
+            result = await self._make_api_request("PUT", endpoint, __user__, data=request_data, params=params)
 
             if event_emitter:
                 try:
@@ -13182,7 +13242,7 @@ This operation cannot remove:
             endpoint = f"/rest/api/2/issuetypescheme/{issueTypeSchemeId}/issuetype/{issueTypeId}"
             params = None
 
-            result = self._make_api_request("DELETE", endpoint, __user__, params=params)
+            result = await self._make_api_request("DELETE", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -13245,7 +13305,7 @@ Only issue type screen schemes used in classic projects are returned.
             if expand is not None:
                 params["expand"] = expand
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -13287,7 +13347,7 @@ Only issue type screen schemes used in classic projects are returned.
             params = None
             request_data = None
 
-            result = self._make_api_request("POST", endpoint, __user__, data=request_data, params=params)
+            result = await self._make_api_request("POST", endpoint, __user__, data=request_data, params=params)
 
             if event_emitter:
                 try:
@@ -13338,7 +13398,7 @@ Only issue type screen schemes used in classic projects are returned.
             if issueTypeScreenSchemeId is not None:
                 params["issueTypeScreenSchemeId"] = issueTypeScreenSchemeId
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -13389,7 +13449,7 @@ Only issue type screen schemes used in classic projects are returned.
             if projectId is not None:
                 params["projectId"] = projectId
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -13433,7 +13493,7 @@ Issue type screen schemes can only be assigned to classic projects.
             params = None
             request_data = None
 
-            result = self._make_api_request("PUT", endpoint, __user__, data=request_data, params=params)
+            result = await self._make_api_request("PUT", endpoint, __user__, data=request_data, params=params)
 
             if event_emitter:
                 try:
@@ -13474,7 +13534,7 @@ Issue type screen schemes can only be assigned to classic projects.
             endpoint = f"/rest/api/2/issuetypescreenscheme/{issueTypeScreenSchemeId}"
             params = None
 
-            result = self._make_api_request("DELETE", endpoint, __user__, params=params)
+            result = await self._make_api_request("DELETE", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -13516,7 +13576,7 @@ Issue type screen schemes can only be assigned to classic projects.
             params = None
             request_data = None
 
-            result = self._make_api_request("PUT", endpoint, __user__, data=request_data, params=params)
+            result = await self._make_api_request("PUT", endpoint, __user__, data=request_data, params=params)
 
             if event_emitter:
                 try:
@@ -13558,7 +13618,7 @@ Issue type screen schemes can only be assigned to classic projects.
             params = None
             request_data = None
 
-            result = self._make_api_request("PUT", endpoint, __user__, data=request_data, params=params)
+            result = await self._make_api_request("PUT", endpoint, __user__, data=request_data, params=params)
 
             if event_emitter:
                 try:
@@ -13600,7 +13660,7 @@ Issue type screen schemes can only be assigned to classic projects.
             params = None
             request_data = None
 
-            result = self._make_api_request("PUT", endpoint, __user__, data=request_data, params=params)
+            result = await self._make_api_request("PUT", endpoint, __user__, data=request_data, params=params)
 
             if event_emitter:
                 try:
@@ -13642,7 +13702,7 @@ Issue type screen schemes can only be assigned to classic projects.
             params = None
             request_data = None
 
-            result = self._make_api_request("POST", endpoint, __user__, data=request_data, params=params)
+            result = await self._make_api_request("POST", endpoint, __user__, data=request_data, params=params)
 
             if event_emitter:
                 try:
@@ -13694,7 +13754,7 @@ Only company-managed projects associated with an issue type screen scheme are re
             if query is not None:
                 params["query"] = query
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -13739,7 +13799,7 @@ This operation can be accessed anonymously.
             endpoint = "/rest/api/2/jql/autocompletedata"
             params = None
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -13785,7 +13845,7 @@ It can also return the collapsed field for custom fields. Collapsed fields enabl
             params = None
             request_data = None
 
-            result = self._make_api_request("POST", endpoint, __user__, data=request_data, params=params)
+            result = await self._make_api_request("POST", endpoint, __user__, data=request_data, params=params)
 
             if event_emitter:
                 try:
@@ -13846,7 +13906,7 @@ This operation can be accessed anonymously.
             if predicateValue is not None:
                 params["predicateValue"] = predicateValue
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -13908,7 +13968,7 @@ The new `read:app-data:jira` OAuth scope is 100% optional now, and not using it
             if orderBy is not None:
                 params["orderBy"] = orderBy
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -13954,7 +14014,7 @@ The new `write:app-data:jira` OAuth scope is 100% optional now, and not using it
                 params["skipNotFoundPrecomputations"] = skipNotFoundPrecomputations
             request_data = None
 
-            result = self._make_api_request("POST", endpoint, __user__, data=request_data, params=params)
+            result = await self._make_api_request("POST", endpoint, __user__, data=request_data, params=params)
 
             if event_emitter:
                 try:
@@ -14005,7 +14065,7 @@ The new `read:app-data:jira` OAuth scope is 100% optional now, and not using it
                 params["orderBy"] = orderBy
             request_data = None
 
-            result = self._make_api_request("POST", endpoint, __user__, data=request_data, params=params)
+            result = await self._make_api_request("POST", endpoint, __user__, data=request_data, params=params)
 
             if event_emitter:
                 try:
@@ -14050,7 +14110,7 @@ The new `read:app-data:jira` OAuth scope is 100% optional now, and not using it
             params = None
             request_data = None
 
-            result = self._make_api_request("POST", endpoint, __user__, data=request_data, params=params)
+            result = await self._make_api_request("POST", endpoint, __user__, data=request_data, params=params)
 
             if event_emitter:
                 try:
@@ -14102,7 +14162,7 @@ This operation can be accessed anonymously.
                 params["validation"] = validation
             request_data = None
 
-            result = self._make_api_request("POST", endpoint, __user__, data=request_data, params=params)
+            result = await self._make_api_request("POST", endpoint, __user__, data=request_data, params=params)
 
             if event_emitter:
                 try:
@@ -14146,7 +14206,7 @@ You may wish to use this operation if your system stores JQL queries and you wan
             params = None
             request_data = None
 
-            result = self._make_api_request("POST", endpoint, __user__, data=request_data, params=params)
+            result = await self._make_api_request("POST", endpoint, __user__, data=request_data, params=params)
 
             if event_emitter:
                 try:
@@ -14194,7 +14254,7 @@ Before sanitization each JQL query is parsed. The queries are returned in the sa
             params = None
             request_data = None
 
-            result = self._make_api_request("POST", endpoint, __user__, data=request_data, params=params)
+            result = await self._make_api_request("POST", endpoint, __user__, data=request_data, params=params)
 
             if event_emitter:
                 try:
@@ -14238,7 +14298,7 @@ Before sanitization each JQL query is parsed. The queries are returned in the sa
             if maxResults is not None:
                 params["maxResults"] = maxResults
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -14279,7 +14339,7 @@ Before sanitization each JQL query is parsed. The queries are returned in the sa
             endpoint = "/rest/api/2/license/approximateLicenseCount"
             params = None
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -14320,7 +14380,7 @@ Before sanitization each JQL query is parsed. The queries are returned in the sa
             endpoint = f"/rest/api/2/license/approximateLicenseCount/product/{applicationKey}"
             params = None
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -14399,7 +14459,7 @@ This operation can be accessed anonymously.
             if commentId is not None:
                 params["commentId"] = commentId
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -14449,7 +14509,7 @@ Use [ Update a user profile](https://developer.atlassian.com/cloud/admin/user-ma
             if key is not None:
                 params["key"] = key
 
-            result = self._make_api_request("DELETE", endpoint, __user__, params=params)
+            result = await self._make_api_request("DELETE", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -14506,7 +14566,7 @@ Use [ Update a user profile](https://developer.atlassian.com/cloud/admin/user-ma
             if key is not None:
                 params["key"] = key
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -14570,7 +14630,7 @@ Use [ Update a user profile](https://developer.atlassian.com/cloud/admin/user-ma
                 params["key"] = key
             request_data = None
 
-            result = self._make_api_request("PUT", endpoint, __user__, data=request_data, params=params)
+            result = await self._make_api_request("PUT", endpoint, __user__, data=request_data, params=params)
 
             if event_emitter:
                 try:
@@ -14613,7 +14673,7 @@ Deletes the locale of the user, which restores the default setting.
             endpoint = "/rest/api/2/mypreferences/locale"
             params = None
 
-            result = self._make_api_request("DELETE", endpoint, __user__, params=params)
+            result = await self._make_api_request("DELETE", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -14658,7 +14718,7 @@ This operation can be accessed anonymously.
             endpoint = "/rest/api/2/mypreferences/locale"
             params = None
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -14702,7 +14762,7 @@ Sets the locale of the user. The locale must be one supported by the instance of
             params = None
             request_data = None
 
-            result = self._make_api_request("PUT", endpoint, __user__, data=request_data, params=params)
+            result = await self._make_api_request("PUT", endpoint, __user__, data=request_data, params=params)
 
             if event_emitter:
                 try:
@@ -14748,7 +14808,7 @@ Sets the locale of the user. The locale must be one supported by the instance of
             if expand is not None:
                 params["expand"] = expand
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -14815,7 +14875,7 @@ Sets the locale of the user. The locale must be one supported by the instance of
             if expand is not None:
                 params["expand"] = expand
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -14857,7 +14917,7 @@ Sets the locale of the user. The locale must be one supported by the instance of
             params = None
             request_data = None
 
-            result = self._make_api_request("POST", endpoint, __user__, data=request_data, params=params)
+            result = await self._make_api_request("POST", endpoint, __user__, data=request_data, params=params)
 
             if event_emitter:
                 try:
@@ -14909,7 +14969,7 @@ Sets the locale of the user. The locale must be one supported by the instance of
             if projectId is not None:
                 params["projectId"] = projectId
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -14960,7 +15020,7 @@ Sets the locale of the user. The locale must be one supported by the instance of
             if expand is not None:
                 params["expand"] = expand
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -15002,7 +15062,7 @@ Sets the locale of the user. The locale must be one supported by the instance of
             params = None
             request_data = None
 
-            result = self._make_api_request("PUT", endpoint, __user__, data=request_data, params=params)
+            result = await self._make_api_request("PUT", endpoint, __user__, data=request_data, params=params)
 
             if event_emitter:
                 try:
@@ -15046,7 +15106,7 @@ Sets the locale of the user. The locale must be one supported by the instance of
             params = None
             request_data = None
 
-            result = self._make_api_request("PUT", endpoint, __user__, data=request_data, params=params)
+            result = await self._make_api_request("PUT", endpoint, __user__, data=request_data, params=params)
 
             if event_emitter:
                 try:
@@ -15087,7 +15147,7 @@ Sets the locale of the user. The locale must be one supported by the instance of
             endpoint = f"/rest/api/2/notificationscheme/{notificationSchemeId}"
             params = None
 
-            result = self._make_api_request("DELETE", endpoint, __user__, params=params)
+            result = await self._make_api_request("DELETE", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -15129,7 +15189,7 @@ Sets the locale of the user. The locale must be one supported by the instance of
             endpoint = f"/rest/api/2/notificationscheme/{notificationSchemeId}/notification/{notificationId}"
             params = None
 
-            result = self._make_api_request("DELETE", endpoint, __user__, params=params)
+            result = await self._make_api_request("DELETE", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -15176,7 +15236,7 @@ This operation can be accessed anonymously.
             endpoint = "/rest/api/2/permissions"
             params = None
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -15237,7 +15297,7 @@ This operation can be accessed anonymously.
             params = None
             request_data = None
 
-            result = self._make_api_request("POST", endpoint, __user__, data=request_data, params=params)
+            result = await self._make_api_request("POST", endpoint, __user__, data=request_data, params=params)
 
             if event_emitter:
                 try:
@@ -15281,7 +15341,7 @@ This operation can be accessed anonymously.
             params = None
             request_data = None
 
-            result = self._make_api_request("POST", endpoint, __user__, data=request_data, params=params)
+            result = await self._make_api_request("POST", endpoint, __user__, data=request_data, params=params)
 
             if event_emitter:
                 try:
@@ -15415,7 +15475,7 @@ The [built-in Jira permissions](https://confluence.atlassian.com/x/yodKLg) are l
             if expand is not None:
                 params["expand"] = expand
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -15466,7 +15526,7 @@ The [built-in Jira permissions](https://confluence.atlassian.com/x/yodKLg) are l
                 params["expand"] = expand
             request_data = None
 
-            result = self._make_api_request("POST", endpoint, __user__, data=request_data, params=params)
+            result = await self._make_api_request("POST", endpoint, __user__, data=request_data, params=params)
 
             if event_emitter:
                 try:
@@ -15507,7 +15567,7 @@ The [built-in Jira permissions](https://confluence.atlassian.com/x/yodKLg) are l
             endpoint = f"/rest/api/2/permissionscheme/{schemeId}"
             params = None
 
-            result = self._make_api_request("DELETE", endpoint, __user__, params=params)
+            result = await self._make_api_request("DELETE", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -15558,7 +15618,7 @@ The [built-in Jira permissions](https://confluence.atlassian.com/x/yodKLg) are l
             if expand is not None:
                 params["expand"] = expand
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -15618,7 +15678,7 @@ See [About permission schemes and grants](../api-group-permission-schemes/#about
                 params["expand"] = expand
             request_data = None
 
-            result = self._make_api_request("PUT", endpoint, __user__, data=request_data, params=params)
+            result = await self._make_api_request("PUT", endpoint, __user__, data=request_data, params=params)
 
             if event_emitter:
                 try:
@@ -15669,7 +15729,7 @@ See [About permission schemes and grants](../api-group-permission-schemes/#about
             if expand is not None:
                 params["expand"] = expand
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -15721,7 +15781,7 @@ See [About permission schemes and grants](../api-group-permission-schemes/#about
                 params["expand"] = expand
             request_data = None
 
-            result = self._make_api_request("POST", endpoint, __user__, data=request_data, params=params)
+            result = await self._make_api_request("POST", endpoint, __user__, data=request_data, params=params)
 
             if event_emitter:
                 try:
@@ -15763,7 +15823,7 @@ See [About permission schemes and grants](../api-group-permission-schemes/#about
             endpoint = f"/rest/api/2/permissionscheme/{schemeId}/permission/{permissionId}"
             params = None
 
-            result = self._make_api_request("DELETE", endpoint, __user__, params=params)
+            result = await self._make_api_request("DELETE", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -15815,7 +15875,7 @@ See [About permission schemes and grants](../api-group-permission-schemes/#about
             if expand is not None:
                 params["expand"] = expand
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -15867,7 +15927,7 @@ See [About permission schemes and grants](../api-group-permission-schemes/#about
             if maxResults is not None:
                 params["maxResults"] = maxResults
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -15911,7 +15971,7 @@ See [About permission schemes and grants](../api-group-permission-schemes/#about
                 params["useGroupId"] = useGroupId
             request_data = None
 
-            result = self._make_api_request("POST", endpoint, __user__, data=request_data, params=params)
+            result = await self._make_api_request("POST", endpoint, __user__, data=request_data, params=params)
 
             if event_emitter:
                 try:
@@ -15955,7 +16015,7 @@ See [About permission schemes and grants](../api-group-permission-schemes/#about
             if useGroupId is not None:
                 params["useGroupId"] = useGroupId
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -16045,7 +16105,7 @@ See [About permission schemes and grants](../api-group-permission-schemes/#about
                 params["useGroupId"] = useGroupId
             request_data = None
 
-            result = self._make_api_request("PUT", endpoint, __user__, data=request_data, params=params)
+            result = await self._make_api_request("PUT", endpoint, __user__, data=request_data, params=params)
 
             if event_emitter:
                 try:
@@ -16087,7 +16147,7 @@ See [About permission schemes and grants](../api-group-permission-schemes/#about
             params = None
             request_data = None
 
-            result = self._make_api_request("PUT", endpoint, __user__, data=request_data, params=params)
+            result = await self._make_api_request("PUT", endpoint, __user__, data=request_data, params=params)
 
             if event_emitter:
                 try:
@@ -16129,7 +16189,7 @@ See [About permission schemes and grants](../api-group-permission-schemes/#about
             params = None
             request_data = None
 
-            result = self._make_api_request("POST", endpoint, __user__, data=request_data, params=params)
+            result = await self._make_api_request("POST", endpoint, __user__, data=request_data, params=params)
 
             if event_emitter:
                 try:
@@ -16176,7 +16236,7 @@ See [About permission schemes and grants](../api-group-permission-schemes/#about
             if maxResults is not None:
                 params["maxResults"] = maxResults
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -16218,7 +16278,7 @@ See [About permission schemes and grants](../api-group-permission-schemes/#about
             params = None
             request_data = None
 
-            result = self._make_api_request("POST", endpoint, __user__, data=request_data, params=params)
+            result = await self._make_api_request("POST", endpoint, __user__, data=request_data, params=params)
 
             if event_emitter:
                 try:
@@ -16260,7 +16320,7 @@ See [About permission schemes and grants](../api-group-permission-schemes/#about
             endpoint = f"/rest/api/2/plans/plan/{planId}/team/atlassian/{atlassianTeamId}"
             params = None
 
-            result = self._make_api_request("DELETE", endpoint, __user__, params=params)
+            result = await self._make_api_request("DELETE", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -16302,7 +16362,7 @@ See [About permission schemes and grants](../api-group-permission-schemes/#about
             endpoint = f"/rest/api/2/plans/plan/{planId}/team/atlassian/{atlassianTeamId}"
             params = None
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -16352,7 +16412,7 @@ See [About permission schemes and grants](../api-group-permission-schemes/#about
             params = None
             request_data = None
 
-            result = self._make_api_request("PUT", endpoint, __user__, data=request_data, params=params)
+            result = await self._make_api_request("PUT", endpoint, __user__, data=request_data, params=params)
 
             if event_emitter:
                 try:
@@ -16394,7 +16454,7 @@ See [About permission schemes and grants](../api-group-permission-schemes/#about
             params = None
             request_data = None
 
-            result = self._make_api_request("POST", endpoint, __user__, data=request_data, params=params)
+            result = await self._make_api_request("POST", endpoint, __user__, data=request_data, params=params)
 
             if event_emitter:
                 try:
@@ -16436,7 +16496,7 @@ See [About permission schemes and grants](../api-group-permission-schemes/#about
             endpoint = f"/rest/api/2/plans/plan/{planId}/team/planonly/{planOnlyTeamId}"
             params = None
 
-            result = self._make_api_request("DELETE", endpoint, __user__, params=params)
+            result = await self._make_api_request("DELETE", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -16478,7 +16538,7 @@ See [About permission schemes and grants](../api-group-permission-schemes/#about
             endpoint = f"/rest/api/2/plans/plan/{planId}/team/planonly/{planOnlyTeamId}"
             params = None
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -16530,7 +16590,7 @@ See [About permission schemes and grants](../api-group-permission-schemes/#about
             params = None
             request_data = None
 
-            result = self._make_api_request("PUT", endpoint, __user__, data=request_data, params=params)
+            result = await self._make_api_request("PUT", endpoint, __user__, data=request_data, params=params)
 
             if event_emitter:
                 try:
@@ -16572,7 +16632,7 @@ See [About permission schemes and grants](../api-group-permission-schemes/#about
             params = None
             request_data = None
 
-            result = self._make_api_request("PUT", endpoint, __user__, data=request_data, params=params)
+            result = await self._make_api_request("PUT", endpoint, __user__, data=request_data, params=params)
 
             if event_emitter:
                 try:
@@ -16613,7 +16673,7 @@ See [About permission schemes and grants](../api-group-permission-schemes/#about
             endpoint = "/rest/api/2/priority"
             params = None
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -16657,7 +16717,7 @@ Deprecation applies to iconUrl param in request body which will be sunset on 16t
             params = None
             request_data = None
 
-            result = self._make_api_request("POST", endpoint, __user__, data=request_data, params=params)
+            result = await self._make_api_request("POST", endpoint, __user__, data=request_data, params=params)
 
             if event_emitter:
                 try:
@@ -16699,7 +16759,7 @@ Deprecation applies to iconUrl param in request body which will be sunset on 16t
             params = None
             request_data = None
 
-            result = self._make_api_request("PUT", endpoint, __user__, data=request_data, params=params)
+            result = await self._make_api_request("PUT", endpoint, __user__, data=request_data, params=params)
 
             if event_emitter:
                 try:
@@ -16741,7 +16801,7 @@ Deprecation applies to iconUrl param in request body which will be sunset on 16t
             params = None
             request_data = None
 
-            result = self._make_api_request("PUT", endpoint, __user__, data=request_data, params=params)
+            result = await self._make_api_request("PUT", endpoint, __user__, data=request_data, params=params)
 
             if event_emitter:
                 try:
@@ -16806,7 +16866,7 @@ Deprecation applies to iconUrl param in request body which will be sunset on 16t
             if expand is not None:
                 params["expand"] = expand
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -16849,7 +16909,7 @@ This operation is [asynchronous](#async). Follow the `location` link in the resp
             endpoint = f"/rest/api/2/priority/{id}"
             params = None
 
-            result = self._make_api_request("DELETE", endpoint, __user__, params=params)
+            result = await self._make_api_request("DELETE", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -16890,7 +16950,7 @@ This operation is [asynchronous](#async). Follow the `location` link in the resp
             endpoint = f"/rest/api/2/priority/{id}"
             params = None
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -16936,7 +16996,7 @@ Deprecation applies to iconUrl param in request body which will be sunset on 16t
             params = None
             request_data = None
 
-            result = self._make_api_request("PUT", endpoint, __user__, data=request_data, params=params)
+            result = await self._make_api_request("PUT", endpoint, __user__, data=request_data, params=params)
 
             if event_emitter:
                 try:
@@ -17000,7 +17060,7 @@ Deprecation applies to iconUrl param in request body which will be sunset on 16t
             if expand is not None:
                 params["expand"] = expand
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -17042,7 +17102,7 @@ Deprecation applies to iconUrl param in request body which will be sunset on 16t
             params = None
             request_data = None
 
-            result = self._make_api_request("POST", endpoint, __user__, data=request_data, params=params)
+            result = await self._make_api_request("POST", endpoint, __user__, data=request_data, params=params)
 
             if event_emitter:
                 try:
@@ -17084,7 +17144,7 @@ Deprecation applies to iconUrl param in request body which will be sunset on 16t
             params = None
             request_data = None
 
-            result = self._make_api_request("POST", endpoint, __user__, data=request_data, params=params)
+            result = await self._make_api_request("POST", endpoint, __user__, data=request_data, params=params)
 
             if event_emitter:
                 try:
@@ -17139,7 +17199,7 @@ Deprecation applies to iconUrl param in request body which will be sunset on 16t
             if exclude is not None:
                 params["exclude"] = exclude
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -17182,7 +17242,7 @@ This operation is only available for priority schemes without any associated pro
             endpoint = f"/rest/api/2/priorityscheme/{schemeId}"
             params = None
 
-            result = self._make_api_request("DELETE", endpoint, __user__, params=params)
+            result = await self._make_api_request("DELETE", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -17224,7 +17284,7 @@ This operation is only available for priority schemes without any associated pro
             params = None
             request_data = None
 
-            result = self._make_api_request("PUT", endpoint, __user__, data=request_data, params=params)
+            result = await self._make_api_request("PUT", endpoint, __user__, data=request_data, params=params)
 
             if event_emitter:
                 try:
@@ -17271,7 +17331,7 @@ This operation is only available for priority schemes without any associated pro
             if maxResults is not None:
                 params["maxResults"] = maxResults
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -17324,7 +17384,7 @@ This operation is only available for priority schemes without any associated pro
             if query is not None:
                 params["query"] = query
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -17380,7 +17440,7 @@ This operation can be accessed anonymously.
             if properties is not None:
                 params["properties"] = properties
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -17435,7 +17495,7 @@ To determine which features are installed, go to **Jira settings** > **Apps** >
             params = None
             request_data = None
 
-            result = self._make_api_request("POST", endpoint, __user__, data=request_data, params=params)
+            result = await self._make_api_request("POST", endpoint, __user__, data=request_data, params=params)
 
             if event_emitter:
                 try:
@@ -17496,7 +17556,7 @@ This operation can be accessed anonymously.
             if properties is not None:
                 params["properties"] = properties
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -17613,7 +17673,7 @@ This operation can be accessed anonymously.
             if propertyQuery is not None:
                 params["propertyQuery"] = propertyQuery
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -17656,7 +17716,7 @@ This operation can be accessed anonymously.
             endpoint = "/rest/api/2/project/type"
             params = None
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -17695,7 +17755,7 @@ This operation can be accessed anonymously.
             endpoint = "/rest/api/2/project/type/accessible"
             params = None
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -17738,7 +17798,7 @@ This operation can be accessed anonymously.
             endpoint = f"/rest/api/2/project/type/{projectTypeKey}"
             params = None
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -17779,7 +17839,7 @@ This operation can be accessed anonymously.
             endpoint = f"/rest/api/2/project/type/{projectTypeKey}/accessible"
             params = None
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -17825,7 +17885,7 @@ You can't delete a project if it's archived. To delete an archived project, rest
             if enableUndo is not None:
                 params["enableUndo"] = enableUndo
 
-            result = self._make_api_request("DELETE", endpoint, __user__, params=params)
+            result = await self._make_api_request("DELETE", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -17880,7 +17940,7 @@ This operation can be accessed anonymously.
             if properties is not None:
                 params["properties"] = properties
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -17932,7 +17992,7 @@ All parameters are optional in the body of the request. Schemes will only be upd
                 params["expand"] = expand
             request_data = None
 
-            result = self._make_api_request("PUT", endpoint, __user__, data=request_data, params=params)
+            result = await self._make_api_request("PUT", endpoint, __user__, data=request_data, params=params)
 
             if event_emitter:
                 try:
@@ -17974,7 +18034,7 @@ All parameters are optional in the body of the request. Schemes will only be upd
             params = None
             request_data = None
 
-            result = self._make_api_request("POST", endpoint, __user__, data=request_data, params=params)
+            result = await self._make_api_request("POST", endpoint, __user__, data=request_data, params=params)
 
             if event_emitter:
                 try:
@@ -18018,7 +18078,7 @@ Use [Load project avatar](#api-rest-api-2-project-projectIdOrKey-avatar2-post) t
             params = None
             request_data = None
 
-            result = self._make_api_request("PUT", endpoint, __user__, data=request_data, params=params)
+            result = await self._make_api_request("PUT", endpoint, __user__, data=request_data, params=params)
 
             if event_emitter:
                 try:
@@ -18060,7 +18120,7 @@ Use [Load project avatar](#api-rest-api-2-project-projectIdOrKey-avatar2-post) t
             endpoint = f"/rest/api/2/project/{projectIdOrKey}/avatar/{id}"
             params = None
 
-            result = self._make_api_request("DELETE", endpoint, __user__, params=params)
+            result = await self._make_api_request("DELETE", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -18135,7 +18195,7 @@ After creating the avatar use [Set project avatar](#api-rest-api-2-project-proje
                 params["size"] = size
             request_data = None
 
-            result = self._make_api_request("POST", endpoint, __user__, data=request_data, params=params)
+            result = await self._make_api_request("POST", endpoint, __user__, data=request_data, params=params)
 
             if event_emitter:
                 try:
@@ -18178,7 +18238,7 @@ This operation can be accessed anonymously.
             endpoint = f"/rest/api/2/project/{projectIdOrKey}/avatars"
             params = None
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -18222,7 +18282,7 @@ This operation can be accessed anonymously.
             endpoint = f"/rest/api/2/project/{projectIdOrKey}/classification-level/default"
             params = None
 
-            result = self._make_api_request("DELETE", endpoint, __user__, params=params)
+            result = await self._make_api_request("DELETE", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -18267,7 +18327,7 @@ This operation can be accessed anonymously.
             endpoint = f"/rest/api/2/project/{projectIdOrKey}/classification-level/default"
             params = None
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -18312,7 +18372,7 @@ This operation can be accessed anonymously.
             params = None
             request_data = None
 
-            result = self._make_api_request("PUT", endpoint, __user__, data=request_data, params=params)
+            result = await self._make_api_request("PUT", endpoint, __user__, data=request_data, params=params)
 
             if event_emitter:
                 try:
@@ -18377,7 +18437,7 @@ This operation can be accessed anonymously.
             if query is not None:
                 params["query"] = query
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -18425,7 +18485,7 @@ This operation can be accessed anonymously.
             if componentSource is not None:
                 params["componentSource"] = componentSource
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -18472,7 +18532,7 @@ This operation is:
             params = None
             request_data = None
 
-            result = self._make_api_request("POST", endpoint, __user__, data=request_data, params=params)
+            result = await self._make_api_request("POST", endpoint, __user__, data=request_data, params=params)
 
             if event_emitter:
                 try:
@@ -18511,7 +18571,7 @@ This operation is:
             endpoint = f"/rest/api/2/project/{projectIdOrKey}/features"
             params = None
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -18552,7 +18612,7 @@ This operation is:
             params = None
             request_data = None
 
-            result = self._make_api_request("PUT", endpoint, __user__, data=request_data, params=params)
+            result = await self._make_api_request("PUT", endpoint, __user__, data=request_data, params=params)
 
             if event_emitter:
                 try:
@@ -18595,7 +18655,7 @@ This operation can be accessed anonymously.
             endpoint = f"/rest/api/2/project/{projectIdOrKey}/properties"
             params = None
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -18639,7 +18699,7 @@ This operation can be accessed anonymously.
             endpoint = f"/rest/api/2/project/{projectIdOrKey}/properties/{propertyKey}"
             params = None
 
-            result = self._make_api_request("DELETE", endpoint, __user__, params=params)
+            result = await self._make_api_request("DELETE", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -18683,7 +18743,7 @@ This operation can be accessed anonymously.
             endpoint = f"/rest/api/2/project/{projectIdOrKey}/properties/{propertyKey}"
             params = None
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -18730,7 +18790,7 @@ This operation can be accessed anonymously.
             params = None
             request_data = None
 
-            result = self._make_api_request("PUT", endpoint, __user__, data=request_data, params=params)
+            result = await self._make_api_request("PUT", endpoint, __user__, data=request_data, params=params)
 
             if event_emitter:
                 try:
@@ -18775,7 +18835,7 @@ This operation can be accessed anonymously.
             params = None
             request_data = None
 
-            result = self._make_api_request("POST", endpoint, __user__, data=request_data, params=params)
+            result = await self._make_api_request("POST", endpoint, __user__, data=request_data, params=params)
 
             if event_emitter:
                 try:
@@ -18820,7 +18880,7 @@ This operation can be accessed anonymously.
             endpoint = f"/rest/api/2/project/{projectIdOrKey}/role"
             params = None
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -18875,7 +18935,7 @@ This operation can be accessed anonymously.
             if groupId is not None:
                 params["groupId"] = groupId
 
-            result = self._make_api_request("DELETE", endpoint, __user__, params=params)
+            result = await self._make_api_request("DELETE", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -18924,7 +18984,7 @@ This operation can be accessed anonymously.
             if excludeInactiveUsers is not None:
                 params["excludeInactiveUsers"] = excludeInactiveUsers
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -18971,7 +19031,7 @@ This operation can be accessed anonymously.
             params = None
             request_data = None
 
-            result = self._make_api_request("POST", endpoint, __user__, data=request_data, params=params)
+            result = await self._make_api_request("POST", endpoint, __user__, data=request_data, params=params)
 
             if event_emitter:
                 try:
@@ -19016,7 +19076,7 @@ To add actors to the project without overwriting the existing list, use [Add act
             params = None
             request_data = None
 
-            result = self._make_api_request("PUT", endpoint, __user__, data=request_data, params=params)
+            result = await self._make_api_request("PUT", endpoint, __user__, data=request_data, params=params)
 
             if event_emitter:
                 try:
@@ -19065,7 +19125,7 @@ This operation can be accessed anonymously.
             if excludeConnectAddons is not None:
                 params["excludeConnectAddons"] = excludeConnectAddons
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -19108,7 +19168,7 @@ This operation can be accessed anonymously.
             endpoint = f"/rest/api/2/project/{projectIdOrKey}/statuses"
             params = None
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -19180,7 +19240,7 @@ This operation can be accessed anonymously.
             if expand is not None:
                 params["expand"] = expand
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -19226,7 +19286,7 @@ This operation can be accessed anonymously.
             if expand is not None:
                 params["expand"] = expand
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -19267,7 +19327,7 @@ This operation can be accessed anonymously.
             endpoint = f"/rest/api/2/project/{projectId}/email"
             params = None
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -19311,7 +19371,7 @@ If `emailAddress` is an empty string, the default email address is restored.
             params = None
             request_data = None
 
-            result = self._make_api_request("PUT", endpoint, __user__, data=request_data, params=params)
+            result = await self._make_api_request("PUT", endpoint, __user__, data=request_data, params=params)
 
             if event_emitter:
                 try:
@@ -19358,7 +19418,7 @@ The issue type hierarchy for a project consists of:
             endpoint = f"/rest/api/2/project/{projectId}/hierarchy"
             params = None
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -19399,7 +19459,7 @@ The issue type hierarchy for a project consists of:
             endpoint = f"/rest/api/2/project/{projectKeyOrId}/issuesecuritylevelscheme"
             params = None
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -19450,7 +19510,7 @@ The issue type hierarchy for a project consists of:
             if expand is not None:
                 params["expand"] = expand
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -19501,7 +19561,7 @@ The issue type hierarchy for a project consists of:
             if expand is not None:
                 params["expand"] = expand
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -19553,7 +19613,7 @@ The issue type hierarchy for a project consists of:
                 params["expand"] = expand
             request_data = None
 
-            result = self._make_api_request("PUT", endpoint, __user__, data=request_data, params=params)
+            result = await self._make_api_request("PUT", endpoint, __user__, data=request_data, params=params)
 
             if event_emitter:
                 try:
@@ -19596,7 +19656,7 @@ This operation can be accessed anonymously.
             endpoint = f"/rest/api/2/project/{projectKeyOrId}/securitylevel"
             params = None
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -19637,7 +19697,7 @@ This operation can be accessed anonymously.
             endpoint = "/rest/api/2/projectCategory"
             params = None
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -19679,7 +19739,7 @@ This operation can be accessed anonymously.
             params = None
             request_data = None
 
-            result = self._make_api_request("POST", endpoint, __user__, data=request_data, params=params)
+            result = await self._make_api_request("POST", endpoint, __user__, data=request_data, params=params)
 
             if event_emitter:
                 try:
@@ -19720,7 +19780,7 @@ This operation can be accessed anonymously.
             endpoint = f"/rest/api/2/projectCategory/{id}"
             params = None
 
-            result = self._make_api_request("DELETE", endpoint, __user__, params=params)
+            result = await self._make_api_request("DELETE", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -19761,7 +19821,7 @@ This operation can be accessed anonymously.
             endpoint = f"/rest/api/2/projectCategory/{id}"
             params = None
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -19803,7 +19863,7 @@ This operation can be accessed anonymously.
             params = None
             request_data = None
 
-            result = self._make_api_request("PUT", endpoint, __user__, data=request_data, params=params)
+            result = await self._make_api_request("PUT", endpoint, __user__, data=request_data, params=params)
 
             if event_emitter:
                 try:
@@ -19846,7 +19906,7 @@ This operation can be accessed anonymously.
             if key is not None:
                 params["key"] = key
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -19889,7 +19949,7 @@ This operation can be accessed anonymously.
             if key is not None:
                 params["key"] = key
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -19932,7 +19992,7 @@ This operation can be accessed anonymously.
             if name is not None:
                 params["name"] = name
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -19973,7 +20033,7 @@ This operation can be accessed anonymously.
             endpoint = "/rest/api/2/resolution"
             params = None
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -20015,7 +20075,7 @@ This operation can be accessed anonymously.
             params = None
             request_data = None
 
-            result = self._make_api_request("POST", endpoint, __user__, data=request_data, params=params)
+            result = await self._make_api_request("POST", endpoint, __user__, data=request_data, params=params)
 
             if event_emitter:
                 try:
@@ -20057,7 +20117,7 @@ This operation can be accessed anonymously.
             params = None
             request_data = None
 
-            result = self._make_api_request("PUT", endpoint, __user__, data=request_data, params=params)
+            result = await self._make_api_request("PUT", endpoint, __user__, data=request_data, params=params)
 
             if event_emitter:
                 try:
@@ -20099,7 +20159,7 @@ This operation can be accessed anonymously.
             params = None
             request_data = None
 
-            result = self._make_api_request("PUT", endpoint, __user__, data=request_data, params=params)
+            result = await self._make_api_request("PUT", endpoint, __user__, data=request_data, params=params)
 
             if event_emitter:
                 try:
@@ -20154,7 +20214,7 @@ This operation can be accessed anonymously.
             if onlyDefault is not None:
                 params["onlyDefault"] = onlyDefault
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -20200,7 +20260,7 @@ This operation is [asynchronous](#async). Follow the `location` link in the resp
             if replaceWith is not None:
                 params["replaceWith"] = replaceWith
 
-            result = self._make_api_request("DELETE", endpoint, __user__, params=params)
+            result = await self._make_api_request("DELETE", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -20241,7 +20301,7 @@ This operation is [asynchronous](#async). Follow the `location` link in the resp
             endpoint = f"/rest/api/2/resolution/{id}"
             params = None
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -20283,7 +20343,7 @@ This operation is [asynchronous](#async). Follow the `location` link in the resp
             params = None
             request_data = None
 
-            result = self._make_api_request("PUT", endpoint, __user__, data=request_data, params=params)
+            result = await self._make_api_request("PUT", endpoint, __user__, data=request_data, params=params)
 
             if event_emitter:
                 try:
@@ -20339,7 +20399,7 @@ Actors may be set as [default members](https://support.atlassian.com/jira-cloud-
             endpoint = "/rest/api/2/role"
             params = None
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -20383,7 +20443,7 @@ Actors may be set as [default members](https://support.atlassian.com/jira-cloud-
             params = None
             request_data = None
 
-            result = self._make_api_request("POST", endpoint, __user__, data=request_data, params=params)
+            result = await self._make_api_request("POST", endpoint, __user__, data=request_data, params=params)
 
             if event_emitter:
                 try:
@@ -20427,7 +20487,7 @@ Actors may be set as [default members](https://support.atlassian.com/jira-cloud-
             if swap is not None:
                 params["swap"] = swap
 
-            result = self._make_api_request("DELETE", endpoint, __user__, params=params)
+            result = await self._make_api_request("DELETE", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -20468,7 +20528,7 @@ Actors may be set as [default members](https://support.atlassian.com/jira-cloud-
             endpoint = f"/rest/api/2/role/{id}"
             params = None
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -20512,7 +20572,7 @@ You cannot update both the name and description at the same time using this oper
             params = None
             request_data = None
 
-            result = self._make_api_request("POST", endpoint, __user__, data=request_data, params=params)
+            result = await self._make_api_request("POST", endpoint, __user__, data=request_data, params=params)
 
             if event_emitter:
                 try:
@@ -20554,7 +20614,7 @@ You cannot update both the name and description at the same time using this oper
             params = None
             request_data = None
 
-            result = self._make_api_request("PUT", endpoint, __user__, data=request_data, params=params)
+            result = await self._make_api_request("PUT", endpoint, __user__, data=request_data, params=params)
 
             if event_emitter:
                 try:
@@ -20606,7 +20666,7 @@ Changing a project role's default actors does not affect project role members fo
             if group is not None:
                 params["group"] = group
 
-            result = self._make_api_request("DELETE", endpoint, __user__, params=params)
+            result = await self._make_api_request("DELETE", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -20647,7 +20707,7 @@ Changing a project role's default actors does not affect project role members fo
             endpoint = f"/rest/api/2/role/{id}/actors"
             params = None
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -20691,7 +20751,7 @@ Changing a project role's default actors does not affect project role members fo
             params = None
             request_data = None
 
-            result = self._make_api_request("POST", endpoint, __user__, data=request_data, params=params)
+            result = await self._make_api_request("POST", endpoint, __user__, data=request_data, params=params)
 
             if event_emitter:
                 try:
@@ -20752,7 +20812,7 @@ Changing a project role's default actors does not affect project role members fo
             if orderBy is not None:
                 params["orderBy"] = orderBy
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -20794,7 +20854,7 @@ Changing a project role's default actors does not affect project role members fo
             params = None
             request_data = None
 
-            result = self._make_api_request("POST", endpoint, __user__, data=request_data, params=params)
+            result = await self._make_api_request("POST", endpoint, __user__, data=request_data, params=params)
 
             if event_emitter:
                 try:
@@ -20836,7 +20896,7 @@ Changing a project role's default actors does not affect project role members fo
             params = None
             request_data = None
 
-            result = self._make_api_request("POST", endpoint, __user__, data=request_data, params=params)
+            result = await self._make_api_request("POST", endpoint, __user__, data=request_data, params=params)
 
             if event_emitter:
                 try:
@@ -20890,7 +20950,7 @@ Changing a project role's default actors does not affect project role members fo
             if maxResult is not None:
                 params["maxResult"] = maxResult
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -20931,7 +20991,7 @@ Only screens used in classic projects can be deleted.
             endpoint = f"/rest/api/2/screens/{screenId}"
             params = None
 
-            result = self._make_api_request("DELETE", endpoint, __user__, params=params)
+            result = await self._make_api_request("DELETE", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -20973,7 +21033,7 @@ Only screens used in classic projects can be deleted.
             params = None
             request_data = None
 
-            result = self._make_api_request("PUT", endpoint, __user__, data=request_data, params=params)
+            result = await self._make_api_request("PUT", endpoint, __user__, data=request_data, params=params)
 
             if event_emitter:
                 try:
@@ -21014,7 +21074,7 @@ Only screens used in classic projects can be deleted.
             endpoint = f"/rest/api/2/screens/{screenId}/availableFields"
             params = None
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -21061,7 +21121,7 @@ Only screens used in classic projects can be deleted.
             if projectKey is not None:
                 params["projectKey"] = projectKey
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -21103,7 +21163,7 @@ Only screens used in classic projects can be deleted.
             params = None
             request_data = None
 
-            result = self._make_api_request("POST", endpoint, __user__, data=request_data, params=params)
+            result = await self._make_api_request("POST", endpoint, __user__, data=request_data, params=params)
 
             if event_emitter:
                 try:
@@ -21145,7 +21205,7 @@ Only screens used in classic projects can be deleted.
             endpoint = f"/rest/api/2/screens/{screenId}/tabs/{tabId}"
             params = None
 
-            result = self._make_api_request("DELETE", endpoint, __user__, params=params)
+            result = await self._make_api_request("DELETE", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -21188,7 +21248,7 @@ Only screens used in classic projects can be deleted.
             params = None
             request_data = None
 
-            result = self._make_api_request("PUT", endpoint, __user__, data=request_data, params=params)
+            result = await self._make_api_request("PUT", endpoint, __user__, data=request_data, params=params)
 
             if event_emitter:
                 try:
@@ -21236,7 +21296,7 @@ Only screens used in classic projects can be deleted.
             if projectKey is not None:
                 params["projectKey"] = projectKey
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -21279,7 +21339,7 @@ Only screens used in classic projects can be deleted.
             params = None
             request_data = None
 
-            result = self._make_api_request("POST", endpoint, __user__, data=request_data, params=params)
+            result = await self._make_api_request("POST", endpoint, __user__, data=request_data, params=params)
 
             if event_emitter:
                 try:
@@ -21322,7 +21382,7 @@ Only screens used in classic projects can be deleted.
             endpoint = f"/rest/api/2/screens/{screenId}/tabs/{tabId}/fields/{id}"
             params = None
 
-            result = self._make_api_request("DELETE", endpoint, __user__, params=params)
+            result = await self._make_api_request("DELETE", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -21368,7 +21428,7 @@ If `after` and `position` are provided in the request, `position` is ignored.
             params = None
             request_data = None
 
-            result = self._make_api_request("POST", endpoint, __user__, data=request_data, params=params)
+            result = await self._make_api_request("POST", endpoint, __user__, data=request_data, params=params)
 
             if event_emitter:
                 try:
@@ -21412,7 +21472,7 @@ If `after` and `position` are provided in the request, `position` is ignored.
             params = None
             request_data = None
 
-            result = self._make_api_request("POST", endpoint, __user__, data=request_data, params=params)
+            result = await self._make_api_request("POST", endpoint, __user__, data=request_data, params=params)
 
             if event_emitter:
                 try:
@@ -21475,7 +21535,7 @@ Only screen schemes used in classic projects are returned.
             if orderBy is not None:
                 params["orderBy"] = orderBy
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -21517,7 +21577,7 @@ Only screen schemes used in classic projects are returned.
             params = None
             request_data = None
 
-            result = self._make_api_request("POST", endpoint, __user__, data=request_data, params=params)
+            result = await self._make_api_request("POST", endpoint, __user__, data=request_data, params=params)
 
             if event_emitter:
                 try:
@@ -21560,7 +21620,7 @@ Only screens schemes used in classic projects can be deleted.
             endpoint = f"/rest/api/2/screenscheme/{screenSchemeId}"
             params = None
 
-            result = self._make_api_request("DELETE", endpoint, __user__, params=params)
+            result = await self._make_api_request("DELETE", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -21602,7 +21662,7 @@ Only screens schemes used in classic projects can be deleted.
             params = None
             request_data = None
 
-            result = self._make_api_request("PUT", endpoint, __user__, data=request_data, params=params)
+            result = await self._make_api_request("PUT", endpoint, __user__, data=request_data, params=params)
 
             if event_emitter:
                 try:
@@ -21711,7 +21771,7 @@ Note: All navigable fields are returned by default. This differs from [GET issue
             if failFast is not None:
                 params["failFast"] = failFast
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -21760,7 +21820,7 @@ This operation can be accessed anonymously.
             params = None
             request_data = None
 
-            result = self._make_api_request("POST", endpoint, __user__, data=request_data, params=params)
+            result = await self._make_api_request("POST", endpoint, __user__, data=request_data, params=params)
 
             if event_emitter:
                 try:
@@ -21807,7 +21867,7 @@ This operation can be accessed anonymously.
             params = None
             request_data = None
 
-            result = self._make_api_request("POST", endpoint, __user__, data=request_data, params=params)
+            result = await self._make_api_request("POST", endpoint, __user__, data=request_data, params=params)
 
             if event_emitter:
                 try:
@@ -21856,7 +21916,7 @@ This operation can be accessed anonymously.
             params = None
             request_data = None
 
-            result = self._make_api_request("POST", endpoint, __user__, data=request_data, params=params)
+            result = await self._make_api_request("POST", endpoint, __user__, data=request_data, params=params)
 
             if event_emitter:
                 try:
@@ -21963,7 +22023,7 @@ Examples: `"names,changelog"` Returns the display name of each field as well as
             if reconcileIssues is not None:
                 params["reconcileIssues"] = reconcileIssues
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -22008,7 +22068,7 @@ Examples: `"names,changelog"` Returns the display name of each field as well as
             params = None
             request_data = None
 
-            result = self._make_api_request("POST", endpoint, __user__, data=request_data, params=params)
+            result = await self._make_api_request("POST", endpoint, __user__, data=request_data, params=params)
 
             if event_emitter:
                 try:
@@ -22053,7 +22113,7 @@ This operation can be accessed anonymously.
             endpoint = f"/rest/api/2/securitylevel/{id}"
             params = None
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -22096,7 +22156,7 @@ This operation can be accessed anonymously.
             endpoint = "/rest/api/2/serverInfo"
             params = None
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -22137,7 +22197,7 @@ This operation can be accessed anonymously.
             endpoint = "/rest/api/2/settings/columns"
             params = None
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -22187,7 +22247,7 @@ A navigable field is one that can be used as a column on the issue navigator. Fi
             params = None
             request_data = None
 
-            result = self._make_api_request("PUT", endpoint, __user__, data=request_data, params=params)
+            result = await self._make_api_request("PUT", endpoint, __user__, data=request_data, params=params)
 
             if event_emitter:
                 try:
@@ -22230,7 +22290,7 @@ This operation can be accessed anonymously.
             endpoint = "/rest/api/2/status"
             params = None
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -22275,7 +22335,7 @@ This operation can be accessed anonymously.
             endpoint = f"/rest/api/2/status/{idOrName}"
             params = None
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -22316,7 +22376,7 @@ This operation can be accessed anonymously.
             endpoint = "/rest/api/2/statuscategory"
             params = None
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -22357,7 +22417,7 @@ This operation can be accessed anonymously.
             endpoint = f"/rest/api/2/statuscategory/{idOrKey}"
             params = None
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -22405,7 +22465,7 @@ Min items `1`, Max items `50`
             if id is not None:
                 params["id"] = id
 
-            result = self._make_api_request("DELETE", endpoint, __user__, params=params)
+            result = await self._make_api_request("DELETE", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -22461,7 +22521,7 @@ Min items `1`, Max items `50`
             if id is not None:
                 params["id"] = id
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -22506,7 +22566,7 @@ Min items `1`, Max items `50`
             params = None
             request_data = None
 
-            result = self._make_api_request("POST", endpoint, __user__, data=request_data, params=params)
+            result = await self._make_api_request("POST", endpoint, __user__, data=request_data, params=params)
 
             if event_emitter:
                 try:
@@ -22551,7 +22611,7 @@ Min items `1`, Max items `50`
             params = None
             request_data = None
 
-            result = self._make_api_request("PUT", endpoint, __user__, data=request_data, params=params)
+            result = await self._make_api_request("PUT", endpoint, __user__, data=request_data, params=params)
 
             if event_emitter:
                 try:
@@ -22617,7 +22677,7 @@ Use [expand](#expansion) to include additional information in the response. This
             if statusCategory is not None:
                 params["statusCategory"] = statusCategory
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -22663,7 +22723,7 @@ Use [expand](#expansion) to include additional information in the response. This
             if maxResults is not None:
                 params["maxResults"] = maxResults
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -22708,7 +22768,7 @@ Use [expand](#expansion) to include additional information in the response. This
             if maxResults is not None:
                 params["maxResults"] = maxResults
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -22753,7 +22813,7 @@ Use [expand](#expansion) to include additional information in the response. This
             if maxResults is not None:
                 params["maxResults"] = maxResults
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -22803,7 +22863,7 @@ When a task has finished, this operation returns the JSON blob applicable to the
             endpoint = f"/rest/api/2/task/{taskId}"
             params = None
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -22848,7 +22908,7 @@ When a task has finished, this operation returns the JSON blob applicable to the
             params = None
             request_data = None
 
-            result = self._make_api_request("POST", endpoint, __user__, data=request_data, params=params)
+            result = await self._make_api_request("POST", endpoint, __user__, data=request_data, params=params)
 
             if event_emitter:
                 try:
@@ -22902,7 +22962,7 @@ The new `read:app-data:jira` OAuth scope is 100% optional now, and not using it
             if expand is not None:
                 params["expand"] = expand
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -22951,7 +23011,7 @@ The new `write:app-data:jira` OAuth scope is 100% optional now, and not using it
             params = None
             request_data = None
 
-            result = self._make_api_request("POST", endpoint, __user__, data=request_data, params=params)
+            result = await self._make_api_request("POST", endpoint, __user__, data=request_data, params=params)
 
             if event_emitter:
                 try:
@@ -22994,7 +23054,7 @@ The new `write:app-data:jira` OAuth scope is 100% optional now, and not using it
             endpoint = f"/rest/api/2/uiModifications/{uiModificationId}"
             params = None
 
-            result = self._make_api_request("DELETE", endpoint, __user__, params=params)
+            result = await self._make_api_request("DELETE", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -23043,7 +23103,7 @@ The new `write:app-data:jira` OAuth scope is 100% optional now, and not using it
             params = None
             request_data = None
 
-            result = self._make_api_request("PUT", endpoint, __user__, data=request_data, params=params)
+            result = await self._make_api_request("PUT", endpoint, __user__, data=request_data, params=params)
 
             if event_emitter:
                 try:
@@ -23092,7 +23152,7 @@ This operation can be accessed anonymously.
             endpoint = f"/rest/api/2/universal_avatar/type/{type}/owner/{entityId}"
             params = None
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -23172,7 +23232,7 @@ After creating the avatar use:
                 params["size"] = size
             request_data = None
 
-            result = self._make_api_request("POST", endpoint, __user__, data=request_data, params=params)
+            result = await self._make_api_request("POST", endpoint, __user__, data=request_data, params=params)
 
             if event_emitter:
                 try:
@@ -23215,7 +23275,7 @@ After creating the avatar use:
             endpoint = f"/rest/api/2/universal_avatar/type/{type}/owner/{owningObjectId}/avatar/{id}"
             params = None
 
-            result = self._make_api_request("DELETE", endpoint, __user__, params=params)
+            result = await self._make_api_request("DELETE", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -23264,7 +23324,7 @@ This operation can be accessed anonymously.
             if format is not None:
                 params["format"] = format
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -23319,7 +23379,7 @@ This operation can be accessed anonymously.
             if format is not None:
                 params["format"] = format
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -23374,7 +23434,7 @@ This operation can be accessed anonymously.
             if format is not None:
                 params["format"] = format
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -23423,7 +23483,7 @@ This operation can be accessed anonymously.
             if key is not None:
                 params["key"] = key
 
-            result = self._make_api_request("DELETE", endpoint, __user__, params=params)
+            result = await self._make_api_request("DELETE", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -23480,7 +23540,7 @@ Privacy controls are applied to the response based on the user's preferences. Th
             if expand is not None:
                 params["expand"] = expand
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -23524,7 +23584,7 @@ If the user exists and has access to Jira, the operation returns a 201 status. I
             params = None
             request_data = None
 
-            result = self._make_api_request("POST", endpoint, __user__, data=request_data, params=params)
+            result = await self._make_api_request("POST", endpoint, __user__, data=request_data, params=params)
 
             if event_emitter:
                 try:
@@ -23588,7 +23648,7 @@ This operation can be accessed anonymously.
             if maxResults is not None:
                 params["maxResults"] = maxResults
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -23671,7 +23731,7 @@ Privacy controls are applied to the response based on the users' preferences. Th
             if recommend is not None:
                 params["recommend"] = recommend
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -23726,7 +23786,7 @@ Privacy controls are applied to the response based on the users' preferences. Th
             if accountId is not None:
                 params["accountId"] = accountId
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -23778,7 +23838,7 @@ Privacy controls are applied to the response based on the users' preferences. Th
             if key is not None:
                 params["key"] = key
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -23827,7 +23887,7 @@ Privacy controls are applied to the response based on the users' preferences. Th
             if username is not None:
                 params["username"] = username
 
-            result = self._make_api_request("DELETE", endpoint, __user__, params=params)
+            result = await self._make_api_request("DELETE", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -23876,7 +23936,7 @@ Privacy controls are applied to the response based on the users' preferences. Th
             if username is not None:
                 params["username"] = username
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -23927,7 +23987,7 @@ The parameters for this resource are expressed as HTML form data. For example, i
                 params["accountId"] = accountId
             request_data = None
 
-            result = self._make_api_request("PUT", endpoint, __user__, data=request_data, params=params)
+            result = await self._make_api_request("PUT", endpoint, __user__, data=request_data, params=params)
 
             if event_emitter:
                 try:
@@ -23968,7 +24028,7 @@ The parameters for this resource are expressed as HTML form data. For example, i
             if accountId is not None:
                 params["accountId"] = accountId
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -24009,7 +24069,7 @@ The parameters for this resource are expressed as HTML form data. For example, i
             if accountId is not None:
                 params["accountId"] = accountId
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -24058,7 +24118,7 @@ The parameters for this resource are expressed as HTML form data. For example, i
             if key is not None:
                 params["key"] = key
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -24173,7 +24233,7 @@ This operation can be accessed anonymously.
             if maxResults is not None:
                 params["maxResults"] = maxResults
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -24240,7 +24300,7 @@ This operation can be accessed anonymously.
             if excludeConnectUsers is not None:
                 params["excludeConnectUsers"] = excludeConnectUsers
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -24294,7 +24354,7 @@ Note: This operation does not access the [user properties](https://confluence.at
             if username is not None:
                 params["username"] = username
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -24349,7 +24409,7 @@ Note: This operation does not access the [user properties](https://confluence.at
             if username is not None:
                 params["username"] = username
 
-            result = self._make_api_request("DELETE", endpoint, __user__, params=params)
+            result = await self._make_api_request("DELETE", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -24404,7 +24464,7 @@ Note: This operation does not access the [user properties](https://confluence.at
             if username is not None:
                 params["username"] = username
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -24460,7 +24520,7 @@ Note: This operation does not access the [user properties](https://confluence.at
                 params["username"] = username
             request_data = None
 
-            result = self._make_api_request("PUT", endpoint, __user__, data=request_data, params=params)
+            result = await self._make_api_request("PUT", endpoint, __user__, data=request_data, params=params)
 
             if event_emitter:
                 try:
@@ -24524,7 +24584,7 @@ Privacy controls are applied to the response based on the users' preferences. Th
             if property is not None:
                 params["property"] = property
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -24590,7 +24650,7 @@ The list of issues can be extended as needed, as in *(PROJ-1, PROJ-2, ... PROJ-n
             if maxResults is not None:
                 params["maxResults"] = maxResults
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -24656,7 +24716,7 @@ The list of issues can be extended as needed, as in *(PROJ-1, PROJ-2, ... PROJ-n
             if maxResult is not None:
                 params["maxResult"] = maxResult
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -24731,7 +24791,7 @@ This operation can be accessed anonymously.
             if maxResults is not None:
                 params["maxResults"] = maxResults
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -24779,7 +24839,7 @@ Privacy controls are applied to the response based on the users' preferences. Th
             if maxResults is not None:
                 params["maxResults"] = maxResults
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -24827,7 +24887,7 @@ Privacy controls are applied to the response based on the users' preferences. Th
             if maxResults is not None:
                 params["maxResults"] = maxResults
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -24871,7 +24931,7 @@ This operation can be accessed anonymously.
             params = None
             request_data = None
 
-            result = self._make_api_request("POST", endpoint, __user__, data=request_data, params=params)
+            result = await self._make_api_request("POST", endpoint, __user__, data=request_data, params=params)
 
             if event_emitter:
                 try:
@@ -24924,7 +24984,7 @@ This operation can be accessed anonymously.
             if moveAffectedIssuesTo is not None:
                 params["moveAffectedIssuesTo"] = moveAffectedIssuesTo
 
-            result = self._make_api_request("DELETE", endpoint, __user__, params=params)
+            result = await self._make_api_request("DELETE", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -24975,7 +25035,7 @@ This operation can be accessed anonymously.
             if expand is not None:
                 params["expand"] = expand
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -25019,7 +25079,7 @@ This operation can be accessed anonymously.
             params = None
             request_data = None
 
-            result = self._make_api_request("PUT", endpoint, __user__, data=request_data, params=params)
+            result = await self._make_api_request("PUT", endpoint, __user__, data=request_data, params=params)
 
             if event_emitter:
                 try:
@@ -25066,7 +25126,7 @@ This operation can be accessed anonymously.
             params = None
             request_data = None
 
-            result = self._make_api_request("PUT", endpoint, __user__, data=request_data, params=params)
+            result = await self._make_api_request("PUT", endpoint, __user__, data=request_data, params=params)
 
             if event_emitter:
                 try:
@@ -25110,7 +25170,7 @@ This operation can be accessed anonymously.
             params = None
             request_data = None
 
-            result = self._make_api_request("POST", endpoint, __user__, data=request_data, params=params)
+            result = await self._make_api_request("POST", endpoint, __user__, data=request_data, params=params)
 
             if event_emitter:
                 try:
@@ -25157,7 +25217,7 @@ This operation can be accessed anonymously.
             endpoint = f"/rest/api/2/version/{id}/relatedIssueCounts"
             params = None
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -25200,7 +25260,7 @@ This operation can be accessed anonymously.
             endpoint = f"/rest/api/2/version/{id}/relatedwork"
             params = None
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -25244,7 +25304,7 @@ This operation can be accessed anonymously.
             params = None
             request_data = None
 
-            result = self._make_api_request("POST", endpoint, __user__, data=request_data, params=params)
+            result = await self._make_api_request("POST", endpoint, __user__, data=request_data, params=params)
 
             if event_emitter:
                 try:
@@ -25288,7 +25348,7 @@ This operation can be accessed anonymously.
             params = None
             request_data = None
 
-            result = self._make_api_request("PUT", endpoint, __user__, data=request_data, params=params)
+            result = await self._make_api_request("PUT", endpoint, __user__, data=request_data, params=params)
 
             if event_emitter:
                 try:
@@ -25334,7 +25394,7 @@ This operation can be accessed anonymously.
             params = None
             request_data = None
 
-            result = self._make_api_request("POST", endpoint, __user__, data=request_data, params=params)
+            result = await self._make_api_request("POST", endpoint, __user__, data=request_data, params=params)
 
             if event_emitter:
                 try:
@@ -25377,7 +25437,7 @@ This operation can be accessed anonymously.
             endpoint = f"/rest/api/2/version/{id}/unresolvedIssueCount"
             params = None
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -25421,7 +25481,7 @@ This operation can be accessed anonymously.
             endpoint = f"/rest/api/2/version/{versionId}/relatedwork/{relatedWorkId}"
             params = None
 
-            result = self._make_api_request("DELETE", endpoint, __user__, params=params)
+            result = await self._make_api_request("DELETE", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -25462,7 +25522,7 @@ This operation can be accessed anonymously.
             endpoint = "/rest/api/2/webhook"
             params = None
 
-            result = self._make_api_request("DELETE", endpoint, __user__, params=params)
+            result = await self._make_api_request("DELETE", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -25508,7 +25568,7 @@ This operation can be accessed anonymously.
             if maxResults is not None:
                 params["maxResults"] = maxResults
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -25552,7 +25612,7 @@ This operation can be accessed anonymously.
             params = None
             request_data = None
 
-            result = self._make_api_request("POST", endpoint, __user__, data=request_data, params=params)
+            result = await self._make_api_request("POST", endpoint, __user__, data=request_data, params=params)
 
             if event_emitter:
                 try:
@@ -25604,7 +25664,7 @@ This method uses a cursor-based pagination. To request the next page use the fai
             if after is not None:
                 params["after"] = after
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -25648,7 +25708,7 @@ Unrecognized webhook IDs (those that are not found or belong to other apps) are
             params = None
             request_data = None
 
-            result = self._make_api_request("PUT", endpoint, __user__, data=request_data, params=params)
+            result = await self._make_api_request("PUT", endpoint, __user__, data=request_data, params=params)
 
             if event_emitter:
                 try:
@@ -25693,7 +25753,7 @@ If the `workflowName` parameter is specified, the workflow is returned as an obj
             if workflowName is not None:
                 params["workflowName"] = workflowName
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -26463,7 +26523,7 @@ Forge transition rules are not yet supported.
             params = None
             request_data = None
 
-            result = self._make_api_request("POST", endpoint, __user__, data=request_data, params=params)
+            result = await self._make_api_request("POST", endpoint, __user__, data=request_data, params=params)
 
             if event_emitter:
                 try:
@@ -26534,7 +26594,7 @@ Due to server-side optimizations, workflows with an empty list of rules may be r
             if expand is not None:
                 params["expand"] = expand
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -26589,7 +26649,7 @@ Rules are enabled if the `disabled` parameter is not provided.
             params = None
             request_data = None
 
-            result = self._make_api_request("PUT", endpoint, __user__, data=request_data, params=params)
+            result = await self._make_api_request("PUT", endpoint, __user__, data=request_data, params=params)
 
             if event_emitter:
                 try:
@@ -26637,7 +26697,7 @@ Only rules created by the calling Connect app can be deleted.
             params = None
             request_data = None
 
-            result = self._make_api_request("PUT", endpoint, __user__, data=request_data, params=params)
+            result = await self._make_api_request("PUT", endpoint, __user__, data=request_data, params=params)
 
             if event_emitter:
                 try:
@@ -26715,7 +26775,7 @@ This operation does not return next-gen workflows.
             if isActive is not None:
                 params["isActive"] = isActive
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -26765,7 +26825,7 @@ This operation does not return next-gen workflows.
             if workflowMode is not None:
                 params["workflowMode"] = workflowMode
 
-            result = self._make_api_request("DELETE", endpoint, __user__, params=params)
+            result = await self._make_api_request("DELETE", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -26818,7 +26878,7 @@ This operation does not return next-gen workflows.
             if workflowMode is not None:
                 params["workflowMode"] = workflowMode
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -26869,7 +26929,7 @@ This operation does not return next-gen workflows.
                 params["workflowMode"] = workflowMode
             request_data = None
 
-            result = self._make_api_request("POST", endpoint, __user__, data=request_data, params=params)
+            result = await self._make_api_request("POST", endpoint, __user__, data=request_data, params=params)
 
             if event_emitter:
                 try:
@@ -26920,7 +26980,7 @@ This operation does not return next-gen workflows.
                 params["workflowMode"] = workflowMode
             request_data = None
 
-            result = self._make_api_request("PUT", endpoint, __user__, data=request_data, params=params)
+            result = await self._make_api_request("PUT", endpoint, __user__, data=request_data, params=params)
 
             if event_emitter:
                 try:
@@ -26968,7 +27028,7 @@ The workflow cannot be deleted if it is:
             endpoint = f"/rest/api/2/workflow/{entityId}"
             params = None
 
-            result = self._make_api_request("DELETE", endpoint, __user__, params=params)
+            result = await self._make_api_request("DELETE", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -27014,7 +27074,7 @@ The workflow cannot be deleted if it is:
             if maxResults is not None:
                 params["maxResults"] = maxResults
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -27059,7 +27119,7 @@ The workflow cannot be deleted if it is:
             if maxResults is not None:
                 params["maxResults"] = maxResults
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -27104,7 +27164,7 @@ The workflow cannot be deleted if it is:
             if maxResults is not None:
                 params["maxResults"] = maxResults
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -27162,7 +27222,7 @@ Use [expand](#expansion) to include additional information in the response. This
                 params["useApprovalConfiguration"] = useApprovalConfiguration
             request_data = None
 
-            result = self._make_api_request("POST", endpoint, __user__, data=request_data, params=params)
+            result = await self._make_api_request("POST", endpoint, __user__, data=request_data, params=params)
 
             if event_emitter:
                 try:
@@ -27739,7 +27799,7 @@ Parameters:
             if issueTypeId is not None:
                 params["issueTypeId"] = issueTypeId
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -27784,7 +27844,7 @@ Parameters:
             params = None
             request_data = None
 
-            result = self._make_api_request("POST", endpoint, __user__, data=request_data, params=params)
+            result = await self._make_api_request("POST", endpoint, __user__, data=request_data, params=params)
 
             if event_emitter:
                 try:
@@ -27829,7 +27889,7 @@ Parameters:
             params = None
             request_data = None
 
-            result = self._make_api_request("POST", endpoint, __user__, data=request_data, params=params)
+            result = await self._make_api_request("POST", endpoint, __user__, data=request_data, params=params)
 
             if event_emitter:
                 try:
@@ -27899,7 +27959,7 @@ Parameters:
             if isActive is not None:
                 params["isActive"] = isActive
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -27949,7 +28009,7 @@ Parameters:
                 params["expand"] = expand
             request_data = None
 
-            result = self._make_api_request("POST", endpoint, __user__, data=request_data, params=params)
+            result = await self._make_api_request("POST", endpoint, __user__, data=request_data, params=params)
 
             if event_emitter:
                 try:
@@ -27994,7 +28054,7 @@ Parameters:
             params = None
             request_data = None
 
-            result = self._make_api_request("POST", endpoint, __user__, data=request_data, params=params)
+            result = await self._make_api_request("POST", endpoint, __user__, data=request_data, params=params)
 
             if event_emitter:
                 try:
@@ -28040,7 +28100,7 @@ Parameters:
             if maxResults is not None:
                 params["maxResults"] = maxResults
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -28082,7 +28142,7 @@ Parameters:
             params = None
             request_data = None
 
-            result = self._make_api_request("POST", endpoint, __user__, data=request_data, params=params)
+            result = await self._make_api_request("POST", endpoint, __user__, data=request_data, params=params)
 
             if event_emitter:
                 try:
@@ -28127,7 +28187,7 @@ If the project is associated with the `Default Workflow Scheme` no ID is returne
             if projectId is not None:
                 params["projectId"] = projectId
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -28171,7 +28231,7 @@ Workflow schemes can only be assigned to classic projects.
             params = None
             request_data = None
 
-            result = self._make_api_request("PUT", endpoint, __user__, data=request_data, params=params)
+            result = await self._make_api_request("PUT", endpoint, __user__, data=request_data, params=params)
 
             if event_emitter:
                 try:
@@ -28222,7 +28282,7 @@ Use [expand](#expansion) to include additional information in the response. This
                 params["expand"] = expand
             request_data = None
 
-            result = self._make_api_request("POST", endpoint, __user__, data=request_data, params=params)
+            result = await self._make_api_request("POST", endpoint, __user__, data=request_data, params=params)
 
             if event_emitter:
                 try:
@@ -28267,7 +28327,7 @@ Use [expand](#expansion) to include additional information in the response. This
             params = None
             request_data = None
 
-            result = self._make_api_request("POST", endpoint, __user__, data=request_data, params=params)
+            result = await self._make_api_request("POST", endpoint, __user__, data=request_data, params=params)
 
             if event_emitter:
                 try:
@@ -28312,7 +28372,7 @@ Use [expand](#expansion) to include additional information in the response. This
             params = None
             request_data = None
 
-            result = self._make_api_request("POST", endpoint, __user__, data=request_data, params=params)
+            result = await self._make_api_request("POST", endpoint, __user__, data=request_data, params=params)
 
             if event_emitter:
                 try:
@@ -28353,7 +28413,7 @@ Use [expand](#expansion) to include additional information in the response. This
             endpoint = f"/rest/api/2/workflowscheme/{id}"
             params = None
 
-            result = self._make_api_request("DELETE", endpoint, __user__, params=params)
+            result = await self._make_api_request("DELETE", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -28397,7 +28457,7 @@ Use [expand](#expansion) to include additional information in the response. This
             if returnDraftIfExists is not None:
                 params["returnDraftIfExists"] = returnDraftIfExists
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -28439,7 +28499,7 @@ Use [expand](#expansion) to include additional information in the response. This
             params = None
             request_data = None
 
-            result = self._make_api_request("PUT", endpoint, __user__, data=request_data, params=params)
+            result = await self._make_api_request("PUT", endpoint, __user__, data=request_data, params=params)
 
             if event_emitter:
                 try:
@@ -28481,7 +28541,7 @@ Use [expand](#expansion) to include additional information in the response. This
             params = None
             request_data = None
 
-            result = self._make_api_request("POST", endpoint, __user__, data=request_data, params=params)
+            result = await self._make_api_request("POST", endpoint, __user__, data=request_data, params=params)
 
             if event_emitter:
                 try:
@@ -28527,7 +28587,7 @@ Note that active workflow schemes cannot be edited. If the workflow scheme is ac
             if updateDraftIfNeeded is not None:
                 params["updateDraftIfNeeded"] = updateDraftIfNeeded
 
-            result = self._make_api_request("DELETE", endpoint, __user__, params=params)
+            result = await self._make_api_request("DELETE", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -28571,7 +28631,7 @@ Note that active workflow schemes cannot be edited. If the workflow scheme is ac
             if returnDraftIfExists is not None:
                 params["returnDraftIfExists"] = returnDraftIfExists
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -28615,7 +28675,7 @@ Note that active workflow schemes cannot be edited. If the workflow scheme is ac
             params = None
             request_data = None
 
-            result = self._make_api_request("PUT", endpoint, __user__, data=request_data, params=params)
+            result = await self._make_api_request("PUT", endpoint, __user__, data=request_data, params=params)
 
             if event_emitter:
                 try:
@@ -28656,7 +28716,7 @@ Note that active workflow schemes cannot be edited. If the workflow scheme is ac
             endpoint = f"/rest/api/2/workflowscheme/{id}/draft"
             params = None
 
-            result = self._make_api_request("DELETE", endpoint, __user__, params=params)
+            result = await self._make_api_request("DELETE", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -28701,7 +28761,7 @@ Note that:
             endpoint = f"/rest/api/2/workflowscheme/{id}/draft"
             params = None
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -28743,7 +28803,7 @@ Note that:
             params = None
             request_data = None
 
-            result = self._make_api_request("PUT", endpoint, __user__, data=request_data, params=params)
+            result = await self._make_api_request("PUT", endpoint, __user__, data=request_data, params=params)
 
             if event_emitter:
                 try:
@@ -28784,7 +28844,7 @@ Note that:
             endpoint = f"/rest/api/2/workflowscheme/{id}/draft/default"
             params = None
 
-            result = self._make_api_request("DELETE", endpoint, __user__, params=params)
+            result = await self._make_api_request("DELETE", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -28825,7 +28885,7 @@ Note that:
             endpoint = f"/rest/api/2/workflowscheme/{id}/draft/default"
             params = None
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -28867,7 +28927,7 @@ Note that:
             params = None
             request_data = None
 
-            result = self._make_api_request("PUT", endpoint, __user__, data=request_data, params=params)
+            result = await self._make_api_request("PUT", endpoint, __user__, data=request_data, params=params)
 
             if event_emitter:
                 try:
@@ -28909,7 +28969,7 @@ Note that:
             endpoint = f"/rest/api/2/workflowscheme/{id}/draft/issuetype/{issueType}"
             params = None
 
-            result = self._make_api_request("DELETE", endpoint, __user__, params=params)
+            result = await self._make_api_request("DELETE", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -28951,7 +29011,7 @@ Note that:
             endpoint = f"/rest/api/2/workflowscheme/{id}/draft/issuetype/{issueType}"
             params = None
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -28994,7 +29054,7 @@ Note that:
             params = None
             request_data = None
 
-            result = self._make_api_request("PUT", endpoint, __user__, data=request_data, params=params)
+            result = await self._make_api_request("PUT", endpoint, __user__, data=request_data, params=params)
 
             if event_emitter:
                 try:
@@ -29043,7 +29103,7 @@ This operation is [asynchronous](#async). Follow the `location` link in the resp
                 params["validateOnly"] = validateOnly
             request_data = None
 
-            result = self._make_api_request("POST", endpoint, __user__, data=request_data, params=params)
+            result = await self._make_api_request("POST", endpoint, __user__, data=request_data, params=params)
 
             if event_emitter:
                 try:
@@ -29087,7 +29147,7 @@ This operation is [asynchronous](#async). Follow the `location` link in the resp
             if workflowName is not None:
                 params["workflowName"] = workflowName
 
-            result = self._make_api_request("DELETE", endpoint, __user__, params=params)
+            result = await self._make_api_request("DELETE", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -29131,7 +29191,7 @@ This operation is [asynchronous](#async). Follow the `location` link in the resp
             if workflowName is not None:
                 params["workflowName"] = workflowName
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -29176,7 +29236,7 @@ This operation is [asynchronous](#async). Follow the `location` link in the resp
                 params["workflowName"] = workflowName
             request_data = None
 
-            result = self._make_api_request("PUT", endpoint, __user__, data=request_data, params=params)
+            result = await self._make_api_request("PUT", endpoint, __user__, data=request_data, params=params)
 
             if event_emitter:
                 try:
@@ -29223,7 +29283,7 @@ Note that active workflow schemes cannot be edited. If the workflow scheme is ac
             if updateDraftIfNeeded is not None:
                 params["updateDraftIfNeeded"] = updateDraftIfNeeded
 
-            result = self._make_api_request("DELETE", endpoint, __user__, params=params)
+            result = await self._make_api_request("DELETE", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -29268,7 +29328,7 @@ Note that active workflow schemes cannot be edited. If the workflow scheme is ac
             if returnDraftIfExists is not None:
                 params["returnDraftIfExists"] = returnDraftIfExists
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -29313,7 +29373,7 @@ Note that active workflow schemes cannot be edited. If the workflow scheme is ac
             params = None
             request_data = None
 
-            result = self._make_api_request("PUT", endpoint, __user__, data=request_data, params=params)
+            result = await self._make_api_request("PUT", endpoint, __user__, data=request_data, params=params)
 
             if event_emitter:
                 try:
@@ -29362,7 +29422,7 @@ Note that active workflow schemes cannot be edited. If the workflow scheme is ac
             if updateDraftIfNeeded is not None:
                 params["updateDraftIfNeeded"] = updateDraftIfNeeded
 
-            result = self._make_api_request("DELETE", endpoint, __user__, params=params)
+            result = await self._make_api_request("DELETE", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -29409,7 +29469,7 @@ Note that active workflow schemes cannot be edited. If the workflow scheme is ac
             if returnDraftIfExists is not None:
                 params["returnDraftIfExists"] = returnDraftIfExists
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -29456,7 +29516,7 @@ Note that active workflow schemes cannot be edited. If the workflow scheme is ac
                 params["workflowName"] = workflowName
             request_data = None
 
-            result = self._make_api_request("PUT", endpoint, __user__, data=request_data, params=params)
+            result = await self._make_api_request("PUT", endpoint, __user__, data=request_data, params=params)
 
             if event_emitter:
                 try:
@@ -29501,7 +29561,7 @@ Note that active workflow schemes cannot be edited. If the workflow scheme is ac
             if maxResults is not None:
                 params["maxResults"] = maxResults
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -29548,7 +29608,7 @@ This resource does not return worklogs deleted during the minute preceding the r
             if since is not None:
                 params["since"] = since
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -29597,7 +29657,7 @@ The returned list of worklogs is limited to 1000 items.
                 params["expand"] = expand
             request_data = None
 
-            result = self._make_api_request("POST", endpoint, __user__, data=request_data, params=params)
+            result = await self._make_api_request("POST", endpoint, __user__, data=request_data, params=params)
 
             if event_emitter:
                 try:
@@ -29650,7 +29710,7 @@ This resource does not return worklogs updated during the minute preceding the r
             if expand is not None:
                 params["expand"] = expand
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -29692,7 +29752,7 @@ Additionally, Forge apps can access Connect app properties (stored against the s
             endpoint = f"/rest/atlassian-connect/1/addons/{addonKey}/properties"
             params = None
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -29735,7 +29795,7 @@ Additionally, Forge apps can access Connect app properties (stored against the s
             endpoint = f"/rest/atlassian-connect/1/addons/{addonKey}/properties/{propertyKey}"
             params = None
 
-            result = self._make_api_request("DELETE", endpoint, __user__, params=params)
+            result = await self._make_api_request("DELETE", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -29778,7 +29838,7 @@ Additionally, Forge apps can access Connect app properties (stored against the s
             endpoint = f"/rest/atlassian-connect/1/addons/{addonKey}/properties/{propertyKey}"
             params = None
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -29824,7 +29884,7 @@ Additionally, Forge apps can access Connect app properties (stored against the s
             params = None
             request_data = None
 
-            result = self._make_api_request("PUT", endpoint, __user__, data=request_data, params=params)
+            result = await self._make_api_request("PUT", endpoint, __user__, data=request_data, params=params)
 
             if event_emitter:
                 try:
@@ -29869,7 +29929,7 @@ Nonexistent keys are ignored.
             if moduleKey is not None:
                 params["moduleKey"] = moduleKey
 
-            result = self._make_api_request("DELETE", endpoint, __user__, params=params)
+            result = await self._make_api_request("DELETE", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -29910,7 +29970,7 @@ Nonexistent keys are ignored.
             endpoint = "/rest/atlassian-connect/1/app/module/dynamic"
             params = None
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -29952,7 +30012,7 @@ Nonexistent keys are ignored.
             params = None
             request_data = None
 
-            result = self._make_api_request("POST", endpoint, __user__, data=request_data, params=params)
+            result = await self._make_api_request("POST", endpoint, __user__, data=request_data, params=params)
 
             if event_emitter:
                 try:
@@ -29995,7 +30055,7 @@ The values of up to 200 custom fields can be updated.
             params = None
             request_data = None
 
-            result = self._make_api_request("PUT", endpoint, __user__, data=request_data, params=params)
+            result = await self._make_api_request("PUT", endpoint, __user__, data=request_data, params=params)
 
             if event_emitter:
                 try:
@@ -30035,7 +30095,7 @@ The values of up to 200 custom fields can be updated.
             params = None
             request_data = None
 
-            result = self._make_api_request("PUT", endpoint, __user__, data=request_data, params=params)
+            result = await self._make_api_request("PUT", endpoint, __user__, data=request_data, params=params)
 
             if event_emitter:
                 try:
@@ -30075,7 +30135,7 @@ The values of up to 200 custom fields can be updated.
             params = None
             request_data = None
 
-            result = self._make_api_request("POST", endpoint, __user__, data=request_data, params=params)
+            result = await self._make_api_request("POST", endpoint, __user__, data=request_data, params=params)
 
             if event_emitter:
                 try:
@@ -30118,7 +30178,7 @@ The values of up to 200 custom fields can be updated.
             if serviceIds is not None:
                 params["serviceIds"] = serviceIds
 
-            result = self._make_api_request("GET", endpoint, __user__, params=params)
+            result = await self._make_api_request("GET", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -30161,7 +30221,7 @@ The new `write:app-data:jira` OAuth scope is 100% optional now, and not using it
             endpoint = f"/rest/forge/1/app/properties/{propertyKey}"
             params = None
 
-            result = self._make_api_request("DELETE", endpoint, __user__, params=params)
+            result = await self._make_api_request("DELETE", endpoint, __user__, params=params)
 
             if event_emitter:
                 try:
@@ -30212,7 +30272,7 @@ The new `write:app-data:jira` OAuth scope is 100% optional now, and not using it
             params = None
             request_data = None
 
-            result = self._make_api_request("PUT", endpoint, __user__, data=request_data, params=params)
+            result = await self._make_api_request("PUT", endpoint, __user__, data=request_data, params=params)
 
             if event_emitter:
                 try:
@@ -134,16 +134,21 @@ repository: https://github.com/your-username/open-webui-tools
 author: @your-username
 author_url: https://github.com/your-username
 version: ${apiVersion}
+requirements: aiohttp
 changelog:
   - ${apiVersion}: Initial version
 """
 
-import requests
+import asyncio
 import json
 import os
-from typing import Dict, List, Any, Optional, Union, Callable, Awaitable
+from typing import TYPE_CHECKING, Dict, List, Any, Optional, Union, Callable, Awaitable
 from pydantic import BaseModel, Field, field_validator
 
+# aiohttp is imported on the first request; the annotation-only import keeps type hints intact
+if TYPE_CHECKING:
+    import aiohttp
+
 
 class EventEmitter:
     def __init__(self, event_emitter: Callable[[dict], Awaitable[None]]):
@@ -273,6 +278,9 @@ class Tools:
         self._base_path = "${basePath}"
         self._default_scheme = "${defaultScheme}"
         self._host = "${host}"
+        # Shared HTTP session, created lazily on the running event loop
+        self._http_session: Optional["aiohttp.ClientSession"] = None
+        self._http_session_loop: Optional[asyncio.AbstractEventLoop] = None
 
     class UserValves(BaseModel):
         user_token: str = Field(
@@ -318,11 +326,74 @@ class Tools:
             return self.valves.base_url
         raise ValueError("API server address must be set in tool configuration")
 
-    def _make_api_request(self, method: str, endpoint: str, __user__: dict = {}, data: Dict[str, Any] = None, params: Dict[str, Any] = None) -> str:
+    async def _get_http_session(self) -> "aiohttp.ClientSession":
+        """
+        Get the shared aiohttp session, creating it on the running event loop when needed
+
+        Reusing one session keeps connections alive between calls instead of opening a new
+        TCP/TLS connection per request. A session left over from a previous event loop is
+        closed before it is replaced.
+        """
+        loop = asyncio.get_running_loop()
+        if (
+            self._http_session is None
+            or self._http_session.closed
+            or self._http_session_loop is not loop
+        ):
+            import aiohttp
+
+            await self._aclose()
+
+            self._http_session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=100, limit_per_host=20, keepalive_timeout=60),
+                headers={
+                    "Content-Type": "application/json",
+                    "Accept": "application/json"
+                },
+            )
+            self._http_session_loop = loop
+        return self._http_session
+
+    async def _aclose(self) -> None:
+        """
+        Close the shared aiohttp session and release its connections
+
+        Underscore-prefixed so Open WebUI does not expose it as a tool. The next request
+        creates a new session.
+        """
+        session, self._http_session = self._http_session, None
+        self._http_session_loop = None
+        if session is None or session.closed:
+            return
+        try:
+            await session.close()
+        except Exception:
+            # The session's event loop is already closed; detach the connector and mark it closed
+            session.detach()
+
+    @staticmethod
+    def _query_items(params: Optional[Dict[str, Any]]) -> List[tuple]:
         """
-        Send a request to the API
+        Convert query parameters to (name, value) pairs accepted by aiohttp
 
-        :param method: HTTP method (GET, POST, PUT, DELETE)
+        Lists become repeated parameters and booleans become "true"/"false".
+        """
+        items = []
+        for name, value in (params or {}).items():
+            values = value if isinstance(value, (list, tuple)) else [value]
+            for item in values:
+                if item is None:
+                    continue
+                if isinstance(item, bool):
+                    item = "true" if item else "false"
+                items.append((name, str(item)))
+        return items
+
+    async def _make_api_request(self, method: str, endpoint: str, __user__: dict = {}, data: Dict[str, Any] = None, params: Dict[str, Any] = None) -> str:
+        """
+        Send a request to the API without blocking the event loop
+
+        :param method: HTTP method (GET, POST, PUT, DELETE, PATCH)
         :param endpoint: API endpoint path
         :param __user__: User information dictionary
         :param data: Request body data dictionary
@@ -333,49 +404,38 @@ class Tools:
         if not token:
             raise ValueError("API token not found. Please add your token in user settings.")
 
+        method_upper = method.upper()
+        if method_upper not in ("GET", "POST", "PUT", "DELETE", "PATCH"):
+            raise ValueError(f"Unsupported request method: {method}")
+
+        import aiohttp
+
         # Get API server address
         server_url = self._get_api_server()
 
         # Build complete URL
         url = f"{server_url.rstrip('/')}{self._base_path}{endpoint}"
 
-        headers = {
-            "Authorization": f"Bearer {token}",
-            "Content-Type": "application/json",
-            "Accept": "application/json"
-        }
+        headers = {"Authorization": f"Bearer {token}"}
 
         try:
-            if method.lower() == "get":
-                response = requests.get(url, headers=headers, params=params)
-            elif method.lower() == "post":
-                response = requests.post(url, headers=headers, json=data, params=params)
-            elif method.lower() == "put":
-                response = requests.put(url, headers=headers, json=data, params=params)
-            elif method.lower() == "delete":
-                response = requests.delete(url, headers=headers, params=params)
-            else:
-                raise ValueError(f"Unsupported request method: {method}")
-
-            if response.status_code < 200 or response.status_code >= 300:
-                error_message = response.text
-                return json.dumps({"error": f"Request failed, status code: {response.status_code}, error message: {error_message}, request URL: {url}"}, ensure_ascii=False)
+            session = await self._get_http_session()
+            async with session.request(method_upper, url, headers=headers, json=data, params=self._query_items(params)) as response:
+                status_code = response.status
+                response_text = await response.text()
+
+            if status_code < 200 or status_code >= 300:
+                return json.dumps({"error": f"Request failed, status code: {status_code}, error message: {response_text}, request URL: {url}"}, ensure_ascii=False)
 
             # Check if response contains content
-            if response.text.strip():
-                return json.dumps(response.json(), ensure_ascii=False)
-            return json.dumps({"status": "success", "status_code": response.status_code}, ensure_ascii=False)
+            if response_text.strip():
+                return json.dumps(json.loads(response_text), ensure_ascii=False)
+            return json.dumps({"status": "success", "status_code": status_code}, ensure_ascii=False)
 
-        except requests.exceptions.RequestException as e:
-            error_message = str(e)
-            try:
-                if hasattr(e, 'response') and e.response and e.response.text:
-                    error_message = f"{error_message}: {e.response.text}"
-            except:
-                pass
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            error_message = str(e) or type(e).__name__
             error_response = {"error": f"API request failed: {error_message}"}
-            return json.dumps(error_response, ensure_ascii=False)
-`;
+            return json.dumps(error_response, ensure_ascii=False)`;
 
   // 生成API方法
   for (const path in paths) {
@@ -483,7 +543,7 @@ ${paramsDoc.map(doc => '        ' + doc).join('\n')}
         // 调用API请求方法 - 修复这里的代码，确保正确处理参数和返回结果
         methodCode += `
 
-            result = self._make_api_request("${method.toUpperCase()}", endpoint, __user__, ${(method !== 'get' && method !== 'delete') ? 'data=request_data, ' : ''}params=params)
+            result = await self._make_api_request("${method.toUpperCase()}", endpoint, __user__, ${(method !== 'get' && method !== 'delete') ? 'data=request_data, ' : ''}params=params)
 
             if event_emitter:
                 try:
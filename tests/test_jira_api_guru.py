@@ -0,0 +1,180 @@
+import json
+import os
+import sys
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src", "tools"))
+
+import jira_api_guru  # noqa: E402
+
+# 伪 Jira 服务器中存在的问题
+EXISTING_ISSUES = {
+    f"PROJ-{n}": {
+        "id": str(10000 + n),
+        "key": f"PROJ-{n}",
+        "fields": {"summary": f"问题 {n}", "status": {"name": "Open"}, "priority": {"name": "High"}},
+    }
+    for n in range(1, 61)
+}
+# 按键或数字 ID 查找问题
+ISSUES_BY_KEY_OR_ID = {**EXISTING_ISSUES, **{issue["id"]: issue for issue in EXISTING_ISSUES.values()}}
+
+
+class FakeJiraHandler(BaseHTTPRequestHandler):
+    """
+    模拟 Jira /search：validateQuery 不为 warn 时，只要有一个键不存在整个查询就返回 400；
+    /issueLink 总是创建成功；GET /issue/{key} 返回问题详情
+    """
+
+    requests = []
+
+    def do_GET(self):
+        self.requests.append((self.path, None))
+        issue_key = self.path.split("?")[0].rsplit("/issue/", 1)[-1]
+        if issue_key.upper() in ISSUES_BY_KEY_OR_ID:
+            self._reply(200, ISSUES_BY_KEY_OR_ID[issue_key.upper()])
+        else:
+            self._reply(404, {"errorMessages": ["Issue does not exist"]})
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        body = json.loads(self.rfile.read(length) or b"{}")
+        self.requests.append((self.path, body))
+
+        if self.path.endswith("/issueLink"):
+            self._reply(201, {})
+            return
+
+        if not self.path.endswith("/search"):
+            self._reply(404, {"errorMessages": ["Not found"]})
+            return
+
+        jql = body.get("jql", "")
+        keys = [key.strip() for key in jql[jql.index("(") + 1:jql.rindex(")")].split(",")]
+        missing = [key for key in keys if key.upper() not in ISSUES_BY_KEY_OR_ID]
+        messages = [f"An issue with key '{key}' does not exist for field 'key'." for key in missing]
+
+        if missing and body.get("validateQuery") != "warn":
+            self._reply(400, {"errorMessages": messages})
+            return
+
+        issues = [ISSUES_BY_KEY_OR_ID[key.upper()] for key in keys if key.upper() in ISSUES_BY_KEY_OR_ID]
+        result = {"startAt": 0, "maxResults": len(keys), "total": len(issues), "issues": issues}
+        if messages:
+            result["warningMessages"] = messages
+        self._reply(200, result)
+
+    def _reply(self, status, obj):
+        payload = json.dumps(obj).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class FakeJiraTestCase(unittest.IsolatedAsyncioTestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), FakeJiraHandler)
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        FakeJiraHandler.requests = []
+        self.tools = jira_api_guru.Tools()
+        self.tools.valves.base_url = f"http://127.0.0.1:{self.server.server_address[1]}"
+        self.tools.valves.pat = "token"
+
+    async def asyncTearDown(self):
+        await self.tools._aclose()
+
+
+class JiraGetIssuesTest(FakeJiraTestCase):
+    async def test_invalid_keys_do_not_fail_the_batch(self):
+        result = json.loads(await self.tools.jira_get_issues("PROJ-1,NOPE-1,proj-2,NOPE-2"))
+
+        self.assertNotIn("error", result)
+        self.assertEqual([issue["key"] for issue in result["issues"]], ["PROJ-1", "PROJ-2"])
+        self.assertEqual(result["missingKeys"], ["NOPE-1", "NOPE-2"])
+        self.assertEqual(len(result["warningMessages"]), 2)
+        self.assertTrue(all(body["validateQuery"] == "warn" for _, body in FakeJiraHandler.requests))
+
+    async def test_missing_keys_are_reported_across_chunks(self):
+        keys = [f"PROJ-{n}" for n in range(1, 61)] + ["NOPE-1"]
+        events = []
+
+        async def emitter(event):
+            events.append(event)
+
+        result = json.loads(await self.tools.jira_get_issues(",".join(keys), __event_emitter__=emitter))
+
+        self.assertEqual(len(FakeJiraHandler.requests), 2)
+        self.assertEqual(len(result["issues"]), 60)
+        self.assertEqual(result["missingKeys"], ["NOPE-1"])
+        messages = "".join(event["data"]["content"] for event in events if event["type"] == "message")
+        self.assertIn("NOPE-1", messages)
+        self.assertTrue(events[-1]["data"]["done"])
+
+    async def test_all_keys_found(self):
+        result = json.loads(await self.tools.jira_get_issues("PROJ-3,10004"))
+
+        self.assertNotIn("missingKeys", result)
+        self.assertEqual(len(FakeJiraHandler.requests), 1)
+
+
+class ResponseCacheInvalidationTest(FakeJiraTestCase):
+    def _cache(self, endpoint, result):
+        cache_key = self.tools._response_cache_key(self.tools._get_jira_server(), "token", endpoint, None)
+        self.tools._store_cached_response(cache_key, 60, result)
+
+    def _cached_endpoints(self):
+        return sorted(cache_key[2] for cache_key in self.tools._response_cache)
+
+    async def test_issue_keys_are_case_insensitive(self):
+        self._cache("/issue/proj-1", {"id": "10001", "key": "PROJ-1"})
+
+        self.assertIsNotNone(self.tools._peek_cached_response("/issue/PROJ-1"))
+        self.tools._invalidate_issue_cache("Proj-1")
+        self.assertEqual(self._cached_endpoints(), [])
+
+    async def test_numeric_id_and_key_are_aliases(self):
+        self._cache("/issue/PROJ-1", {"id": "10001", "key": "PROJ-1"})
+        self._cache("/issue/PROJ-1/comment", {"comments": []})
+        self._cache("/issue/10001/transitions", {"transitions": []})
+        self._cache("/issue/PROJ-2?fields=issuelinks", {"id": "10002", "key": "PROJ-2"})
+
+        self.tools._invalidate_issue_cache("10001")
+        self.assertEqual(self._cached_endpoints(), ["/issue/PROJ-2?fields=issuelinks"])
+
+    async def test_cache_keys_do_not_contain_the_token(self):
+        self.tools.valves.pat = "secret-jira-token"
+        await self.tools.jira_get_issue("PROJ-1")
+        self._cache("/issue/PROJ-2", {"id": "10002", "key": "PROJ-2"})
+
+        self.assertIn("/issue/PROJ-1", self._cached_endpoints())
+        for cache_key in self.tools._response_cache:
+            self.assertNotIn("secret-jira-token", repr(cache_key))
+
+    async def test_creating_a_link_invalidates_both_issues(self):
+        self._cache("/issue/PROJ-1", {"id": "10001", "key": "PROJ-1"})
+        self._cache("/issue/PROJ-2?fields=issuelinks", {"id": "10002", "key": "PROJ-2"})
+        self._cache("/issue/PROJ-3", {"id": "10003", "key": "PROJ-3"})
+
+        result = json.loads(await self.tools.jira_create_issue_link("Blocks", "proj-1", "PROJ-2"))
+
+        self.assertNotIn("error", result)
+        self.assertEqual(self._cached_endpoints(), ["/issue/PROJ-3"])
+
+
+if __name__ == "__main__":
+    unittest.main()